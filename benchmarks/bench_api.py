@@ -0,0 +1,180 @@
+"""Measure gh-utils throughput and tail latency against the local mock server.
+
+Usage:
+    python benchmarks/bench_api.py [-n 200] [-c 16] [-b 50] [--latency 0.02]
+        [--error-rate 0.01] [--scenario bulk] [--json results.json]
+
+Each scenario runs against a fresh ``benchmarks/mock_server.py`` process and
+reports operations per second plus p50/p95/p99 request latency, as recorded
+by :mod:`gh_utils.metrics`. No network access is needed; pass ``--json`` to
+keep the numbers for comparison between releases.
+
+Scenarios:
+    single      create_issue then add_to_project, one issue at a time
+    bulk        bulk.create_issues on a thread pool, then batched project adds
+    concurrent  AsyncGitHubClient.create_issue for every issue at once (needs httpx)
+    batched     add_many_to_project with aliased GraphQL mutations
+"""
+
+import argparse
+import asyncio
+import importlib.metadata
+import json
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+from gh_utils import bulk
+from gh_utils.exceptions import GhUtilsError
+from gh_utils.github_client import GitHubClient
+from gh_utils.metrics import Metrics, percentile
+from gh_utils.ratelimit import RateLimiter
+
+sys.path.insert(0, str(Path(__file__).parent))
+import mock_server  # noqa: E402
+
+OWNER, REPO, TOKEN = "bench", "repo", "bench-token"
+SCENARIOS = ("single", "bulk", "concurrent", "batched")
+
+
+def _client(url: str, collected: Metrics, pool_size: int) -> GitHubClient:
+    return GitHubClient(TOKEN, pool_size=pool_size, rate_limiter=RateLimiter(), metrics=collected, api_url=url)
+
+
+def run_single(url: str, options: argparse.Namespace, collected: Metrics) -> int:
+    with _client(url, collected, 1) as client:
+        project_id = client.find_project_id_by_title(OWNER, "Backlog")
+        succeeded = 0
+        for i in range(options.issues):
+            try:
+                issue = client.create_issue(OWNER, REPO, f"Issue {i}", "Body")
+                client.add_to_project(project_id, issue["node_id"])
+            except (GhUtilsError, requests.RequestException):
+                continue
+            succeeded += 1
+    return succeeded
+
+
+def run_bulk(url: str, options: argparse.Namespace, collected: Metrics) -> int:
+    specs = [bulk.IssueSpec(f"Issue {i}", "Body") for i in range(options.issues)]
+    with _client(url, collected, options.concurrency) as client:
+        project_id = client.find_project_id_by_title(OWNER, "Backlog")
+        results = bulk.create_issues(client, OWNER, REPO, specs, concurrency=options.concurrency)
+        bulk.add_to_project(client, OWNER, REPO, project_id, results, batch_size=options.batch_size)
+    return sum(result.ok for result in results)
+
+
+def run_concurrent(url: str, options: argparse.Namespace, collected: Metrics) -> int:
+    from gh_utils.async_client import AsyncGitHubClient
+
+    async def _run() -> int:
+        async with AsyncGitHubClient(
+            TOKEN, concurrency=options.concurrency, rate_limiter=RateLimiter(), metrics=collected, api_url=url
+        ) as client:
+            created = await asyncio.gather(
+                *(client.create_issue(OWNER, REPO, f"Issue {i}", "Body") for i in range(options.issues)),
+                return_exceptions=True,
+            )
+        return sum(not isinstance(issue, Exception) for issue in created)
+
+    return asyncio.run(_run())
+
+
+def run_batched(url: str, options: argparse.Namespace, collected: Metrics) -> int:
+    content_ids = [f"I_bench{i}" for i in range(options.issues)]
+    with _client(url, collected, 1) as client:
+        results = client.add_many_to_project("PVT_mock1", content_ids, batch_size=options.batch_size)
+    return sum(result.ok for result in results)
+
+
+RUNNERS = {"single": run_single, "bulk": run_bulk, "concurrent": run_concurrent, "batched": run_batched}
+
+
+def _start_server(options: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    args = [
+        sys.executable, str(Path(__file__).parent / "mock_server.py"), "--port", "0",
+        "--latency", str(options.latency), "--jitter", str(options.jitter),
+        "--rate-limit", str(options.rate_limit), "--rate-window", str(options.rate_window),
+        "--error-rate", str(options.error_rate),
+    ]
+    if options.seed is not None:
+        args += ["--seed", str(options.seed)]
+    server = subprocess.Popen(args, stdout=subprocess.PIPE, text=True)
+    line = server.stdout.readline()
+    if not line.startswith("Serving on "):
+        server.kill()
+        raise SystemExit("mock server did not start")
+    return server, line.removeprefix("Serving on ").strip()
+
+
+def run_scenario(name: str, options: argparse.Namespace) -> dict:
+    server, url = _start_server(options)
+    collected = Metrics()
+    try:
+        start = time.perf_counter()
+        succeeded = RUNNERS[name](url, options, collected)
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    latencies = [record.seconds for record in collected.records]
+    return {
+        "operations": options.issues,
+        "succeeded": succeeded,
+        "failed": options.issues - succeeded,
+        "seconds": elapsed,
+        "ops_per_second": succeeded / elapsed if elapsed else 0.0,
+        "requests": len(collected.records),
+        "retries": sum(record.attempt > 0 for record in collected.records),
+        "connections_opened": sum(record.connect_seconds is not None for record in collected.records),
+        "latency": {f"p{p}": percentile(latencies, p) for p in (50, 95, 99)} if latencies else {},
+    }
+
+
+def _version() -> str:
+    try:
+        return importlib.metadata.version("gh-utils")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--issues", type=int, default=200)
+    parser.add_argument("-c", "--concurrency", type=int, default=16)
+    parser.add_argument("-b", "--batch-size", type=int, default=50)
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="run only these (repeatable)")
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    mock_server.add_options(parser)
+    options = parser.parse_args()
+
+    results = {}
+    for name in options.scenario or SCENARIOS:
+        if name == "concurrent" and importlib.util.find_spec("httpx") is None:
+            print("concurrent   skipped (httpx not installed)")
+            continue
+        result = results[name] = run_scenario(name, options)
+        latency = result["latency"]
+        print(
+            f"{name:<12} {result['ops_per_second']:8.1f} ops/s   {result['requests']:5} requests   "
+            f"p50 {latency.get('p50', 0) * 1000:7.1f} ms   p95 {latency.get('p95', 0) * 1000:7.1f} ms   "
+            f"p99 {latency.get('p99', 0) * 1000:7.1f} ms   retries {result['retries']}   failed {result['failed']}"
+        )
+
+    if options.json:
+        report = {
+            "version": _version(),
+            "python": platform.python_version(),
+            "options": {key: value for key, value in vars(options).items() if key not in ("json", "scenario")},
+            "results": results,
+        }
+        options.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
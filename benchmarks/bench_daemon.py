@@ -0,0 +1,76 @@
+"""Compare per-call latency of gh-utils with and without the warm daemon.
+
+Usage:
+    python benchmarks/bench_daemon.py [-n 20] [-- gh-utils args...]
+
+Without extra arguments each call runs ``gh-utils --help``, which isolates
+start-up cost. Pass real command arguments (with the usual GITHUB_* variables
+set) to include network round trips.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+LAUNCH = [sys.executable, "-c", "from gh_utils.launcher import main; main()"]
+
+
+def _time_calls(args: list[str], env: dict[str, str], calls: int) -> list[float]:
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        subprocess.run(LAUNCH + args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _wait_for(path: Path, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        if time.monotonic() > deadline:
+            raise SystemExit(f"daemon did not start listening on {path}")
+        time.sleep(0.05)
+
+
+def _report(name: str, timings: list[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{name:<12} mean {statistics.mean(timings) * 1000:7.1f} ms   "
+        f"p50 {statistics.median(timings) * 1000:7.1f} ms   p95 {p95 * 1000:7.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--calls", type=int, default=20)
+    parser.add_argument("args", nargs="*", default=["--help"])
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = Path(tmp) / "bench.sock"
+        env = {**os.environ, "GH_UTILS_DAEMON_SOCKET": str(socket_path)}
+
+        in_process = _time_calls(options.args, {**env, "GH_UTILS_NO_DAEMON": "1"}, options.calls)
+
+        daemon = subprocess.Popen(LAUNCH + ["daemon"], env=env, stderr=subprocess.DEVNULL)
+        try:
+            _wait_for(socket_path)
+            _time_calls(options.args, env, 1)  # warm the daemon's pool and caches
+            forwarded = _time_calls(options.args, env, options.calls)
+        finally:
+            subprocess.run(LAUNCH + ["daemon", "--stop"], env=env, stdout=subprocess.DEVNULL, check=False)
+            daemon.wait(timeout=10)
+
+    print(f"gh-utils {' '.join(options.args)}  ({options.calls} calls each)")
+    _report("in-process", in_process)
+    _report("daemon", forwarded)
+
+
+if __name__ == "__main__":
+    main()
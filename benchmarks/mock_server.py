@@ -0,0 +1,308 @@
+"""Local stand-in for the GitHub REST and GraphQL endpoints gh-utils uses.
+
+Usage:
+    python benchmarks/mock_server.py [--port 8765] [--latency 0.02] [--jitter 0.01]
+        [--rate-limit 5000] [--rate-window 3600] [--error-rate 0.01]
+
+Then point gh-utils at it:
+    GITHUB_API_URL=http://127.0.0.1:8765 GITHUB_TOKEN=x gh-utils create-issue ...
+
+Serves ``/repos/{owner}/{repo}/issues`` (POST and paginated GET with ETags)
+and the GraphQL operations sent by ``gh_utils.github_client``, keeping issues
+and project items in memory. Every response carries ``X-RateLimit-*``
+headers; once a token's budget is spent requests fail with 403 until the
+window resets, and ``--error-rate`` of requests fail with a 502.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+ISSUES_PATH = re.compile(r"^/repos/([^/]+)/([^/]+)/issues$")
+OPERATION = re.compile(r"^\s*(?:query|mutation)\s+(\w+)")
+ALIASED_ADD = re.compile(r"(a\d+): addProjectV2ItemById\(input: \{projectId: \$projectId, contentId: \$(c\d+)\}\)")
+ALIASED_UPDATE = re.compile(r"(u\d+): updateProjectV2ItemFieldValue\(input: \{projectId: \$projectId, itemId: \$(i\d+)")
+STATUS_OPTIONS = ("Todo", "In Progress", "Done")
+
+
+@dataclass
+class ServerOptions:
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_limit: int = 5000
+    rate_window: float = 3600.0
+    error_rate: float = 0.0
+    projects: list[str] = field(default_factory=lambda: ["Backlog"])
+    labels: list[str] = field(default_factory=lambda: ["bug", "enhancement"])
+    seed: int | None = None
+
+
+class MockGitHub:
+    """In-memory issues, projects and rate-limit budgets shared by all handler threads."""
+
+    def __init__(self, options: ServerOptions):
+        self.options = options
+        self.random = random.Random(options.seed)
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.issues: dict[tuple[str, str], list[dict]] = {}
+        self.items: dict[str, str] = {}  # content ID -> item ID
+        self.budgets: dict[tuple[str, str], list[float]] = {}  # (token, resource) -> [used, reset_at]
+
+    def node_id(self, prefix: str) -> str:
+        return f"{prefix}_mock{next(self.ids)}"
+
+    def charge(self, token: str, resource: str) -> tuple[bool, dict[str, str]]:
+        """Spend one request of the token's budget; returns whether it was allowed and the headers."""
+        with self.lock:
+            now = time.time()
+            budget = self.budgets.setdefault((token, resource), [0, now + self.options.rate_window])
+            if now >= budget[1]:
+                budget[:] = [0, now + self.options.rate_window]
+            allowed = budget[0] < self.options.rate_limit
+            budget[0] += allowed
+            used, reset_at = budget
+        return allowed, {
+            "X-RateLimit-Limit": str(self.options.rate_limit),
+            "X-RateLimit-Remaining": str(self.options.rate_limit - int(used)),
+            "X-RateLimit-Used": str(int(used)),
+            "X-RateLimit-Reset": str(int(reset_at)),
+            "X-RateLimit-Resource": resource,
+        }
+
+    def create_issue(self, owner: str, repo: str, title: str, body: str | None, labels: list[str]) -> dict:
+        with self.lock:
+            issues = self.issues.setdefault((owner, repo), [])
+            number = len(issues) + 1
+            issue = {
+                "number": number,
+                "node_id": self.node_id("I"),
+                "html_url": f"https://github.com/{owner}/{repo}/issues/{number}",
+                "title": title,
+                "body": body,
+                "labels": [{"name": name} for name in labels],
+                "updated_at": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }
+            issues.append(issue)
+        return issue
+
+    def add_item(self, content_id: str) -> str:
+        with self.lock:
+            if content_id not in self.items:
+                self.items[content_id] = self.node_id("PVTI")
+            return self.items[content_id]
+
+    def projects(self, query: str | None) -> list[dict]:
+        return [
+            {"id": f"PVT_mock{i}", "title": title}
+            for i, title in enumerate(self.options.projects, start=1)
+            if not query or query.lower() in title.lower()
+        ]
+
+    def graphql(self, query: str, variables: dict) -> dict:
+        match = OPERATION.match(query)
+        operation = match.group(1) if match else None
+        if operation in ("OrganizationProjects", "UserProjects"):
+            owner_type = "organization" if operation == "OrganizationProjects" else "user"
+            nodes = self.projects(variables.get("query"))
+            page = {"nodes": nodes, "pageInfo": {"hasNextPage": False, "endCursor": None}}
+            return {"data": {owner_type: {"projectsV2": page}}}
+        if operation == "AddToProject":
+            item_id = self.add_item(variables["contentId"])
+            return {"data": {"addProjectV2ItemById": {"item": {"id": item_id}}}}
+        if operation == "AddManyToProject":
+            return {
+                "data": {
+                    alias: {"item": {"id": self.add_item(variables[variable])}}
+                    for alias, variable in ALIASED_ADD.findall(query)
+                }
+            }
+        if operation == "ProjectFields":
+            status = {
+                "id": "PVTSSF_status",
+                "name": "Status",
+                "dataType": "SINGLE_SELECT",
+                "options": [{"id": f"O_{i}", "name": name} for i, name in enumerate(STATUS_OPTIONS)],
+            }
+            page = {"nodes": [status], "pageInfo": {"hasNextPage": False, "endCursor": None}}
+            return {"data": {"node": {"fields": page}}}
+        if operation == "SetItemFields":
+            return {
+                "data": {
+                    alias: {"projectV2Item": {"id": variables[variable]}}
+                    for alias, variable in ALIASED_UPDATE.findall(query)
+                }
+            }
+        if operation == "Repository":
+            labels = [{"id": f"LA_{name}", "name": name} for name in self.options.labels]
+            page = {"nodes": labels, "pageInfo": {"hasNextPage": False, "endCursor": None}}
+            repository = {"id": f"R_{variables['owner']}_{variables['name']}", "labels": page}
+            return {"data": {"repository": repository}}
+        if operation == "CreateIssueInProject":
+            owner, repo = variables["repositoryId"].removeprefix("R_").split("_", 1)
+            labels = [label_id.removeprefix("LA_") for label_id in variables.get("labelIds") or []]
+            issue = self.create_issue(owner, repo, variables["title"], variables.get("body"), labels)
+            items = [
+                {"id": self.add_item(issue["node_id"]), "project": {"id": project_id}}
+                for project_id in variables.get("projectIds") or []
+            ]
+            node = {"id": issue["node_id"], "number": issue["number"], "url": issue["html_url"]}
+            return {"data": {"createIssue": {"issue": {**node, "projectItems": {"nodes": items}}}}}
+        return {"errors": [{"message": f"Unsupported operation: {operation}"}]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body are separate writes
+    server: "MockServer"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, payload=None, headers: dict[str, str] | None = None) -> None:
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _admit(self, resource: str) -> dict[str, str] | None:
+        """Apply latency, error injection and the rate limit; ``None`` means a response was sent."""
+        github = self.server.github
+        options = github.options
+        if options.latency or options.jitter:
+            time.sleep(options.latency + github.random.uniform(0, options.jitter))
+        if github.random.random() < options.error_rate:
+            self._send(502, {"message": "Server Error"})
+            return None
+        allowed, headers = github.charge(self.headers.get("Authorization", ""), resource)
+        if not allowed:
+            self._send(403, {"message": "API rate limit exceeded"}, headers)
+            return None
+        return headers
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        match = ISSUES_PATH.match(url.path)
+        if not match:
+            self._send(404, {"message": "Not Found"})
+            return
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        per_page = int(query.get("per_page", 30))
+        page = int(query.get("page", 1))
+        issues = [
+            issue
+            for issue in self.server.github.issues.get(match.groups(), [])
+            if issue["updated_at"] >= query.get("since", "")
+        ]
+        payload = issues[(page - 1) * per_page:page * per_page]
+        etag = '"' + hashlib.sha256(json.dumps(payload).encode()).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, headers={"ETag": etag})  # like GitHub, 304s are free
+            return
+        headers = self._admit("core")
+        if headers is None:
+            return
+        headers["ETag"] = etag
+        if page * per_page < len(issues):
+            next_query = "&".join(f"{name}={value}" for name, value in {**query, "page": page + 1}.items())
+            headers["Link"] = f'<http://{self.headers["Host"]}{url.path}?{next_query}>; rel="next"'
+        self._send(200, payload, headers)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        request = self._read_json()  # always drain the body so the connection stays usable
+        if url.path == "/graphql":
+            headers = self._admit("graphql")
+            if headers is None:
+                return
+            self._send(200, self.server.github.graphql(request["query"], request.get("variables") or {}), headers)
+            return
+        match = ISSUES_PATH.match(url.path)
+        if not match:
+            self._send(404, {"message": "Not Found"})
+            return
+        headers = self._admit("core")
+        if headers is None:
+            return
+        owner, repo = match.groups()
+        issue = self.server.github.create_issue(owner, repo, request["title"], request.get("body"),
+                                                request.get("labels") or [])
+        self._send(201, issue, headers)
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024  # room for every connection of a concurrent benchmark
+
+    def __init__(self, options: ServerOptions, host: str = "127.0.0.1", port: int = 0):
+        self.github = MockGitHub(options)
+        super().__init__((host, port), _Handler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start(options: ServerOptions | None = None, port: int = 0) -> MockServer:
+    """Serve on a background thread; call ``shutdown()`` and ``server_close()`` when done."""
+    server = MockServer(options or ServerOptions(), port=port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument("--rate-limit", type=int, default=5000, help="requests per token and window")
+    parser.add_argument("--rate-window", type=float, default=3600.0, help="rate-limit window in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 502")
+    parser.add_argument("--seed", type=int, help="seed for jitter and error injection")
+
+
+def options_from_args(args: argparse.Namespace) -> ServerOptions:
+    return ServerOptions(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    add_options(parser)
+    args = parser.parse_args()
+
+    server = MockServer(options_from_args(args), port=args.port)
+    print(f"Serving on {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
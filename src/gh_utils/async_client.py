@@ -0,0 +1,198 @@
+import asyncio
+import time
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from gh_utils import metrics as metrics_module
+from gh_utils.exceptions import GhUtilsError, GitHubAPIError
+from gh_utils.github_client import (
+    ADD_TO_PROJECT_MUTATION,
+    GITHUB_API_URL,
+    PROJECT_OWNER_QUERIES,
+    _auth_headers,
+    _endpoint,
+    _projects_page,
+    _raise_for_graphql_errors,
+    _with_token,
+)
+from gh_utils.metrics import Metrics, RequestRecord
+from gh_utils.ratelimit import RateLimiter, TokenPool, resource_for_url, shared_rate_limiter
+
+DEFAULT_CONCURRENCY = 100
+
+
+def _handle_response(response: "httpx.Response") -> dict:
+    if not response.is_success:
+        raise GitHubAPIError(
+            f"GitHub API error: {response.status_code} {response.reason_phrase}",
+            status_code=response.status_code,
+            response_body=response.text,
+        )
+    return response.json()
+
+
+class AsyncGitHubClient:
+    """asyncio counterpart of :class:`gh_utils.github_client.GitHubClient`.
+
+    Requests share one ``httpx.AsyncClient`` connection pool. At most
+    ``concurrency`` requests are in flight at once; pass ``semaphore`` instead
+    to share one limit between several clients. Pacing and retries follow the
+    same :class:`~gh_utils.ratelimit.RateLimiter` as the threaded client, and
+    so does timing into ``metrics`` (httpx does not report connect times),
+    and a ``token_pool`` is used the same way.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        semaphore: asyncio.Semaphore | None = None,
+        timeout: float | None = None,
+        transport: "httpx.AsyncBaseTransport | None" = None,
+        rate_limiter: RateLimiter | None = None,
+        metrics: Metrics | None = None,
+        api_url: str = GITHUB_API_URL,
+        graphql_url: str | None = None,
+        token_pool: TokenPool | None = None,
+    ):
+        if httpx is None:
+            raise GhUtilsError("The async client requires httpx: pip install 'gh-utils[async]'")
+        self.token = token
+        self.token_pool = token_pool
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.metrics = metrics
+        self.api_url = api_url.rstrip("/")
+        self.graphql_url = graphql_url or f"{self.api_url}/graphql"
+        self._semaphore = semaphore or asyncio.Semaphore(concurrency)
+        self._http = httpx.AsyncClient(
+            headers=_auth_headers(token),
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _request(self, method: str, url: str, idempotent: bool = True, **kwargs) -> "httpx.Response":
+        resource = resource_for_url(url)
+        metrics = self.metrics or metrics_module.active()
+        attempt = 0
+        while True:
+            token, send_kwargs = _with_token(self.token, self.token_pool, resource, kwargs)
+            await asyncio.sleep(self.rate_limiter.delay_before(token, resource))
+            try:
+                async with self._semaphore:
+                    start = time.perf_counter()
+                    response = await self._http.request(method, url, **send_kwargs)
+            except httpx.TransportError as e:
+                if metrics:
+                    seconds = time.perf_counter() - start
+                    metrics.record(RequestRecord(_endpoint(method, url, kwargs), None, seconds, attempt=attempt))
+                if not (idempotent or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))):
+                    raise
+                delay = self.rate_limiter.retry_delay(token, attempt, None)
+                if delay is None:
+                    raise
+            else:
+                if metrics:
+                    self._observe(metrics, method, url, kwargs, response, time.perf_counter() - start, attempt)
+                self.rate_limiter.record(token, resource, response.headers)
+                if response.is_success:
+                    return response
+                if response.status_code == 401 and self.token_pool and self.token_pool.revoke(token):
+                    attempt += 1
+                    continue
+                if not idempotent and response.status_code not in (403, 429):
+                    return response
+                delay = self.rate_limiter.retry_delay(
+                    token, attempt, response.status_code, response.headers, response.text
+                )
+                if delay is None:
+                    return response
+                if self.token_pool and response.status_code in (403, 429):
+                    delay = min(delay, self.token_pool.delay(resource))
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _observe(
+        metrics: Metrics,
+        method: str,
+        url: str,
+        kwargs: dict,
+        response: "httpx.Response",
+        seconds: float,
+        attempt: int,
+    ) -> None:
+        resource, remaining = metrics_module.rate_limit_fields(response.headers)
+        metrics.record(
+            RequestRecord(
+                _endpoint(method, url, kwargs),
+                status=response.status_code,
+                seconds=seconds,
+                headers_seconds=response.elapsed.total_seconds(),
+                attempt=attempt,
+                bytes_sent=len(response.request.content),
+                bytes_received=len(response.content),
+                rate_limit_resource=resource,
+                rate_limit_remaining=remaining,
+            )
+        )
+
+    async def _post(self, url: str, payload: dict, idempotent: bool = True) -> dict:
+        return _handle_response(await self._request("POST", url, idempotent=idempotent, json=payload))
+
+    async def graphql(self, query: str, variables: dict | None = None) -> dict:
+        data = await self._post(self.graphql_url, {"query": query, "variables": variables or {}})
+        _raise_for_graphql_errors(data)
+        return data
+
+    async def create_issue(
+        self,
+        owner: str,
+        repo: str,
+        title: str,
+        body: str,
+        labels: list[str] | None = None,
+    ) -> dict:
+        url = f"{self.api_url}/repos/{owner}/{repo}/issues"
+        payload: dict = {"title": title, "body": body}
+        if labels:
+            payload["labels"] = labels
+        return await self._post(url, payload, idempotent=False)
+
+    async def find_project_id_by_title(self, owner: str, title: str) -> str:
+        for owner_type, graphql_query in PROJECT_OWNER_QUERIES:
+            cursor = None
+            while True:
+                data = await self._post(
+                    self.graphql_url,
+                    {"query": graphql_query, "variables": {"owner": owner, "cursor": cursor, "query": title}},
+                )
+                page = _projects_page(data, owner_type)
+                if page is None:
+                    break
+                for node in page["nodes"]:
+                    if node["title"] == title:
+                        return node["id"]
+
+                if not page["pageInfo"]["hasNextPage"]:
+                    raise GitHubAPIError(f"Project with title '{title}' not found for owner '{owner}'")
+                cursor = page["pageInfo"]["endCursor"]
+        raise GitHubAPIError(f"No organization or user named '{owner}'")
+
+    async def add_to_project(self, project_id: str, issue_node_id: str) -> dict:
+        return await self.graphql(
+            ADD_TO_PROJECT_MUTATION,
+            {"projectId": project_id, "contentId": issue_node_id},
+        )
@@ -0,0 +1,315 @@
+import glob
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TypeVar
+
+import requests
+
+from gh_utils.exceptions import ConfigError, GhUtilsError, GitHubAPIError
+from gh_utils.github_client import DEFAULT_BATCH_SIZE, GitHubClient
+from gh_utils.issue_index import IssueIndex
+from gh_utils.journal import Journal, content_hash
+
+DEFAULT_CONCURRENCY = 8
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class IssueSpec:
+    title: str
+    body: str
+    labels: list[str] = field(default_factory=list)
+    source: str = ""
+
+    def key(self, owner: str, repo: str) -> str:
+        """Content hash identifying this issue in a journal."""
+        return content_hash(owner, repo, self.title, self.body, *sorted(self.labels))
+
+
+@dataclass
+class IssueResult:
+    spec: IssueSpec
+    issue: dict | None = None
+    error: Exception | None = None
+    item_id: str | None = None
+    resumed: bool = False
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def spec_from_markdown(path: str | Path, labels: list[str] | None = None) -> IssueSpec:
+    """Build a spec from a markdown file.
+
+    A leading ``# Heading`` line becomes the title and is dropped from the body;
+    otherwise the file name (without extension) is used as the title.
+    """
+    path = Path(path)
+    text = path.read_text()
+    lines = text.splitlines(keepends=True)
+    if lines and lines[0].startswith("# "):
+        title = lines[0][2:].strip()
+        body = "".join(lines[1:]).lstrip("\n")
+    else:
+        title = path.stem
+        body = text
+    return IssueSpec(title=title, body=body, labels=list(labels or []), source=str(path))
+
+
+def spec_from_record(record: dict) -> IssueSpec:
+    """Build a spec from a JSON object with ``title``, ``body`` or ``body_file``, and ``labels``."""
+    if not isinstance(record, dict) or not record.get("title"):
+        raise ConfigError("Issue spec needs a 'title'")
+    for key in ("title", "body", "body_file"):
+        if key in record and not isinstance(record[key], str):
+            raise ConfigError(f"Issue spec '{key}' must be a string")
+    if "body_file" in record:
+        body = Path(record["body_file"]).read_text()
+    else:
+        body = record.get("body", "")
+    labels = record.get("labels") or []
+    if isinstance(labels, str):
+        labels = [labels]
+    if not isinstance(labels, list) or not all(isinstance(name, str) for name in labels):
+        raise ConfigError("Issue spec 'labels' must be a list of strings")
+    return IssueSpec(title=record["title"], body=body, labels=labels, source=record.get("id", ""))
+
+
+def _read_manifest(path: Path) -> list[Path]:
+    paths = []
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            paths.append(path.parent / line)
+    return paths
+
+
+def collect_markdown_files(source: str) -> list[Path]:
+    """Expand a directory, glob pattern or manifest file into markdown file paths.
+
+    Directories yield their ``*.md`` files in name order, globs their matches in
+    name order, and a manifest (any other file) lists one path per line relative
+    to the manifest, blank lines and ``#`` comments ignored.
+    """
+    path = Path(source)
+    if path.is_dir():
+        return sorted(path.glob("*.md"))
+    if glob.has_magic(source):
+        return [Path(p) for p in sorted(glob.glob(source, recursive=True)) if os.path.isfile(p)]
+    if not path.is_file():
+        raise ConfigError(f"No such file, directory or pattern: {source}")
+    if path.suffix == ".md":
+        return [path]
+    return _read_manifest(path)
+
+
+def load_specs(sources: list[str], labels: list[str] | None = None) -> list[IssueSpec]:
+    return [
+        spec_from_markdown(path, labels)
+        for source in sources
+        for path in collect_markdown_files(source)
+    ]
+
+
+def imap_unordered(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_in_flight: int | None = None,
+) -> Iterator[R]:
+    """Apply ``fn`` to ``items`` on a thread pool, yielding results as they complete.
+
+    ``items`` is consumed lazily and at most ``max_in_flight`` (default: twice
+    ``concurrency``) calls are queued or running at once, so memory stays flat
+    however long the input is. ``fn`` should report failures in its return
+    value; an exception it raises propagates out of the iterator.
+    """
+    max_in_flight = max(concurrency, max_in_flight or 2 * concurrency)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = set()
+        for item in items:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(fn, item))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def create_one(
+    client: GitHubClient,
+    owner: str,
+    repo: str,
+    spec: IssueSpec,
+    project_id: str | None = None,
+) -> IssueResult:
+    """Create one issue and optionally add it to a project, capturing any error in the result."""
+    try:
+        issue = client.create_issue(owner, repo, spec.title, spec.body, spec.labels or None)
+    except (GhUtilsError, requests.RequestException) as e:
+        return IssueResult(spec, error=e)
+    result = IssueResult(spec, issue=issue)
+    if project_id:
+        try:
+            data = client.add_to_project(project_id, issue["node_id"])
+        except (GhUtilsError, requests.RequestException) as e:
+            result.error = e
+        else:
+            result.item_id = data["data"]["addProjectV2ItemById"]["item"]["id"]
+    return result
+
+
+def create_issues(
+    client: GitHubClient,
+    owner: str,
+    repo: str,
+    specs: list[IssueSpec],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    journal: Journal | None = None,
+    index: IssueIndex | None = None,
+) -> list[IssueResult]:
+    """Create all ``specs`` on a bounded thread pool; results keep input order.
+
+    A failing issue is reported in its result instead of aborting the others.
+    With a ``journal``, issues it already records as created are not filed
+    again (their result is marked ``resumed``) and new ones are recorded as
+    soon as GitHub returns them. With an ``index``, specs matching an existing
+    issue are not filed either (marked ``skipped``).
+    """
+
+    def _create(spec: IssueSpec) -> IssueResult:
+        key = spec.key(owner, repo)
+        if journal is not None and journal.done(key, "created"):
+            entry = journal.get(key)
+            issue = {"number": entry["number"], "html_url": entry["html_url"], "node_id": entry["node_id"]}
+            return IssueResult(spec, issue=issue, resumed=True)
+        if index is not None:
+            existing = index.find(spec.title)
+            if existing is not None:
+                return IssueResult(spec, issue=existing, skipped=True)
+        result = create_one(client, owner, repo, spec)
+        if not result.ok:
+            return result
+        issue = result.issue
+        if index is not None:
+            index.add(issue, spec.title)
+        if journal is not None:
+            journal.record(
+                key, "created", number=issue["number"], html_url=issue["html_url"], node_id=issue["node_id"]
+            )
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        return list(executor.map(_create, specs))
+
+
+def add_to_project(
+    client: GitHubClient,
+    owner: str,
+    repo: str,
+    project_id: str,
+    results: list[IssueResult],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    journal: Journal | None = None,
+    fields: list[tuple[str, dict]] | None = None,
+) -> None:
+    """Add the created issues in ``results`` to a project with batched mutations.
+
+    Sets ``item_id`` on each result, or ``error`` if its add failed. Issues the
+    ``journal`` already records as added to this project are skipped, and so
+    are pre-existing issues that were not created by this run. ``fields`` are
+    set on each new item as in :meth:`GitHubClient.add_many_to_project`; an
+    item whose fields failed is not journaled, so a resume sets them again.
+    """
+    pending = []
+    for result in results:
+        if not result.ok or result.skipped:
+            continue
+        key = result.spec.key(owner, repo)
+        entry = journal.get(key) if journal is not None else {}
+        if entry.get("project_id") == project_id and entry.get("item_id"):
+            result.item_id = entry["item_id"]
+        else:
+            pending.append(result)
+    _add_items(client, project_id, pending, batch_size, fields)
+    if journal is not None:
+        for result in pending:
+            if result.ok:
+                journal.record(result.spec.key(owner, repo), "added", project_id=project_id, item_id=result.item_id)
+
+
+def _add_items(
+    client: GitHubClient,
+    project_id: str,
+    results: list[IssueResult],
+    batch_size: int,
+    fields: list[tuple[str, dict]] | None,
+) -> None:
+    if not results:
+        return
+    items = client.add_many_to_project(
+        project_id, [result.issue["node_id"] for result in results], batch_size=batch_size, fields=fields
+    )
+    for result, item in zip(results, items):
+        result.item_id = item.item_id
+        if not item.ok:
+            # With an item ID the add worked and only setting its fields failed.
+            result.error = GitHubAPIError(item.error if item.item_id else f"Adding to project failed: {item.error}")
+
+
+def parse_repos(names: Iterable[str], default_owner: str | None = None) -> list[tuple[str, str]]:
+    """Turn ``owner/name`` strings into ``(owner, name)`` pairs, once each, in first-seen order.
+
+    A bare ``name`` uses ``default_owner``. Blank entries and ``#`` comments
+    are ignored, so the lines of a repo list file can be passed as they are.
+    """
+    repos: dict[tuple[str, str], None] = {}
+    for name in names:
+        name = name.strip()
+        if not name or name.startswith("#"):
+            continue
+        owner, sep, repo = name.rpartition("/")
+        if not sep:
+            owner = default_owner
+        if not owner or not repo or "/" in owner:
+            raise ConfigError(f"Repository must be given as owner/name, got '{name}'")
+        repos[(owner, repo)] = None
+    return list(repos)
+
+
+def fan_out(
+    client: GitHubClient,
+    repos: list[tuple[str, str]],
+    spec: IssueSpec,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    project_id: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    fields: list[tuple[str, dict]] | None = None,
+) -> list[IssueResult]:
+    """Create the issue ``spec`` in every repository of ``repos``; results keep input order.
+
+    The issues are created in parallel on ``client``'s connection pool, and
+    each result's ``spec.source`` is its ``owner/name``. With a ``project_id``
+    the created issues are then added with batched mutations, not one request
+    per repository, and ``fields`` are set as in :func:`add_to_project`.
+    """
+
+    def _create(target: tuple[str, str]) -> IssueResult:
+        owner, repo = target
+        return create_one(client, owner, repo, replace(spec, labels=list(spec.labels), source=f"{owner}/{repo}"))
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        results = list(executor.map(_create, repos))
+    if project_id:
+        _add_items(client, project_id, [result for result in results if result.ok], batch_size, fields)
+    return results
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from gh_utils import config
+
+CACHE_FILE_NAME = "node-ids.json"
+
+# Shared by every instance: commands create caches freely, often from worker threads.
+_lock = threading.Lock()
+
+
+class NodeIdCache:
+    """Small on-disk cache of resolved GitHub node IDs, grouped by kind.
+
+    Entries live in one JSON file under the user cache dir and expire after
+    ``ttl`` seconds. Writes go through a temp file and ``os.replace`` so a
+    crashed run never leaves a truncated cache behind. Every write reloads the
+    file and merges into it under a process-wide lock, so instances sharing a
+    file do not drop each other's entries.
+    """
+
+    def __init__(self, path: Path | None = None, ttl: float | None = None):
+        self.path = path or config.get_cache_dir() / CACHE_FILE_NAME
+        self.ttl = config.get_cache_ttl() if ttl is None else ttl
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save(self, data: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(json.dumps(data))
+        try:
+            os.replace(tmp.name, self.path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+
+    def get(self, kind: str, key: str) -> Any | None:
+        with _lock:
+            entry = self._load().get(kind, {}).get(key)
+        if entry is None or time.time() - entry["fetched_at"] > self.ttl:
+            return None
+        return entry["value"]
+
+    def put_many(self, kind: str, entries: dict[str, Any]) -> None:
+        now = time.time()
+        with _lock:
+            data = self._load()
+            section = data.setdefault(kind, {})
+            for key, value in entries.items():
+                section[key] = {"value": value, "fetched_at": now}
+            self._save(data)
+
+    def put(self, kind: str, key: str, value: Any) -> None:
+        self.put_many(kind, {key: value})
+
+    def clear(self, kind: str | None = None) -> None:
+        with _lock:
+            data = self._load()
+            if kind is None:
+                data = {}
+            else:
+                data.pop(kind, None)
+            self._save(data)
+
+
+def project_key(owner: str, title: str) -> str:
+    return f"{owner}/{title}"
+
+
+def repo_key(owner: str, repo: str) -> str:
+    return f"{owner}/{repo}"
+
+
+def label_key(owner: str, repo: str, name: str) -> str:
+    return f"{owner}/{repo}/{name}"
@@ -1,26 +1,199 @@
+import contextlib
+import functools
+import json
+import os
 import sys
 
 import click
 
-from gh_utils import config, github_client
-from gh_utils.exceptions import GhUtilsError
+from gh_utils import bulk, cache, config, edits, export, github_client, metrics, templates, watch
+from gh_utils.exceptions import ConfigError, GhUtilsError, GitHubAPIError
+from gh_utils.http_cache import shared_http_cache
+from gh_utils.issue_index import IssueIndex
+from gh_utils.journal import Journal, content_hash
+from gh_utils.labels import LabelSet
+from gh_utils.mirror import ProjectMirror
+from gh_utils.project_fields import ProjectFields, parse_assignments
+from gh_utils.ratelimit import TokenPool
+from gh_utils.transport import transport_from_env
 
 
 @click.group()
-def cli():
+@click.option("--trace", is_flag=True, help="Print per-endpoint request timings to stderr when done.")
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write request metrics to this file when done.",
+)
+@click.option(
+    "--metrics-format",
+    type=click.Choice(["prometheus", "json"]),
+    default="prometheus",
+    show_default=True,
+    help="Format of --metrics-file.",
+)
+@click.pass_context
+def cli(ctx: click.Context, trace: bool, metrics_file: str | None, metrics_format: str):
     """GitHub utilities CLI."""
+    if trace or metrics_file:
+        collected = metrics.enable()
+        ctx.call_on_close(functools.partial(_report_metrics, collected, trace, metrics_file, metrics_format))
+
+
+def _report_metrics(collected: metrics.Metrics, trace: bool, metrics_file: str | None, metrics_format: str) -> None:
+    metrics.disable()
+    if trace:
+        click.echo(collected.format_summary(), err=True)
+    if metrics_file:
+        text = collected.to_json() if metrics_format == "json" else collected.to_prometheus()
+        with open(metrics_file, "w") as f:
+            f.write(text)
+
+
+def _lookup_project_id(token: str, owner: str, title: str, refresh_cache: bool = False) -> str:
+    node_cache = cache.NodeIdCache()
+    key = cache.project_key(owner, title)
+    if not refresh_cache:
+        cached = node_cache.get("projects", key)
+        if cached:
+            return cached
+
+    project_id = github_client.find_project_id_by_title(token, owner, title)
+    node_cache.put("projects", key, project_id)
+    return project_id
+
 
+def _lookup_repository(
+    token: str, owner: str, repo: str, labels: list[str], refresh_cache: bool = False
+) -> tuple[str, list[str]]:
+    """Return the repository node ID and the node IDs of ``labels``, cached on disk."""
+    node_cache = cache.NodeIdCache()
+    if not refresh_cache:
+        repository_id = node_cache.get("repositories", cache.repo_key(owner, repo))
+        label_ids = [node_cache.get("labels", cache.label_key(owner, repo, name)) for name in labels]
+        if repository_id and all(label_ids):
+            return repository_id, label_ids
 
-def _resolve_project_id(token: str, owner: str, project_id: str | None, project_title: str | None) -> str:
+    repository = github_client.get_repository(token, owner, repo)
+    node_cache.put("repositories", cache.repo_key(owner, repo), repository["id"])
+    node_cache.put_many(
+        "labels",
+        {cache.label_key(owner, repo, name): label_id for name, label_id in repository["labels"].items()},
+    )
+    missing = [name for name in labels if name not in repository["labels"]]
+    if missing:
+        raise GitHubAPIError(f"Labels not found in {owner}/{repo}: {', '.join(missing)}")
+    return repository["id"], [repository["labels"][name] for name in labels]
+
+
+def _resolve_project_id(
+    token: str,
+    owner: str,
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool = False,
+) -> str:
     if project_id and project_title:
         raise click.UsageError("Provide --project-id or --project-title, not both.")
     if project_id:
         return project_id
     if project_title:
-        return github_client.find_project_id_by_title(token, owner, project_title)
+        return _lookup_project_id(token, owner, project_title, refresh_cache)
     return config.get_project_id()
 
 
+def _new_client(token: str, pool_size: int) -> github_client.GitHubClient:
+    """A dedicated client sized for a bulk command, against the configured API URLs.
+
+    With several tokens configured (``GITHUB_TOKENS``) the client spreads its
+    requests over all of them. ``GH_UTILS_RECORD`` / ``GH_UTILS_REPLAY``
+    record its traffic to, or replay it from, a cassette; the HTTP cache is
+    then off.
+    """
+    tokens = config.get_github_tokens()
+    transport = transport_from_env(pool_size)
+    return github_client.GitHubClient(
+        token,
+        pool_size=pool_size,
+        # A recorded or replayed run must send the same requests whatever is cached locally.
+        http_cache=None if transport else shared_http_cache(),
+        api_url=config.get_api_url(),
+        graphql_url=config.get_graphql_url(),
+        token_pool=TokenPool(tokens) if len(tokens) > 1 else None,
+        transport=transport,
+    )
+
+
+def _resolve_fields(
+    client: github_client.GitHubClient, project_id: str, field_args: tuple[str, ...], refresh_cache: bool = False
+) -> list[tuple[str, dict]]:
+    """Resolve ``name=value`` options to field IDs and values, using the cached project fields."""
+    assignments = parse_assignments(field_args)
+    if not assignments:
+        return []
+    try:
+        return ProjectFields.load(client, project_id, refresh=refresh_cache).resolve(assignments)
+    except ConfigError:
+        if refresh_cache:
+            raise
+        # The cache may predate a field or option added since; look again once.
+        return ProjectFields.load(client, project_id, refresh=True).resolve(assignments)
+
+
+def _set_fields(token: str, project_id: str, item_id: str, fields: list[tuple[str, dict]]) -> None:
+    if not fields:
+        return
+    errors = github_client.set_item_fields(token, project_id, [item_id], fields)
+    if errors:
+        raise GitHubAPIError(f"Setting fields failed: {errors[item_id]}")
+    click.echo(f"Set {len(fields)} project field(s).")
+
+
+def _load_issue_index(client: github_client.GitHubClient, owner: str, repo: str) -> IssueIndex:
+    index = IssueIndex.for_repo(owner, repo)
+    index.refresh(client, owner, repo)
+    return index
+
+
+def _remember_issue(index: IssueIndex | None, issue: dict, title: str) -> None:
+    if index is not None:
+        index.add(issue, title)
+        index.save()
+
+
+refresh_cache_option = click.option(
+    "--refresh-cache",
+    is_flag=True,
+    help="Ignore the cached project-title lookup and resolve it again.",
+)
+
+create_labels_option = click.option(
+    "--create-labels",
+    is_flag=True,
+    help="Create labels missing from the repo before filing issues (the repo's label set is cached).",
+)
+
+field_option = click.option(
+    "--field",
+    "fields",
+    multiple=True,
+    metavar="NAME=VALUE",
+    help="Set a project field on the item, e.g. --field Status=Todo (repeatable).",
+)
+
+skip_on_board_option = click.option(
+    "--skip-on-board",
+    is_flag=True,
+    help="Do not add issues the local project mirror (see sync) already has on the project.",
+)
+
+skip_existing_option = click.option(
+    "--skip-existing",
+    is_flag=True,
+    help="Do not create issues whose title (or body) matches an existing issue in the repo.",
+)
+
+
 @cli.command()
 @click.option("--title", "-t", required=True, help="Issue title.")
 @click.option(
@@ -31,13 +204,22 @@ def _resolve_project_id(token: str, owner: str, project_id: str | None, project_
     help="Path to markdown file with issue body.",
 )
 @click.option("--label", "-l", multiple=True, help="Label to add (repeatable).")
-def create_issue(title: str, body_file: str, label: tuple[str, ...]):
+@skip_existing_option
+def create_issue(title: str, body_file: str, label: tuple[str, ...], skip_existing: bool):
     """Create a GitHub issue from a markdown file."""
     token = config.get_github_token()
     owner = config.get_repo_owner()
     repo = config.get_repo_name()
     body = click.open_file(body_file).read()
 
+    index = None
+    if skip_existing:
+        index = _load_issue_index(github_client.get_client(token), owner, repo)
+        existing = index.find(title)
+        if existing:
+            click.echo(f"Skipped: issue #{existing['number']} already exists: {existing['html_url']}")
+            return
+
     result = github_client.create_issue(
         token=token,
         owner=owner,
@@ -49,6 +231,7 @@ def create_issue(title: str, body_file: str, label: tuple[str, ...]):
 
     click.echo(f"Created issue #{result['number']}: {result['html_url']}")
     click.echo(f"Node ID: {result['node_id']}")
+    _remember_issue(index, result, title)
 
 
 @cli.command()
@@ -65,11 +248,29 @@ def create_issue(title: str, body_file: str, label: tuple[str, ...]):
     default=None,
     help="Project V2 title (looked up via GraphQL).",
 )
-def add_to_project(issue_node_id: str, project_id: str | None, project_title: str | None):
+@refresh_cache_option
+@field_option
+@skip_on_board_option
+def add_to_project(
+    issue_node_id: str,
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool,
+    fields: tuple[str, ...],
+    skip_on_board: bool,
+):
     """Add an existing issue to a GitHub Project V2."""
     token = config.get_github_token()
     owner = config.get_repo_owner()
-    project_id = _resolve_project_id(token, owner, project_id, project_title)
+    project_id = _resolve_project_id(token, owner, project_id, project_title, refresh_cache)
+    field_values = _resolve_fields(github_client.get_client(token), project_id, fields, refresh_cache)
+
+    if skip_on_board:
+        with ProjectMirror() as mirror:
+            item_id = mirror.item_ids(project_id, [issue_node_id]).get(issue_node_id)
+        if item_id:
+            click.echo(f"Skipped: already on project. Item ID: {item_id}")
+            return
 
     result = github_client.add_to_project(
         token=token, project_id=project_id, issue_node_id=issue_node_id
@@ -77,6 +278,10 @@ def add_to_project(issue_node_id: str, project_id: str | None, project_title: st
 
     item_id = result["data"]["addProjectV2ItemById"]["item"]["id"]
     click.echo(f"Added to project. Item ID: {item_id}")
+    if skip_on_board:
+        with ProjectMirror() as mirror:
+            mirror.record_added(project_id, {issue_node_id: item_id})
+    _set_fields(token, project_id, item_id, field_values)
 
 
 @cli.command()
@@ -101,17 +306,53 @@ def add_to_project(issue_node_id: str, project_id: str | None, project_title: st
     default=None,
     help="Project V2 title (looked up via GraphQL).",
 )
+@refresh_cache_option
+@click.option(
+    "--single-request",
+    is_flag=True,
+    help="Create the issue and add it to the project in one GraphQL request.",
+)
+@skip_existing_option
+@field_option
 def create_and_add(
-    title: str, body_file: str, label: tuple[str, ...], project_id: str | None, project_title: str | None
+    title: str,
+    body_file: str,
+    label: tuple[str, ...],
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool,
+    single_request: bool,
+    skip_existing: bool,
+    fields: tuple[str, ...],
 ):
     """Create an issue and add it to a GitHub Project V2."""
     token = config.get_github_token()
     owner = config.get_repo_owner()
     repo = config.get_repo_name()
-    project_id = _resolve_project_id(token, owner, project_id, project_title)
+    project_id = _resolve_project_id(token, owner, project_id, project_title, refresh_cache)
+    field_values = _resolve_fields(github_client.get_client(token), project_id, fields, refresh_cache)
 
     body = click.open_file(body_file).read()
 
+    index = None
+    if skip_existing:
+        index = _load_issue_index(github_client.get_client(token), owner, repo)
+        existing = index.find(title)
+        if existing:
+            click.echo(f"Skipped: issue #{existing['number']} already exists: {existing['html_url']}")
+            return
+
+    if single_request:
+        repository_id, label_ids = _lookup_repository(token, owner, repo, list(label), refresh_cache)
+        issue = github_client.create_issue_in_project(
+            token, repository_id, project_id, title, body, label_ids
+        )
+        click.echo(f"Created issue #{issue['number']}: {issue['html_url']}")
+        _remember_issue(index, issue, title)
+        click.echo(f"Added to project. Item ID: {issue['item_id']}")
+        _set_fields(token, project_id, issue["item_id"], field_values)
+        return
+
     issue = github_client.create_issue(
         token=token,
         owner=owner,
@@ -122,6 +363,7 @@ def create_and_add(
     )
 
     click.echo(f"Created issue #{issue['number']}: {issue['html_url']}")
+    _remember_issue(index, issue, title)
 
     result = github_client.add_to_project(
         token=token, project_id=project_id, issue_node_id=issue["node_id"]
@@ -129,13 +371,952 @@ def create_and_add(
 
     item_id = result["data"]["addProjectV2ItemById"]["item"]["id"]
     click.echo(f"Added to project. Item ID: {item_id}")
+    _set_fields(token, project_id, item_id, field_values)
+
+
+@cli.command()
+@click.option("--issue-node-id", "-i", multiple=True, help="Issue node ID (repeatable).")
+@click.option(
+    "--ids-file",
+    "-F",
+    type=click.File("r"),
+    default=None,
+    help="File with one issue node ID per line ('-' for stdin).",
+)
+@click.option(
+    "--project-id",
+    "-p",
+    default=None,
+    help="Project V2 node ID (fallback: GITHUB_PROJECT_ID env var).",
+)
+@click.option(
+    "--project-title",
+    "-T",
+    default=None,
+    help="Project V2 title (looked up via GraphQL).",
+)
+@refresh_cache_option
+@click.option(
+    "--batch-size",
+    "-b",
+    default=github_client.DEFAULT_BATCH_SIZE,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of adds packed into one GraphQL request.",
+)
+@field_option
+@skip_on_board_option
+def add_many_to_project(
+    issue_node_id: tuple[str, ...],
+    ids_file,
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool,
+    batch_size: int,
+    fields: tuple[str, ...],
+    skip_on_board: bool,
+):
+    """Add many existing issues to a GitHub Project V2 in batched requests."""
+    node_ids = list(issue_node_id)
+    if ids_file is not None:
+        node_ids.extend(line.strip() for line in ids_file if line.strip())
+    if not node_ids:
+        raise click.UsageError("Provide --issue-node-id or --ids-file.")
+
+    token = config.get_github_token()
+    owner = config.get_repo_owner()
+    project_id = _resolve_project_id(token, owner, project_id, project_title, refresh_cache)
+    field_values = _resolve_fields(github_client.get_client(token), project_id, fields, refresh_cache)
+
+    if skip_on_board:
+        with ProjectMirror() as mirror:
+            on_board = mirror.item_ids(project_id, node_ids)
+        for content_id, item_id in on_board.items():
+            click.echo(f"{content_id}: Skipped: already on project. Item ID: {item_id}")
+        node_ids = [node_id for node_id in node_ids if node_id not in on_board]
+
+    results = github_client.add_many_to_project(
+        token, project_id, node_ids, batch_size=batch_size, fields=field_values or None
+    )
+    if skip_on_board:
+        with ProjectMirror() as mirror:
+            mirror.record_added(project_id, {result.content_id: result.item_id for result in results if result.item_id})
+
+    for result in results:
+        if result.ok:
+            click.echo(f"{result.content_id}: Item ID: {result.item_id}")
+        else:
+            click.echo(f"{result.content_id}: Error: {result.error}", err=True)
+
+    failed = sum(1 for result in results if not result.ok)
+    if failed:
+        raise click.ClickException(f"{failed} of {len(results)} items failed.")
+
+
+def _open_journal(journal_path: str | None, resume: str | None):
+    if journal_path and resume:
+        raise click.UsageError("Provide --journal or --resume, not both.")
+    if journal_path and os.path.exists(journal_path):
+        raise click.UsageError(f"Journal {journal_path} already exists; pass it to --resume to continue.")
+    path = resume or journal_path
+    return Journal(path) if path else contextlib.nullcontext()
+
+
+def _echo_issue_result(result: bulk.IssueResult) -> None:
+    prefix = result.spec.source
+    if result.skipped:
+        click.echo(f"{prefix}: Skipped: issue #{result.issue['number']} already exists: {result.issue['html_url']}")
+    elif result.issue:
+        verb = "Already created" if result.resumed else "Created"
+        click.echo(f"{prefix}: {verb} issue #{result.issue['number']}: {result.issue['html_url']}")
+    if result.item_id:
+        click.echo(f"{prefix}: Added to project. Item ID: {result.item_id}")
+    if not result.ok:
+        click.echo(f"{prefix}: Error: {result.error}", err=True)
+
+
+@cli.command()
+@click.argument("sources", nargs=-1, required=True)
+@click.option("--label", "-l", multiple=True, help="Label to add to every issue (repeatable).")
+@click.option(
+    "--concurrency",
+    "-c",
+    default=bulk.DEFAULT_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of issues created in parallel.",
+)
+@click.option("--project-id", "-p", default=None, help="Also add the issues to this Project V2.")
+@click.option(
+    "--project-title",
+    "-T",
+    default=None,
+    help="Also add the issues to the Project V2 with this title.",
+)
+@refresh_cache_option
+@click.option(
+    "--batch-size",
+    "-b",
+    default=github_client.DEFAULT_BATCH_SIZE,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of project adds packed into one GraphQL request.",
+)
+@click.option(
+    "--journal",
+    "journal_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Record each completed step to this new JSONL journal.",
+)
+@click.option(
+    "--resume",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Continue the run recorded in this journal, skipping finished steps.",
+)
+@skip_existing_option
+@create_labels_option
+@field_option
+def create_issues(
+    sources: tuple[str, ...],
+    label: tuple[str, ...],
+    concurrency: int,
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool,
+    batch_size: int,
+    journal_path: str | None,
+    resume: str | None,
+    skip_existing: bool,
+    create_labels: bool,
+    fields: tuple[str, ...],
+):
+    """Create one issue per markdown file.
+
+    SOURCES are directories, glob patterns or manifest files listing markdown
+    paths. A leading "# Heading" line in each file is used as the issue title.
+    """
+    token = config.get_github_token()
+    owner = config.get_repo_owner()
+    repo = config.get_repo_name()
+    specs = bulk.load_specs(list(sources), list(label))
+    if not specs:
+        raise click.UsageError("No markdown files found.")
+    if project_id or project_title:
+        project_id = _resolve_project_id(token, owner, project_id, project_title, refresh_cache)
+    elif fields:
+        raise click.UsageError("--field needs --project-id or --project-title.")
+
+    with _open_journal(journal_path, resume) as journal, \
+            _new_client(token, pool_size=concurrency) as client:
+        field_values = _resolve_fields(client, project_id, fields, refresh_cache) if project_id else []
+        index = _load_issue_index(client, owner, repo) if skip_existing else None
+        if create_labels:
+            label_set = LabelSet.load(client, owner, repo, refresh=refresh_cache)
+            created = label_set.ensure(client, (name for spec in specs for name in spec.labels), concurrency)
+            if created:
+                click.echo(f"Created labels: {', '.join(created)}")
+        results = bulk.create_issues(
+            client, owner, repo, specs, concurrency=concurrency, journal=journal, index=index
+        )
+        if index is not None:
+            index.save()
+        if project_id:
+            bulk.add_to_project(
+                client, owner, repo, project_id, results,
+                batch_size=batch_size, journal=journal, fields=field_values or None,
+            )
+
+    for result in results:
+        _echo_issue_result(result)
+
+    failed = sum(1 for result in results if not result.ok)
+    if failed:
+        raise click.ClickException(f"{failed} of {len(results)} issues failed.")
+
+
+@cli.command()
+@click.option(
+    "--concurrency",
+    "-c",
+    default=bulk.DEFAULT_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of issues created in parallel.",
+)
+@click.option(
+    "--max-in-flight",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Most specs read ahead of finished results (default: twice --concurrency).",
+)
+@click.option("--project-id", "-p", default=None, help="Project V2 for specs that name none.")
+@click.option(
+    "--project-title",
+    "-T",
+    default=None,
+    help="Project V2 title for specs that name none.",
+)
+@refresh_cache_option
+@create_labels_option
+@click.argument("specs", type=click.File("r"), default="-")
+def batch(
+    specs,
+    concurrency: int,
+    max_in_flight: int | None,
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool,
+    create_labels: bool,
+):
+    """Create issues from JSONL SPECS (default: stdin), streaming JSONL results to stdout.
+
+    Each input line is an object with "title", "body" or "body_file", and
+    optionally "labels", "project_id" or "project_title", and an "id" that is
+    echoed back. A result line is written as soon as its issue is done, so
+    output order can differ from input order; "line" gives the input line.
+    """
+    token = config.get_github_token()
+    owner = config.get_repo_owner()
+    repo = config.get_repo_name()
+    if project_id or project_title:
+        project_id = _resolve_project_id(token, owner, project_id, project_title, refresh_cache)
+
+    @functools.lru_cache(maxsize=None)
+    def _project_for_title(title: str) -> str:
+        return _lookup_project_id(token, owner, title, refresh_cache)
+
+    def _file(line: str, output: dict) -> None:
+        record = json.loads(line)
+        if isinstance(record, dict) and "id" in record:
+            output["id"] = record["id"]
+        spec = bulk.spec_from_record(record)
+        target = record.get("project_id") or (
+            _project_for_title(record["project_title"]) if record.get("project_title") else project_id
+        )
+        if label_set is not None:
+            label_set.ensure(client, spec.labels, concurrency)
+
+        result = bulk.create_one(client, owner, repo, spec, target)
+        if result.issue:
+            output.update(
+                number=result.issue["number"], html_url=result.issue["html_url"], node_id=result.issue["node_id"]
+            )
+        if result.item_id:
+            output["item_id"] = result.item_id
+        if not result.ok:
+            output["error"] = str(result.error)
+
+    def _process(numbered_line: tuple[int, str]) -> dict:
+        line_number, line = numbered_line
+        output: dict = {"line": line_number}
+        try:
+            _file(line, output)
+        except Exception as e:
+            # Any failure belongs to this line's result: escaping the pool would
+            # end the stream and hide the results of issues already filed.
+            output["error"] = str(e) or type(e).__name__
+        return output
+
+    lines = ((number, line) for number, line in enumerate(specs, start=1) if line.strip())
+    failed = 0
+    with _new_client(token, pool_size=concurrency) as client:
+        label_set = LabelSet.load(client, owner, repo, refresh=refresh_cache) if create_labels else None
+        for output in bulk.imap_unordered(_process, lines, concurrency, max_in_flight):
+            failed += "error" in output
+            click.echo(json.dumps(output))
+
+    if failed:
+        raise click.ClickException(f"{failed} issues failed.")
+
+
+@cli.command("create-from-template")
+@click.argument("template", type=click.Path(exists=True, dir_okay=False))
+@click.argument("data", type=click.Path(exists=True, dir_okay=False))
+@click.option("--label", "-l", multiple=True, help="Label for every issue; may use $column placeholders (repeatable).")
+@click.option(
+    "--concurrency",
+    "-c",
+    default=bulk.DEFAULT_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of issues created in parallel.",
+)
+@click.option(
+    "--max-in-flight",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Most rows read ahead of finished results (default: twice --concurrency).",
+)
+@click.option("--project-id", "-p", default=None, help="Project V2 node ID to add every issue to.")
+@click.option("--project-title", "-T", default=None, help="Project V2 title to add every issue to.")
+@refresh_cache_option
+@create_labels_option
+def create_from_template(
+    template: str,
+    data: str,
+    label: tuple[str, ...],
+    concurrency: int,
+    max_in_flight: int | None,
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool,
+    create_labels: bool,
+):
+    """Create one issue per row of DATA, rendered from the markdown TEMPLATE.
+
+    DATA is a CSV file with a header row, or a Parquet file (.parquet, needs
+    pyarrow). $column or ${column} placeholders in the template are replaced
+    with the row's values; a leading "# Heading" line is the title. A "labels"
+    column adds comma-separated labels. Rows are read as issues complete, so
+    memory use does not grow with the size of DATA.
+    """
+    token = config.get_github_token()
+    owner = config.get_repo_owner()
+    repo = config.get_repo_name()
+    issue_template = templates.IssueTemplate.from_file(template, list(label))
+    if project_id or project_title:
+        project_id = _resolve_project_id(token, owner, project_id, project_title, refresh_cache)
+
+    def _create(spec: bulk.IssueSpec) -> bulk.IssueResult:
+        if label_set is not None:
+            try:
+                label_set.ensure(client, spec.labels, concurrency)
+            except GhUtilsError as e:
+                return bulk.IssueResult(spec, error=e)
+        return bulk.create_one(client, owner, repo, spec, project_id)
+
+    total = failed = 0
+    with _new_client(token, pool_size=concurrency) as client:
+        label_set = LabelSet.load(client, owner, repo, refresh=refresh_cache) if create_labels else None
+        specs = templates.iter_specs(issue_template, data)
+        for result in bulk.imap_unordered(_create, specs, concurrency, max_in_flight):
+            total += 1
+            failed += not result.ok
+            _echo_issue_result(result)
+
+    if failed:
+        raise click.ClickException(f"{failed} of {total} issues failed.")
+
+
+def _echo_table(rows: list[tuple[str, ...]]) -> None:
+    """Print rows as aligned columns; the last column is not padded."""
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]) - 1)]
+    for row in rows:
+        click.echo("  ".join(cell.ljust(width) for cell, width in zip(row, widths)) + "  " + row[-1])
+
+
+def _echo_fan_out_table(results: list[bulk.IssueResult]) -> None:
+    rows = [("REPOSITORY", "ISSUE", "PROJECT ITEM", "RESULT")]
+    for result in results:
+        rows.append((
+            result.spec.source,
+            f"#{result.issue['number']}" if result.issue else "-",
+            result.item_id or "-",
+            "created" if result.ok else f"error: {result.error}",
+        ))
+    _echo_table(rows)
+
+
+@cli.command("fan-out")
+@click.argument("repos", nargs=-1)
+@click.option(
+    "--repos-file",
+    "-R",
+    type=click.File("r"),
+    default=None,
+    help="File listing one owner/name per line ('-' for stdin).",
+)
+@click.option("--title", "-t", required=True, help="Issue title.")
+@click.option(
+    "--body-file",
+    "-f",
+    required=True,
+    type=click.Path(exists=True),
+    help="Path to markdown file with issue body.",
+)
+@click.option("--label", "-l", multiple=True, help="Label to add (repeatable).")
+@click.option(
+    "--concurrency",
+    "-c",
+    default=bulk.DEFAULT_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of repositories filed in parallel.",
+)
+@click.option("--project-id", "-p", default=None, help="Also add every issue to this Project V2.")
+@click.option(
+    "--project-title",
+    "-T",
+    default=None,
+    help="Also add every issue to the Project V2 with this title.",
+)
+@refresh_cache_option
+@click.option(
+    "--batch-size",
+    "-b",
+    default=github_client.DEFAULT_BATCH_SIZE,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of project adds packed into one GraphQL request.",
+)
+@field_option
+@click.option("--json", "as_json", is_flag=True, help="Print the results as JSON instead of a table.")
+def fan_out(
+    repos: tuple[str, ...],
+    repos_file,
+    title: str,
+    body_file: str,
+    label: tuple[str, ...],
+    concurrency: int,
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool,
+    batch_size: int,
+    fields: tuple[str, ...],
+    as_json: bool,
+):
+    """Create the same issue in every repository of REPOS.
+
+    REPOS are owner/name pairs; a bare name uses GITHUB_REPO_OWNER. The
+    issues are created in parallel over one connection pool and, with a
+    project, added to it in batched requests. A project title is looked up
+    under GITHUB_REPO_OWNER, or the owner of the first repository.
+    """
+    token = config.get_github_token()
+    default_owner = os.environ.get("GITHUB_REPO_OWNER")
+    names = list(repos) + (repos_file.read().splitlines() if repos_file else [])
+    targets = bulk.parse_repos(names, default_owner)
+    if not targets:
+        raise click.UsageError("No repositories given.")
+    if project_id or project_title:
+        project_owner = default_owner or targets[0][0]
+        project_id = _resolve_project_id(token, project_owner, project_id, project_title, refresh_cache)
+    elif fields:
+        raise click.UsageError("--field needs --project-id or --project-title.")
+    spec = bulk.IssueSpec(title=title, body=click.open_file(body_file).read(), labels=list(label))
+
+    with _new_client(token, pool_size=concurrency) as client:
+        field_values = _resolve_fields(client, project_id, fields, refresh_cache) if project_id else []
+        results = bulk.fan_out(
+            client, targets, spec, concurrency=concurrency,
+            project_id=project_id, batch_size=batch_size, fields=field_values or None,
+        )
+
+    if as_json:
+        click.echo(json.dumps([
+            {
+                "repository": result.spec.source,
+                "number": result.issue["number"] if result.issue else None,
+                "html_url": result.issue["html_url"] if result.issue else None,
+                "item_id": result.item_id,
+                "error": None if result.ok else str(result.error),
+            }
+            for result in results
+        ], indent=2))
+    else:
+        _echo_fan_out_table(results)
+
+    failed = sum(1 for result in results if not result.ok)
+    if failed:
+        raise click.ClickException(f"{failed} of {len(results)} repositories failed.")
+
+
+@cli.command("bulk-edit")
+@click.option("--query", "-q", "search", default=None, help="Select the issues matching this GitHub search query.")
+@click.option("--issue-node-id", "-i", multiple=True, help="Select this issue node ID (repeatable).")
+@click.option(
+    "--ids-file",
+    "-F",
+    type=click.File("r"),
+    default=None,
+    help="File with one issue node ID per line ('-' for stdin).",
+)
+@click.option("--add-label", multiple=True, help="Label to add (repeatable).")
+@click.option("--remove-label", multiple=True, help="Label to remove (repeatable).")
+@click.option("--close", is_flag=True, help="Close the issues.")
+@click.option("--reopen", is_flag=True, help="Reopen the issues.")
+@click.option(
+    "--reason",
+    type=click.Choice(sorted(edits.STATE_REASONS)),
+    default=None,
+    help="Why the issues are closed (with --close).",
+)
+@click.option("--add-assignee", multiple=True, help="Login to assign (repeatable).")
+@click.option("--remove-assignee", multiple=True, help="Login to unassign (repeatable).")
+@click.option("--milestone", default=None, help="Milestone title to set; '' removes the milestone.")
+@click.option(
+    "--batch-size",
+    "-b",
+    default=github_client.DEFAULT_BATCH_SIZE,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of issues edited in one GraphQL request.",
+)
+@click.option("--dry-run", is_flag=True, help="List the selected issues without changing them.")
+def bulk_edit(
+    search: str | None,
+    issue_node_id: tuple[str, ...],
+    ids_file,
+    add_label: tuple[str, ...],
+    remove_label: tuple[str, ...],
+    close: bool,
+    reopen: bool,
+    reason: str | None,
+    add_assignee: tuple[str, ...],
+    remove_assignee: tuple[str, ...],
+    milestone: str | None,
+    batch_size: int,
+    dry_run: bool,
+):
+    """Change labels, state, assignees or milestone of many issues at once.
+
+    Select issues with --query (e.g. "repo:acme/api is:open label:stale")
+    and/or node IDs. The changes are sent as aliased GraphQL mutations,
+    --batch-size issues per request, and reported per issue.
+    """
+    if close and reopen:
+        raise click.UsageError("Provide --close or --reopen, not both.")
+    if reason and not close:
+        raise click.UsageError("--reason needs --close.")
+    changes = edits.IssueChanges(
+        add_labels=list(add_label),
+        remove_labels=list(remove_label),
+        state="closed" if close else "open" if reopen else None,
+        state_reason=reason,
+        add_assignees=list(add_assignee),
+        remove_assignees=list(remove_assignee),
+        milestone=milestone,
+    )
+    if not changes and not dry_run:
+        raise click.UsageError("Nothing to change; give at least one change option.")
+    node_ids = list(issue_node_id)
+    if ids_file is not None:
+        node_ids.extend(line.strip() for line in ids_file if line.strip())
+    if not search and not node_ids:
+        raise click.UsageError("Provide --query, --issue-node-id or --ids-file.")
+
+    token = config.get_github_token()
+    with _new_client(token, pool_size=2) as client:
+        issues = {}
+        if node_ids:
+            issues.update((issue["id"], issue) for issue in client.get_issue_refs(node_ids))
+            unknown = [node_id for node_id in node_ids if node_id not in issues]
+            if unknown:
+                raise click.ClickException(f"Not issues or not found: {', '.join(unknown)}")
+        if search:
+            issues.update((issue["id"], issue) for issue in client.search_issues(search))
+        names = {
+            issue_id: f"{issue['repository']['nameWithOwner']}#{issue['number']}" for issue_id, issue in issues.items()
+        }
+        if dry_run:
+            for name in names.values():
+                click.echo(name)
+            click.echo(f"{len(names)} issues selected.")
+            return
+        planned = edits.EditPlanner(client, changes).plan(list(issues.values()))
+        results = client.edit_issues(planned, batch_size=batch_size)
+
+    for result in results:
+        if result.ok:
+            click.echo(f"{names[result.content_id]}: Updated")
+        else:
+            click.echo(f"{names[result.content_id]}: Error: {result.error}", err=True)
+    unchanged = len(issues) - len(results)
+    if unchanged:
+        click.echo(f"{unchanged} issues needed no change.")
+
+    failed = sum(1 for result in results if not result.ok)
+    if failed:
+        raise click.ClickException(f"{failed} of {len(results)} issues failed.")
+
+
+mirror_option = click.option(
+    "--db",
+    "db_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Mirror database (default: project-mirror.sqlite in the cache dir).",
+)
+
+
+@cli.command()
+@click.option(
+    "--project-id",
+    "-p",
+    default=None,
+    help="Project V2 node ID (fallback: GITHUB_PROJECT_ID env var).",
+)
+@click.option(
+    "--project-title",
+    "-T",
+    default=None,
+    help="Project V2 title (looked up via GraphQL).",
+)
+@refresh_cache_option
+@mirror_option
+def sync(project_id: str | None, project_title: str | None, refresh_cache: bool, db_path: str | None):
+    """Copy a project's items and field values into the local mirror.
+
+    Only items added or updated since the last sync are fetched in full;
+    items removed from the project are dropped from the mirror.
+    """
+    token = config.get_github_token()
+    owner = config.get_repo_owner()
+    project_id = _resolve_project_id(token, owner, project_id, project_title, refresh_cache)
+
+    with _new_client(token, pool_size=github_client.DEFAULT_POOL_SIZE) as client, ProjectMirror(db_path) as mirror:
+        stats = mirror.sync(client, project_id)
+    click.echo(f"Synced {stats.total} items: {stats.fetched} fetched, {stats.removed} removed.")
+
+
+@cli.command()
+@click.option(
+    "--project-id",
+    "-p",
+    default=None,
+    help="Project V2 node ID (fallback: GITHUB_PROJECT_ID env var).",
+)
+@click.option(
+    "--project-title",
+    "-T",
+    default=None,
+    help="Project V2 title (looked up via GraphQL).",
+)
+@refresh_cache_option
+@click.option(
+    "--field",
+    "fields",
+    multiple=True,
+    metavar="NAME=VALUE",
+    help="Only items whose field has this value, e.g. --field Status=Todo (repeatable).",
+)
+@click.option("--repository", "-r", default=None, help="Only items from this owner/name repository.")
+@click.option("--state", default=None, help="Only issues or pull requests in this state (open, closed, merged).")
+@click.option("--count", "count_only", is_flag=True, help="Print only the number of matching items.")
+@click.option("--json", "as_json", is_flag=True, help="Print the items as JSON instead of a table.")
+@mirror_option
+def query(
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool,
+    fields: tuple[str, ...],
+    repository: str | None,
+    state: str | None,
+    count_only: bool,
+    as_json: bool,
+    db_path: str | None,
+):
+    """Answer from the local mirror which project items match the filters.
+
+    Nothing is fetched from GitHub; run "sync" first to bring the mirror up
+    to date. Names and values match case-insensitively.
+    """
+    if project_title:
+        # Only a title lookup needs GitHub; otherwise no token is required.
+        token = config.get_github_token()
+        owner = config.get_repo_owner()
+        project_id = _resolve_project_id(token, owner, project_id, project_title, refresh_cache)
+    else:
+        project_id = project_id or config.get_project_id()
+    filters = parse_assignments(fields)
+
+    with ProjectMirror(db_path) as mirror:
+        if mirror.synced_at(project_id) is None:
+            raise click.ClickException(f"Project {project_id} has not been synced; run 'gh-utils sync' first.")
+        if count_only:
+            click.echo(mirror.count(project_id, filters, repository, state))
+            return
+        items = mirror.query(project_id, filters, repository, state)
+
+    if as_json:
+        click.echo(json.dumps(items, indent=2))
+        return
+    rows = [("ITEM", "STATE", "TITLE", "FIELDS")]
+    for item in items:
+        rows.append((
+            f"{item['repository']}#{item['number']}" if item["number"] else item["item_id"],
+            item["state"] or "-",
+            item["title"] or "-",
+            ", ".join(f"{name}={value}" for name, value in item["fields"].items() if name != "Title") or "-",
+        ))
+    _echo_table(rows)
+
+
+@cli.command("export-project")
+@click.argument("output", type=click.Path(dir_okay=False))
+@click.option(
+    "--project-id",
+    "-p",
+    default=None,
+    help="Project V2 node ID (fallback: GITHUB_PROJECT_ID env var).",
+)
+@click.option(
+    "--project-title",
+    "-T",
+    default=None,
+    help="Project V2 title (looked up via GraphQL).",
+)
+@refresh_cache_option
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(export.FORMATS),
+    default=None,
+    help="Output format (default: from the OUTPUT suffix).",
+)
+@click.option("--resume", is_flag=True, help="Continue an interrupted export from its last checkpoint.")
+@click.option(
+    "--page-size",
+    default=export.MAX_PAGE_SIZE,
+    show_default=True,
+    type=click.IntRange(min=1, max=export.MAX_PAGE_SIZE),
+    help="Items fetched per request.",
+)
+def export_project(
+    output: str,
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool,
+    fmt: str | None,
+    resume: bool,
+    page_size: int,
+):
+    """Write every item of a project, with its field values, to OUTPUT.
+
+    OUTPUT is a .jsonl, .csv or .parquet file (Parquet needs pyarrow). Items
+    are written page by page while the next page downloads, so memory use
+    does not grow with the size of the project.
+    """
+    token = config.get_github_token()
+    owner = config.get_repo_owner()
+    project_id = _resolve_project_id(token, owner, project_id, project_title, refresh_cache)
+
+    with _new_client(token, pool_size=2) as client:
+        stats = export.export_project(client, project_id, output, fmt, resume=resume, page_size=page_size)
+    click.echo(f"Exported {stats.rows} items to {output}{' (resumed)' if stats.resumed else ''}.")
+
+
+def _default_watch_journal(directory: str) -> str:
+    """A journal per watched directory, in the cache dir, so restarts do not file reports twice."""
+    key = content_hash(os.path.abspath(directory))[:16]
+    return str(config.get_cache_dir() / "watch" / f"{key}.jsonl")
+
+
+@cli.command("watch")
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option("--label", "-l", multiple=True, help="Label to add to every issue (repeatable).")
+@click.option("--project-id", "-p", default=None, help="Also add the issues to this Project V2.")
+@click.option(
+    "--project-title",
+    "-T",
+    default=None,
+    help="Also add the issues to the Project V2 with this title.",
+)
+@refresh_cache_option
+@click.option(
+    "--concurrency",
+    "-c",
+    default=bulk.DEFAULT_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of issues created in parallel.",
+)
+@click.option(
+    "--batch-size",
+    "-b",
+    default=github_client.DEFAULT_BATCH_SIZE,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of project adds packed into one GraphQL request.",
+)
+@click.option(
+    "--settle",
+    default=watch.DEFAULT_SETTLE,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Seconds a file must go unchanged before it is filed.",
+)
+@click.option(
+    "--window",
+    default=watch.DEFAULT_WINDOW,
+    show_default=True,
+    type=click.FloatRange(min=0),
+    help="Seconds to keep collecting settled files into one batch.",
+)
+@click.option("--poll", is_flag=True, help="Scan the directory periodically instead of using inotify.")
+@click.option(
+    "--interval",
+    default=watch.DEFAULT_POLL_INTERVAL,
+    show_default=True,
+    type=click.FloatRange(min=0.1),
+    help="Seconds between scans when polling.",
+)
+@click.option(
+    "--journal",
+    "journal_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Journal of filed reports (default: one per directory in the cache dir).",
+)
+@skip_existing_option
+@field_option
+def watch_directory(
+    directory: str,
+    label: tuple[str, ...],
+    project_id: str | None,
+    project_title: str | None,
+    refresh_cache: bool,
+    concurrency: int,
+    batch_size: int,
+    settle: float,
+    window: float,
+    poll: bool,
+    interval: float,
+    journal_path: str | None,
+    skip_existing: bool,
+    fields: tuple[str, ...],
+):
+    """File an issue for each markdown file written to DIRECTORY, until interrupted.
+
+    A file is filed once it has gone unchanged for --settle seconds; files that
+    settle within --window seconds of each other are filed as one batch. Reports
+    already in DIRECTORY when the watch starts are filed too, unless the
+    journal records them as filed.
+    """
+    token = config.get_github_token()
+    owner = config.get_repo_owner()
+    repo = config.get_repo_name()
+    if project_id or project_title:
+        project_id = _resolve_project_id(token, owner, project_id, project_title, refresh_cache)
+    elif fields:
+        raise click.UsageError("--field needs --project-id or --project-title.")
+
+    watcher = watch.create_watcher(directory, poll=poll, interval=interval)
+    with contextlib.closing(watcher), Journal(journal_path or _default_watch_journal(directory)) as journal, \
+            _new_client(token, pool_size=concurrency) as client:
+        field_values = _resolve_fields(client, project_id, fields, refresh_cache) if project_id else []
+        index = _load_issue_index(client, owner, repo) if skip_existing else None
+
+        def _file_batch(paths: list) -> None:
+            specs = []
+            for path in paths:
+                try:
+                    spec = bulk.spec_from_markdown(path, list(label))
+                except (OSError, UnicodeDecodeError) as e:
+                    click.echo(f"{path}: Error: {e}", err=True)
+                    continue
+                # An empty file is filed once something is written to it.
+                if spec.body.strip() or spec.title != path.stem:
+                    specs.append(spec)
+            results = bulk.create_issues(
+                client, owner, repo, specs, concurrency=concurrency, journal=journal, index=index
+            )
+            if index is not None:
+                index.save()
+            if project_id:
+                bulk.add_to_project(
+                    client, owner, repo, project_id, results,
+                    batch_size=batch_size, journal=journal, fields=field_values or None,
+                )
+            for result in results:
+                if not (result.resumed and result.ok):
+                    _echo_issue_result(result)
+
+        kind = "polling" if isinstance(watcher, watch.PollingWatcher) else "inotify"
+        click.echo(f"Watching {directory} ({kind}); press Ctrl-C to stop.", err=True)
+        try:
+            watch.run(
+                watcher, _file_batch, settle=settle, window=window,
+                initial=watch.list_reports(watcher.directory),
+            )
+        except KeyboardInterrupt:
+            click.echo("Stopped watching.", err=True)
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Unix socket to listen on (default: GH_UTILS_DAEMON_SOCKET or $XDG_RUNTIME_DIR/gh-utils.sock).",
+)
+@click.option("--stop", is_flag=True, help="Stop the running daemon instead of starting one.")
+def daemon(socket_path: str | None, stop: bool):
+    """Keep a warm process that other gh-utils calls forward to.
+
+    While it runs, gh-utils commands are executed inside the daemon over a
+    local Unix socket, reusing its connection pool and caches. Set
+    GH_UTILS_NO_DAEMON=1 to bypass it.
+    """
+    from gh_utils import daemon as daemon_server
+
+    socket_path = socket_path or str(config.get_daemon_socket())
+    if stop:
+        if not daemon_server.stop(socket_path):
+            raise click.ClickException(f"No daemon is listening on {socket_path}.")
+        click.echo("Daemon stopped.")
+        return
+
+    with daemon_server.DaemonServer(socket_path) as server:
+        click.echo(f"Listening on {socket_path}", err=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def report_error(e: GhUtilsError) -> None:
+    click.echo(f"Error: {e}", err=True)
+    if hasattr(e, "response_body") and e.response_body:
+        click.echo(f"Response: {e.response_body}", err=True)
 
 
 def main():
     try:
         cli()
     except GhUtilsError as e:
-        click.echo(f"Error: {e}", err=True)
-        if hasattr(e, "response_body") and e.response_body:
-            click.echo(f"Response: {e.response_body}", err=True)
+        report_error(e)
         sys.exit(1)
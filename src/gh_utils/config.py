@@ -1,15 +1,28 @@
 import os
+from pathlib import Path
 
 from gh_utils.exceptions import ConfigError
 
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+DEFAULT_API_URL = "https://api.github.com"
+
+
+def _pooled_tokens() -> list[str]:
+    return os.environ.get("GITHUB_TOKENS", "").replace(",", " ").split()
+
 
 def get_github_token() -> str:
-    token = os.environ.get("GITHUB_TOKEN")
+    token = os.environ.get("GITHUB_TOKEN") or next(iter(_pooled_tokens()), None)
     if not token:
         raise ConfigError("GITHUB_TOKEN environment variable is not set")
     return token
 
 
+def get_github_tokens() -> list[str]:
+    """``GITHUB_TOKEN`` followed by the comma- or space-separated ``GITHUB_TOKENS``, once each."""
+    return list(dict.fromkeys([get_github_token(), *_pooled_tokens()]))
+
+
 def get_repo_owner() -> str:
     owner = os.environ.get("GITHUB_REPO_OWNER")
     if not owner:
@@ -29,3 +42,65 @@ def get_project_id() -> str:
     if not project_id:
         raise ConfigError("GITHUB_PROJECT_ID environment variable is not set")
     return project_id
+
+
+def get_api_url() -> str:
+    return os.environ.get("GITHUB_API_URL", DEFAULT_API_URL).rstrip("/")
+
+
+def get_graphql_url() -> str:
+    graphql_url = os.environ.get("GITHUB_GRAPHQL_URL")
+    if graphql_url:
+        return graphql_url
+    api_url = get_api_url()
+    if api_url.endswith("/api/v3"):  # GitHub Enterprise Server
+        return api_url.removesuffix("/v3") + "/graphql"
+    return f"{api_url}/graphql"
+
+
+def get_cache_dir() -> Path:
+    cache_dir = os.environ.get("GH_UTILS_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(xdg_cache_home) / "gh-utils"
+
+
+def get_cache_ttl() -> float:
+    ttl = os.environ.get("GH_UTILS_CACHE_TTL")
+    if not ttl:
+        return DEFAULT_CACHE_TTL
+    try:
+        return float(ttl)
+    except ValueError:
+        raise ConfigError(f"GH_UTILS_CACHE_TTL must be a number of seconds, got '{ttl}'") from None
+
+
+def get_record_path() -> Path | None:
+    path = os.environ.get("GH_UTILS_RECORD")
+    return Path(path) if path else None
+
+
+def get_replay_path() -> Path | None:
+    path = os.environ.get("GH_UTILS_REPLAY")
+    return Path(path) if path else None
+
+
+def get_replay_latency() -> float:
+    scale = os.environ.get("GH_UTILS_REPLAY_LATENCY")
+    if not scale:
+        return 0.0
+    try:
+        return float(scale)
+    except ValueError:
+        raise ConfigError(f"GH_UTILS_REPLAY_LATENCY must be a number, got '{scale}'") from None
+
+
+def get_daemon_socket() -> Path:
+    socket_path = os.environ.get("GH_UTILS_DAEMON_SOCKET")
+    if socket_path:
+        return Path(socket_path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "gh-utils.sock"
+    return get_cache_dir() / "daemon.sock"
@@ -0,0 +1,123 @@
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import threading
+import traceback
+from pathlib import Path
+
+from gh_utils.exceptions import GhUtilsError
+from gh_utils.launcher import FORWARDED_ENV_PREFIXES
+
+
+@contextlib.contextmanager
+def _client_context(env: dict[str, str], cwd: str):
+    """Temporarily take on the calling client's environment and working directory."""
+    saved_env = {key: value for key, value in os.environ.items() if key.startswith(FORWARDED_ENV_PREFIXES)}
+    saved_cwd = os.getcwd()
+    for key in saved_env:
+        del os.environ[key]
+    os.environ.update(env)
+    os.chdir(cwd)
+    try:
+        yield
+    finally:
+        for key in [key for key in os.environ if key.startswith(FORWARDED_ENV_PREFIXES)]:
+            del os.environ[key]
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+def run_command(argv: list[str], env: dict[str, str], cwd: str) -> tuple[int, str, str]:
+    """Run one CLI invocation in this process and capture its exit code and output."""
+    from gh_utils import cli
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with _client_context(env, cwd), contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            cli.cli.main(args=argv, prog_name="gh-utils")
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except GhUtilsError as e:
+            cli.report_error(e)
+            exit_code = 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:  # a liveness probe that connected and hung up
+            return
+        request = json.loads(line)
+        if request.get("shutdown"):
+            self.wfile.write(b'{"ok": true}\n')
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+        # The CLI reads os.environ, the cwd and sys.stdout, which are process-wide,
+        # so commands run one at a time. The pool and caches stay warm across them.
+        with self.server.run_lock:
+            exit_code, stdout, stderr = run_command(request["argv"], request["env"], request["cwd"])
+        reply = {"exit_code": exit_code, "stdout": stdout, "stderr": stderr}
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+class DaemonServer(socketserver.ThreadingUnixStreamServer):
+    """Unix-socket server that runs forwarded ``gh-utils`` commands in one warm process.
+
+    Clients created through :func:`gh_utils.github_client.get_client` live as
+    long as the daemon, so forwarded commands reuse open connections and
+    in-memory state instead of paying Python start-up and TLS handshakes.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str | Path):
+        self.socket_path = Path(socket_path)
+        self.run_lock = threading.Lock()
+        _remove_stale_socket(self.socket_path)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    if not socket_path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+    except OSError:
+        socket_path.unlink()
+    else:
+        raise GhUtilsError(f"A gh-utils daemon is already listening on {socket_path}")
+    finally:
+        probe.close()
+
+
+def stop(socket_path: str | Path) -> bool:
+    """Ask the daemon on ``socket_path`` to exit; returns ``False`` if none is running."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        return False
+    with sock, sock.makefile("rwb") as stream:
+        stream.write(b'{"shutdown": true}\n')
+        stream.flush()
+        stream.readline()
+    return True
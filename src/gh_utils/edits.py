@@ -0,0 +1,130 @@
+from dataclasses import dataclass, field
+
+from gh_utils import cache
+from gh_utils.exceptions import ConfigError
+from gh_utils.github_client import GitHubClient
+from gh_utils.labels import LabelSet
+
+STATE_REASONS = {"completed": "COMPLETED", "not_planned": "NOT_PLANNED"}
+
+
+@dataclass
+class IssueChanges:
+    """Changes applied to every selected issue by ``bulk-edit``.
+
+    ``milestone`` is a milestone title; an empty string removes the milestone
+    and ``None`` leaves it alone.
+    """
+
+    add_labels: list[str] = field(default_factory=list)
+    remove_labels: list[str] = field(default_factory=list)
+    state: str | None = None
+    state_reason: str | None = None
+    add_assignees: list[str] = field(default_factory=list)
+    remove_assignees: list[str] = field(default_factory=list)
+    milestone: str | None = None
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.add_labels or self.remove_labels or self.state or self.add_assignees
+            or self.remove_assignees or self.milestone is not None
+        )
+
+
+def _repo(issue: dict) -> tuple[str, str]:
+    owner, _, repo = issue["repository"]["nameWithOwner"].partition("/")
+    return owner, repo
+
+
+class EditPlanner:
+    """Turns :class:`IssueChanges` into the mutations for each issue.
+
+    Label, user and milestone node IDs are resolved once per repository (or
+    once overall, for users). Labels come from the cached :class:`LabelSet`.
+    Anything that cannot be resolved raises :class:`ConfigError` before a
+    single issue is changed.
+    """
+
+    def __init__(self, client: GitHubClient, changes: IssueChanges, node_cache: cache.NodeIdCache | None = None):
+        self.client = client
+        self.changes = changes
+        self.node_cache = node_cache
+        self._label_sets: dict[tuple[str, str], LabelSet] = {}
+        self._milestones: dict[tuple[str, str], str | None] = {}
+        self._users: dict[str, str] | None = None
+
+    def _labels(self, owner: str, repo: str) -> LabelSet:
+        key = (owner, repo)
+        if key not in self._label_sets:
+            label_set = LabelSet.load(self.client, owner, repo, node_cache=self.node_cache)
+            if label_set.missing(self.changes.add_labels):
+                # The cached set may predate a label added since; list again once.
+                label_set = LabelSet.load(self.client, owner, repo, refresh=True, node_cache=self.node_cache)
+            missing = label_set.missing(self.changes.add_labels)
+            if missing:
+                raise ConfigError(f"Labels not found in {owner}/{repo}: {', '.join(missing)}")
+            self._label_sets[key] = label_set
+        return self._label_sets[key]
+
+    def _user_ids(self, logins: list[str]) -> list[str]:
+        if self._users is None:
+            wanted = self.changes.add_assignees + self.changes.remove_assignees
+            found = {login.casefold(): node_id for login, node_id in self.client.get_user_ids(wanted).items()}
+            unknown = [login for login in wanted if login.casefold() not in found]
+            if unknown:
+                raise ConfigError(f"Unknown users: {', '.join(unknown)}")
+            self._users = found
+        return [self._users[login.casefold()] for login in logins]
+
+    def _milestone(self, owner: str, repo: str) -> str | None:
+        key = (owner, repo)
+        if key not in self._milestones:
+            milestone_id = self.client.get_milestone_id(owner, repo, self.changes.milestone)
+            if milestone_id is None:
+                raise ConfigError(f"No milestone '{self.changes.milestone}' in {owner}/{repo}")
+            self._milestones[key] = milestone_id
+        return self._milestones[key]
+
+    def mutations(self, issue: dict) -> list[tuple[str, dict]]:
+        """The ``(mutation, input)`` pairs that apply the changes to one issue."""
+        changes = self.changes
+        issue_id = issue["id"]
+        owner, repo = _repo(issue)
+        mutations = []
+        if changes.add_labels:
+            label_ids = self._labels(owner, repo).node_ids(changes.add_labels)
+            mutations.append(("addLabelsToLabelable", {"labelableId": issue_id, "labelIds": label_ids}))
+        if changes.remove_labels:
+            label_set = self._labels(owner, repo)
+            # A label the repository does not have is on none of its issues.
+            present = [name for name in changes.remove_labels if name in label_set]
+            if present:
+                mutations.append(
+                    ("removeLabelsFromLabelable", {"labelableId": issue_id, "labelIds": label_set.node_ids(present)})
+                )
+        if changes.add_assignees:
+            mutations.append((
+                "addAssigneesToAssignable",
+                {"assignableId": issue_id, "assigneeIds": self._user_ids(changes.add_assignees)},
+            ))
+        if changes.remove_assignees:
+            mutations.append((
+                "removeAssigneesFromAssignable",
+                {"assignableId": issue_id, "assigneeIds": self._user_ids(changes.remove_assignees)},
+            ))
+        if changes.milestone is not None:
+            milestone_id = self._milestone(owner, repo) if changes.milestone else None
+            mutations.append(("updateIssue", {"id": issue_id, "milestoneId": milestone_id}))
+        if changes.state == "closed":
+            close_input = {"issueId": issue_id}
+            if changes.state_reason:
+                close_input["stateReason"] = STATE_REASONS[changes.state_reason]
+            mutations.append(("closeIssue", close_input))
+        elif changes.state == "open":
+            mutations.append(("reopenIssue", {"issueId": issue_id}))
+        return mutations
+
+    def plan(self, issues: list[dict]) -> list[tuple[str, list[tuple[str, dict]]]]:
+        """``(issue ID, mutations)`` for every issue that has something to change."""
+        edits = [(issue["id"], self.mutations(issue)) for issue in issues]
+        return [(issue_id, mutations) for issue_id, mutations in edits if mutations]
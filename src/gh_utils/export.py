@@ -0,0 +1,226 @@
+import csv
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pq = None
+
+from gh_utils.exceptions import ConfigError, GhUtilsError
+from gh_utils.github_client import GitHubClient
+from gh_utils.mirror import field_value, item_row
+
+FORMATS = ("jsonl", "csv", "parquet")
+SUFFIX_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".parquet": "parquet"}
+EXPORTED_FIELD_TYPES = frozenset({"TEXT", "NUMBER", "DATE", "SINGLE_SELECT", "ITERATION"})
+ITEM_COLUMNS = (
+    "item_id", "type", "content_id", "repository", "number", "title", "state", "url", "archived", "updated_at"
+)
+MAX_PAGE_SIZE = 100
+PARQUET_ROW_GROUP_ROWS = 10_000
+
+
+def format_for(path: str | Path, fmt: str | None = None) -> str:
+    """The export format: ``fmt`` if given, else from the file suffix."""
+    fmt = fmt or SUFFIX_FORMATS.get(Path(path).suffix.lower())
+    if fmt not in FORMATS:
+        raise ConfigError(f"Cannot tell the export format of '{path}'; use a .jsonl, .csv or .parquet file name")
+    return fmt
+
+
+def checkpoint_path(path: str | Path) -> Path:
+    path = Path(path)
+    return path.with_name(f"{path.name}.checkpoint")
+
+
+def columns_for(field_nodes: list[dict]) -> list[str]:
+    """Item columns followed by one column per exportable project field."""
+    columns = list(ITEM_COLUMNS)
+    taken = {column.casefold() for column in columns}
+    for node in field_nodes:
+        if node.get("dataType") in EXPORTED_FIELD_TYPES and node["name"].casefold() not in taken:
+            columns.append(node["name"])
+            taken.add(node["name"].casefold())
+    return columns
+
+
+def flatten(item: dict) -> dict:
+    """One project item as a flat row: its item columns plus field name -> value."""
+    row = item_row(item)
+    for node in (item.get("fieldValues") or {}).get("nodes") or []:
+        value = field_value(node)
+        # The built-in Title field repeats the content title.
+        if value is not None and value[0].casefold() not in ITEM_COLUMNS:
+            row[value[0]] = value[1]
+    return row
+
+
+def iter_pages(
+    client: GitHubClient,
+    project_id: str,
+    cursor: str | None = None,
+    page_size: int = MAX_PAGE_SIZE,
+) -> Iterator[tuple[list[dict], str | None]]:
+    """Yield ``(items, end cursor)`` for each page of a project's items.
+
+    The next page is requested as soon as a page arrives, so it downloads
+    while the caller writes the current one. At most two pages are held at a
+    time, however large the project.
+    """
+
+    def _fetch(after: str | None) -> dict:
+        return client.get_project_items_page(project_id, after, page_size)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(_fetch, cursor)
+        while future is not None:
+            page = future.result()
+            info = page["pageInfo"]
+            future = executor.submit(_fetch, info["endCursor"]) if info["hasNextPage"] else None
+            yield [item for item in page["nodes"] if item], info["endCursor"]
+
+
+class _TextWriter:
+    def __init__(self, path: Path, fmt: str, columns: list[str], offset: int | None):
+        if offset is None:
+            self._file = open(path, "w", encoding="utf-8", newline="")
+        else:
+            # Drop whatever a crashed run wrote after its last checkpoint.
+            self._file = open(path, "r+", encoding="utf-8", newline="")
+            self._file.seek(offset)
+            self._file.truncate()
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(self._file, fieldnames=columns, extrasaction="ignore")
+            if offset is None:
+                self._csv.writeheader()
+
+    def write(self, rows: list[dict]) -> None:
+        if self._csv is not None:
+            self._csv.writerows(rows)
+        else:
+            self._file.writelines(json.dumps(row) + "\n" for row in rows)
+
+    def checkpoint(self) -> int:
+        """Make everything written so far durable; returns the file offset."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path, columns: list[str]):
+        if pq is None:
+            raise GhUtilsError("Writing Parquet files requires pyarrow: pip install 'gh-utils[parquet]'")
+        types = {"number": pa.int64(), "archived": pa.bool_()}
+        self._columns = columns
+        self._schema = pa.schema([(column, types.get(column, pa.string())) for column in columns])
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._buffer: list[dict] = []
+
+    def write(self, rows: list[dict]) -> None:
+        for row in rows:
+            self._buffer.append({column: row.get(column) for column in self._columns})
+        if len(self._buffer) >= PARQUET_ROW_GROUP_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            for row in self._buffer:
+                row["archived"] = bool(row["archived"])
+            self._writer.write_table(pa.Table.from_pylist(self._buffer, schema=self._schema))
+            self._buffer = []
+
+    def checkpoint(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+@dataclass
+class ExportStats:
+    rows: int
+    pages: int
+    resumed: bool = False
+
+
+def _save_checkpoint(path: Path, state: dict) -> None:
+    with tempfile.NamedTemporaryFile("w", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False) as tmp:
+        tmp.write(json.dumps(state))
+    try:
+        os.replace(tmp.name, path)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+
+
+def export_project(
+    client: GitHubClient,
+    project_id: str,
+    path: str | Path,
+    fmt: str | None = None,
+    resume: bool = False,
+    page_size: int = MAX_PAGE_SIZE,
+) -> ExportStats:
+    """Write every item of a project to ``path`` as JSONL, CSV or Parquet, one page at a time.
+
+    JSONL and CSV exports record the cursor and file offset after each page
+    in ``<path>.checkpoint``. With ``resume`` an interrupted export continues
+    from there instead of starting over. The checkpoint is removed once the
+    export completes. Parquet files cannot be appended to, so they always
+    start from the beginning.
+    """
+    path = Path(path)
+    fmt = format_for(path, fmt)
+    checkpoint = checkpoint_path(path)
+    state = None
+    if resume:
+        if fmt == "parquet":
+            raise ConfigError("Parquet exports cannot be resumed; export again from the start")
+        try:
+            state = json.loads(checkpoint.read_text())
+        except FileNotFoundError:
+            raise ConfigError(f"No unfinished export of {path} to resume") from None
+        if state["project_id"] != project_id or state["format"] != fmt:
+            raise ConfigError(f"{checkpoint} belongs to an export of another project or format")
+    elif checkpoint.exists():
+        raise ConfigError(f"{path} is an unfinished export; resume it or delete {checkpoint}")
+
+    if state is None:
+        state = {
+            "project_id": project_id,
+            "format": fmt,
+            "columns": columns_for(client.get_project_fields(project_id)),
+            "cursor": None,
+            "offset": None,
+            "rows": 0,
+        }
+    stats = ExportStats(rows=state["rows"], pages=0, resumed=state["offset"] is not None)
+    if fmt == "parquet":
+        writer = _ParquetWriter(path, state["columns"])
+    else:
+        writer = _TextWriter(path, fmt, state["columns"], state["offset"])
+    try:
+        for items, cursor in iter_pages(client, project_id, state["cursor"], page_size):
+            writer.write([flatten(item) for item in items])
+            stats.rows += len(items)
+            stats.pages += 1
+            offset = writer.checkpoint()
+            if offset is not None:
+                _save_checkpoint(checkpoint, {**state, "cursor": cursor, "offset": offset, "rows": stats.rows})
+    finally:
+        writer.close()
+    checkpoint.unlink(missing_ok=True)
+    return stats
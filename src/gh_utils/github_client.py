@@ -1,10 +1,201 @@
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote
+
 import requests
+from requests.adapters import BaseAdapter
+from urllib3.exceptions import ConnectTimeoutError
 
+from gh_utils import config
+from gh_utils import metrics as metrics_module
 from gh_utils.exceptions import GitHubAPIError
+from gh_utils.http_cache import HTTPCache, cache_key, shared_http_cache
+from gh_utils.metrics import Metrics, RequestRecord, TimedHTTPAdapter
+from gh_utils.ratelimit import RateLimiter, RateLimitState, TokenPool, resource_for_url, shared_rate_limiter
+from gh_utils.transport import transport_from_env
 
 GITHUB_API_URL = "https://api.github.com"
 GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 
+DEFAULT_POOL_SIZE = 10
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_LABEL_COLOR = "ededed"
+
+
+def _projects_query(owner_type: str) -> str:
+    return f"""
+query {owner_type.capitalize()}Projects($owner: String!, $cursor: String, $query: String) {{
+  {owner_type}(login: $owner) {{
+    projectsV2(first: 100, after: $cursor, query: $query) {{
+      nodes {{ id title }}
+      pageInfo {{ hasNextPage endCursor }}
+    }}
+  }}
+}}
+"""
+
+
+ORG_PROJECTS_QUERY = _projects_query("organization")
+USER_PROJECTS_QUERY = _projects_query("user")
+PROJECT_OWNER_QUERIES = (("organization", ORG_PROJECTS_QUERY), ("user", USER_PROJECTS_QUERY))
+
+ADD_TO_PROJECT_MUTATION = """
+mutation AddToProject($projectId: ID!, $contentId: ID!) {
+  addProjectV2ItemById(input: {projectId: $projectId, contentId: $contentId}) {
+    item {
+      id
+    }
+  }
+}
+"""
+
+REPOSITORY_QUERY = """
+query Repository($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100, after: $cursor) {
+      nodes { id name }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+CREATE_ISSUE_IN_PROJECT_MUTATION = """
+mutation CreateIssueInProject($repositoryId: ID!, $title: String!, $body: String, $labelIds: [ID!], $projectIds: [ID!]) {
+  createIssue(input: {
+    repositoryId: $repositoryId, title: $title, body: $body, labelIds: $labelIds, projectV2Ids: $projectIds
+  }) {
+    issue {
+      id
+      number
+      url
+      projectItems(first: 20) { nodes { id project { id } } }
+    }
+  }
+}
+"""
+
+
+PROJECT_FIELDS_QUERY = """
+query ProjectFields($projectId: ID!, $cursor: String) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      fields(first: 100, after: $cursor) {
+        nodes {
+          ... on ProjectV2FieldCommon { id name dataType }
+          ... on ProjectV2SingleSelectField { options { id name } }
+          ... on ProjectV2IterationField {
+            configuration {
+              iterations { id title }
+              completedIterations { id title }
+            }
+          }
+        }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+"""
+
+PROJECT_ITEM_FIELDS = """
+fragment ProjectItemFields on ProjectV2Item {
+  id
+  type
+  updatedAt
+  isArchived
+  content {
+    ... on Issue { id number title state url repository { nameWithOwner } }
+    ... on PullRequest { id number title state url repository { nameWithOwner } }
+    ... on DraftIssue { id title }
+  }
+  fieldValues(first: 50) {
+    nodes {
+      ... on ProjectV2ItemFieldTextValue { text field { ... on ProjectV2FieldCommon { name } } }
+      ... on ProjectV2ItemFieldNumberValue { number field { ... on ProjectV2FieldCommon { name } } }
+      ... on ProjectV2ItemFieldDateValue { date field { ... on ProjectV2FieldCommon { name } } }
+      ... on ProjectV2ItemFieldSingleSelectValue { name field { ... on ProjectV2FieldCommon { name } } }
+      ... on ProjectV2ItemFieldIterationValue { title field { ... on ProjectV2FieldCommon { name } } }
+    }
+  }
+}
+"""
+
+PROJECT_ITEM_STAMPS_QUERY = """
+query ProjectItemStamps($projectId: ID!, $cursor: String) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      items(first: 100, after: $cursor) {
+        nodes { id updatedAt }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+"""
+
+PROJECT_ITEM_DETAILS_QUERY = """
+query ProjectItemDetails($ids: [ID!]!) {
+  nodes(ids: $ids) { ...ProjectItemFields }
+}
+""" + PROJECT_ITEM_FIELDS
+
+PROJECT_ITEMS_QUERY = """
+query ProjectItems($projectId: ID!, $first: Int!, $cursor: String) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      items(first: $first, after: $cursor) {
+        nodes { ...ProjectItemFields }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+""" + PROJECT_ITEM_FIELDS
+
+ISSUE_REF_FIELDS = "... on Issue { id number repository { nameWithOwner } }"
+
+SEARCH_ISSUES_QUERY = """
+query SearchIssues($query: String!, $cursor: String) {
+  search(type: ISSUE, query: $query, first: 100, after: $cursor) {
+    nodes { %s }
+    pageInfo { hasNextPage endCursor }
+  }
+}
+""" % ISSUE_REF_FIELDS
+
+ISSUE_REFS_QUERY = """
+query IssueRefs($ids: [ID!]!) {
+  nodes(ids: $ids) { %s }
+}
+""" % ISSUE_REF_FIELDS
+
+MILESTONES_QUERY = """
+query Milestones($owner: String!, $name: String!, $query: String) {
+  repository(owner: $owner, name: $name) {
+    milestones(first: 100, query: $query) { nodes { id title } }
+  }
+}
+"""
+
+# Input type of each mutation ``edit_issues`` can send.
+ISSUE_MUTATION_INPUTS = {
+    "addLabelsToLabelable": "AddLabelsToLabelableInput",
+    "removeLabelsFromLabelable": "RemoveLabelsFromLabelableInput",
+    "addAssigneesToAssignable": "AddAssigneesToAssignableInput",
+    "removeAssigneesFromAssignable": "RemoveAssigneesFromAssignableInput",
+    "closeIssue": "CloseIssueInput",
+    "reopenIssue": "ReopenIssueInput",
+    "updateIssue": "UpdateIssueInput",
+}
+
+# GitHub resolves at most this many IDs in one ``nodes(ids:)`` lookup.
+MAX_NODE_IDS = 100
+
 
 def _auth_headers(token: str) -> dict[str, str]:
     return {
@@ -24,6 +215,697 @@ def _handle_response(response: requests.Response) -> dict:
     return response.json()
 
 
+def _raise_for_graphql_errors(data: dict) -> None:
+    if "errors" in data:
+        error_messages = "; ".join(e["message"] for e in data["errors"])
+        raise GitHubAPIError(f"GraphQL error: {error_messages}")
+
+
+def _projects_page(data: dict, owner_type: str) -> dict | None:
+    """Return the ``projectsV2`` connection, or ``None`` if the owner is not of this type."""
+    owner_data = (data.get("data") or {}).get(owner_type)
+    if owner_data is None and all(e.get("type") == "NOT_FOUND" for e in data.get("errors", [])):
+        return None
+    _raise_for_graphql_errors(data)
+    return owner_data["projectsV2"]
+
+
+def _endpoint(method: str, url: str, kwargs: dict) -> str:
+    """Name a request for metrics: the REST route, or the GraphQL operation name."""
+    if url.endswith("/graphql"):
+        return metrics_module.graphql_endpoint(kwargs["json"]["query"])
+    return metrics_module.rest_endpoint(method, url)
+
+
+def _with_token(token: str, token_pool: TokenPool | None, resource: str, kwargs: dict) -> tuple[str, dict]:
+    """Pick the token for one attempt, and the request arguments that send it."""
+    if token_pool is None:
+        return token, kwargs
+    token = token_pool.choose(resource)
+    headers = {**(kwargs.get("headers") or {}), "Authorization": f"Bearer {token}"}
+    return token, {**kwargs, "headers": headers}
+
+
+@dataclass
+class ItemResult:
+    """Outcome of one item in a batched GraphQL mutation."""
+
+    content_id: str
+    item_id: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _build_aliased_mutation(name: str, variable_defs: list[str], fields: list[str]) -> str:
+    return f"mutation {name}(" + ", ".join(variable_defs) + ") {\n  " + "\n  ".join(fields) + "\n}"
+
+
+def _errors_by_alias(data: dict) -> tuple[dict[str, str], str | None]:
+    """Split GraphQL ``errors`` into per-alias messages and a message for the rest."""
+    by_alias: dict[str, list[str]] = {}
+    general: list[str] = []
+    for error in data.get("errors", []):
+        path = error.get("path")
+        if path:
+            by_alias.setdefault(path[0], []).append(error["message"])
+        else:
+            general.append(error["message"])
+    return (
+        {alias: "; ".join(messages) for alias, messages in by_alias.items()},
+        "; ".join(general) or None,
+    )
+
+
+def _connect_failed(error: requests.RequestException) -> bool:
+    """Whether a request failed before reaching GitHub, so it cannot have taken effect."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    # requests wraps urllib3's error; NewConnectionError (refused, DNS) subclasses ConnectTimeoutError.
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, ConnectTimeoutError)
+
+
+class GitHubClient:
+    """GitHub REST/GraphQL client that reuses one pooled keep-alive session.
+
+    Create one per token and share it between calls (and threads) so requests
+    reuse open TCP+TLS connections instead of handshaking every time.
+
+    Every request goes through ``rate_limiter``, which paces calls against the
+    token's remaining budget and retries rate-limited (403/429), server error
+    (5xx) and connection failures with backoff. Clients share one limiter by
+    default, so budgets are tracked per token across the whole process.
+    Requests that create something are sent with ``idempotent=False``. GitHub
+    may have acted on those before a 5xx or a dropped connection, so they are
+    retried only on rate limits and failures to connect.
+
+    With an ``http_cache``, REST GETs are sent as conditional requests and a
+    ``304 Not Modified`` is answered from the cache; GitHub does not count 304s
+    against the rate limit. GraphQL has no validators and is never cached.
+
+    Each attempt is timed into ``metrics`` when given, or else into the
+    process-wide collector while :func:`gh_utils.metrics.enable` is in effect.
+
+    ``api_url`` and ``graphql_url`` point the client at GitHub Enterprise
+    Server or a local stand-in such as ``benchmarks/mock_server.py``.
+
+    With a ``token_pool``, each request is sent with the pool's token that has
+    the most budget left instead of ``token``. A request that hits a rate limit
+    moves to another token rather than waiting out the window, and one whose
+    token is rejected (401) is retried with the next.
+
+    ``transport`` replaces the session's default connection adapter, e.g. with
+    a :class:`gh_utils.transport.RecordingAdapter` or
+    :class:`~gh_utils.transport.ReplayAdapter`.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: bool = True,
+        timeout: float | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http_cache: HTTPCache | None = None,
+        metrics: Metrics | None = None,
+        api_url: str = GITHUB_API_URL,
+        graphql_url: str | None = None,
+        token_pool: TokenPool | None = None,
+        transport: BaseAdapter | None = None,
+    ):
+        self.token = token
+        self.token_pool = token_pool
+        self.api_url = api_url.rstrip("/")
+        self.graphql_url = graphql_url or f"{self.api_url}/graphql"
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self.http_cache = http_cache
+        self.metrics = metrics
+        self.session = requests.Session()
+        adapter = transport or TimedHTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(_auth_headers(token))
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def rate_limit_state(self) -> dict[str, RateLimitState]:
+        return self.rate_limiter.state()
+
+    def _request(self, method: str, url: str, idempotent: bool = True, **kwargs) -> requests.Response:
+        send = getattr(self.session, method.lower())
+        resource = resource_for_url(url)
+        metrics = self.metrics or metrics_module.active()
+        attempt = 0
+        while True:
+            token, send_kwargs = _with_token(self.token, self.token_pool, resource, kwargs)
+            self.rate_limiter.wait(token, resource)
+            metrics_module.take_connect_seconds()
+            start = time.perf_counter()
+            try:
+                response = send(url, timeout=self.timeout, **send_kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if metrics:
+                    self._observe(metrics, method, url, kwargs, None, time.perf_counter() - start, attempt)
+                if not (idempotent or _connect_failed(e)):
+                    raise
+                delay = self.rate_limiter.retry_delay(token, attempt, None)
+                if delay is None:
+                    raise
+            else:
+                if metrics:
+                    self._observe(metrics, method, url, kwargs, response, time.perf_counter() - start, attempt)
+                self.rate_limiter.record(token, resource, response.headers)
+                if response.ok:
+                    return response
+                if response.status_code == 401 and self.token_pool and self.token_pool.revoke(token):
+                    attempt += 1
+                    continue
+                if not idempotent and response.status_code not in (403, 429):
+                    return response
+                delay = self.rate_limiter.retry_delay(
+                    token, attempt, response.status_code, response.headers, response.text
+                )
+                if delay is None:
+                    return response
+                if self.token_pool and response.status_code in (403, 429):
+                    # Another token may still have budget; the next wait() paces it.
+                    delay = min(delay, self.token_pool.delay(resource))
+            self.rate_limiter.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _observe(
+        metrics: Metrics,
+        method: str,
+        url: str,
+        kwargs: dict,
+        response: requests.Response | None,
+        seconds: float,
+        attempt: int,
+    ) -> None:
+        record = RequestRecord(
+            _endpoint(method, url, kwargs),
+            status=None,
+            seconds=seconds,
+            connect_seconds=metrics_module.take_connect_seconds(),
+            attempt=attempt,
+        )
+        if response is not None:
+            body = response.request.body if response.request is not None else None
+            record.status = response.status_code
+            record.headers_seconds = response.elapsed.total_seconds()
+            record.bytes_sent = len(body or b"")
+            record.bytes_received = len(response.content or b"")
+            record.rate_limit_resource, record.rate_limit_remaining = metrics_module.rate_limit_fields(
+                response.headers
+            )
+        metrics.record(record)
+
+    def _post(self, url: str, payload: dict, idempotent: bool = True) -> dict:
+        return _handle_response(self._request("POST", url, idempotent=idempotent, json=payload))
+
+    def _get(self, url: str, params: dict | None = None) -> requests.Response:
+        cached = key = None
+        headers = {}
+        if self.http_cache is not None:
+            key = cache_key(self.token, url, params)
+            cached = self.http_cache.get(key)
+            headers = cached.conditional_headers() if cached else {}
+        response = self._request("GET", url, params=params, headers=headers)
+        if response.status_code == 304:
+            if cached is None:
+                # Only possible when replaying a recording made with a warm cache.
+                raise GitHubAPIError(f"GitHub answered 304 Not Modified for {url}, but nothing is cached", 304)
+            return cached.to_response(response)
+        if self.http_cache is not None and response.ok:
+            self.http_cache.put(key, response)
+        return response
+
+    def _paginate(self, url: str, params: dict | None = None) -> Iterator[dict]:
+        """Yield every item of a paginated REST list, following ``Link: rel="next"``."""
+        params = {"per_page": 100, **(params or {})}
+        while url:
+            response = self._get(url, params)
+            yield from _handle_response(response)
+            url = response.links.get("next", {}).get("url")
+            params = None  # the next link already carries the query string
+
+    def graphql(self, query: str, variables: dict | None = None, idempotent: bool = True) -> dict:
+        data = self._post(self.graphql_url, {"query": query, "variables": variables or {}}, idempotent)
+        _raise_for_graphql_errors(data)
+        return data
+
+    def create_issue(
+        self,
+        owner: str,
+        repo: str,
+        title: str,
+        body: str,
+        labels: list[str] | None = None,
+    ) -> dict:
+        url = f"{self.api_url}/repos/{owner}/{repo}/issues"
+        payload: dict = {"title": title, "body": body}
+        if labels:
+            payload["labels"] = labels
+        return self._post(url, payload, idempotent=False)
+
+    def list_issues(self, owner: str, repo: str, since: str | None = None) -> Iterator[dict]:
+        """Yield all issues of a repository (open and closed, pull requests excluded).
+
+        ``since`` is an ISO 8601 timestamp; only issues updated at or after it are returned.
+        """
+        params = {"state": "all", "sort": "updated", "direction": "asc"}
+        if since:
+            params["since"] = since
+        for issue in self._paginate(f"{self.api_url}/repos/{owner}/{repo}/issues", params):
+            if "pull_request" not in issue:
+                yield issue
+
+    def list_labels(self, owner: str, repo: str) -> Iterator[dict]:
+        """Yield every label of a repository (``name``, ``node_id``, ``color``, ...)."""
+        yield from self._paginate(f"{self.api_url}/repos/{owner}/{repo}/labels")
+
+    def get_label(self, owner: str, repo: str, name: str) -> dict:
+        return _handle_response(self._get(f"{self.api_url}/repos/{owner}/{repo}/labels/{quote(name, safe='')}"))
+
+    def create_label(
+        self,
+        owner: str,
+        repo: str,
+        name: str,
+        color: str = DEFAULT_LABEL_COLOR,
+        description: str | None = None,
+    ) -> dict:
+        payload = {"name": name, "color": color}
+        if description:
+            payload["description"] = description
+        return self._post(f"{self.api_url}/repos/{owner}/{repo}/labels", payload, idempotent=False)
+
+    def _iter_projects(self, owner: str, query: str | None = None) -> Iterator[dict]:
+        """Yield ``{id, title}`` project nodes of an organization or, failing that, a user.
+
+        ``query`` is passed to GitHub as a server-side filter on ``projectsV2``.
+        """
+        for owner_type, graphql_query in PROJECT_OWNER_QUERIES:
+            cursor = None
+            while True:
+                data = self._post(
+                    self.graphql_url,
+                    {"query": graphql_query, "variables": {"owner": owner, "cursor": cursor, "query": query}},
+                )
+                page = _projects_page(data, owner_type)
+                if page is None:
+                    break
+                yield from page["nodes"]
+
+                if not page["pageInfo"]["hasNextPage"]:
+                    return
+                cursor = page["pageInfo"]["endCursor"]
+        raise GitHubAPIError(f"No organization or user named '{owner}'")
+
+    def list_projects(self, owner: str) -> dict[str, str]:
+        """Page through every Projects V2 board of ``owner``; returns title -> node ID."""
+        projects: dict[str, str] = {}
+        for node in self._iter_projects(owner):
+            projects.setdefault(node["title"], node["id"])
+        return projects
+
+    def find_project_id_by_title(self, owner: str, title: str) -> str:
+        # The server-side filter is a fuzzy match, so still compare titles exactly.
+        for node in self._iter_projects(owner, query=title):
+            if node["title"] == title:
+                return node["id"]
+
+        raise GitHubAPIError(f"Project with title '{title}' not found for owner '{owner}'")
+
+    def add_to_project(self, project_id: str, issue_node_id: str) -> dict:
+        return self.graphql(
+            ADD_TO_PROJECT_MUTATION,
+            {"projectId": project_id, "contentId": issue_node_id},
+        )
+
+    def get_repository(self, owner: str, repo: str) -> dict:
+        """Resolve a repository's node ID and its label name -> node ID map in one query."""
+        labels: dict[str, str] = {}
+        cursor = None
+        while True:
+            data = self.graphql(REPOSITORY_QUERY, {"owner": owner, "name": repo, "cursor": cursor})
+
+            repository = data["data"]["repository"]
+            page = repository["labels"]
+            labels.update((node["name"], node["id"]) for node in page["nodes"])
+
+            if not page["pageInfo"]["hasNextPage"]:
+                return {"id": repository["id"], "labels": labels}
+            cursor = page["pageInfo"]["endCursor"]
+
+    def create_issue_in_project(
+        self,
+        repository_id: str,
+        project_id: str,
+        title: str,
+        body: str,
+        label_ids: list[str] | None = None,
+    ) -> dict:
+        """Create an issue already placed on a project, in a single GraphQL request.
+
+        Returns the same keys as the REST ``create_issue`` response that the CLI
+        relies on, plus ``item_id`` for the new project item.
+        """
+        data = self.graphql(
+            CREATE_ISSUE_IN_PROJECT_MUTATION,
+            {
+                "repositoryId": repository_id,
+                "title": title,
+                "body": body,
+                "labelIds": label_ids or None,
+                "projectIds": [project_id],
+            },
+            idempotent=False,
+        )
+        issue = data["data"]["createIssue"]["issue"]
+        item_id = next(
+            (node["id"] for node in issue["projectItems"]["nodes"] if node["project"]["id"] == project_id),
+            None,
+        )
+        return {
+            "number": issue["number"],
+            "html_url": issue["url"],
+            "node_id": issue["id"],
+            "item_id": item_id,
+        }
+
+    def _add_batch_to_project(self, project_id: str, content_ids: list[str]) -> list[ItemResult]:
+        variable_defs = ["$projectId: ID!"]
+        fields = []
+        variables = {"projectId": project_id}
+        for i, content_id in enumerate(content_ids):
+            variable_defs.append(f"$c{i}: ID!")
+            fields.append(
+                f"a{i}: addProjectV2ItemById(input: {{projectId: $projectId, contentId: $c{i}}}) "
+                "{ item { id } }"
+            )
+            variables[f"c{i}"] = content_id
+
+        query = _build_aliased_mutation("AddManyToProject", variable_defs, fields)
+        try:
+            data = self._post(self.graphql_url, {"query": query, "variables": variables})
+        except (GitHubAPIError, requests.RequestException) as e:
+            return [ItemResult(content_id, error=str(e)) for content_id in content_ids]
+
+        errors, general_error = _errors_by_alias(data)
+        payloads = data.get("data") or {}
+        results = []
+        for i, content_id in enumerate(content_ids):
+            payload = payloads.get(f"a{i}")
+            if payload and payload.get("item"):
+                results.append(ItemResult(content_id, item_id=payload["item"]["id"]))
+            else:
+                error = errors.get(f"a{i}") or general_error or "No item returned"
+                results.append(ItemResult(content_id, error=error))
+        return results
+
+    def _edit_batch(self, edits: list[tuple[str, list[tuple[str, dict]]]]) -> list[ItemResult]:
+        variable_defs = []
+        fields = []
+        variables = {}
+        owners = {}
+        for i, (issue_id, mutations) in enumerate(edits):
+            for k, (mutation, mutation_input) in enumerate(mutations):
+                alias = f"e{i}_{k}"
+                variable_defs.append(f"${alias}: {ISSUE_MUTATION_INPUTS[mutation]}!")
+                fields.append(f"{alias}: {mutation}(input: ${alias}) {{ clientMutationId }}")
+                variables[alias] = mutation_input
+                owners[alias] = i
+
+        query = _build_aliased_mutation("EditIssues", variable_defs, fields)
+        try:
+            data = self._post(self.graphql_url, {"query": query, "variables": variables})
+        except (GitHubAPIError, requests.RequestException) as e:
+            return [ItemResult(issue_id, error=str(e)) for issue_id, _ in edits]
+
+        errors_by_alias, general_error = _errors_by_alias(data)
+        payloads = data.get("data") or {}
+        errors: dict[int, list[str]] = {}
+        for alias, i in owners.items():
+            if payloads.get(alias) is None:
+                errors.setdefault(i, []).append(errors_by_alias.get(alias) or general_error or "No result returned")
+        return [
+            ItemResult(issue_id, error="; ".join(errors[i]) if i in errors else None)
+            for i, (issue_id, _) in enumerate(edits)
+        ]
+
+    def edit_issues(
+        self,
+        edits: list[tuple[str, list[tuple[str, dict]]]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[ItemResult]:
+        """Apply mutations to many issues with aliased GraphQL requests.
+
+        ``edits`` are ``(issue ID, [(mutation, input)])`` pairs, the mutations
+        being keys of :data:`ISSUE_MUTATION_INPUTS`. Each request carries the
+        mutations of up to ``batch_size`` issues. As with
+        :meth:`add_many_to_project`, failures are reported per issue and do
+        not stop the remaining ones.
+        """
+        results = []
+        for batch in _chunks(edits, batch_size):
+            results.extend(self._edit_batch(batch))
+        return results
+
+    def add_many_to_project(
+        self,
+        project_id: str,
+        issue_node_ids: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fields: list[tuple[str, dict]] | None = None,
+    ) -> list[ItemResult]:
+        """Add many issues using aliased ``addProjectV2ItemById`` mutations.
+
+        Each request carries up to ``batch_size`` adds. Failures are reported
+        per item; a failed item or request does not stop the remaining ones.
+
+        ``fields`` are ``(field ID, ProjectV2FieldValue)`` pairs set on every
+        added item. GraphQL cannot feed an add's item ID into another mutation
+        of the same document, so each batch of adds is followed by aliased
+        field updates for the whole batch. An item whose fields failed keeps
+        its ``item_id`` and also carries the ``error``.
+        """
+        results = []
+        for batch in _chunks(list(issue_node_ids), batch_size):
+            added = self._add_batch_to_project(project_id, batch)
+            if fields:
+                item_ids = [result.item_id for result in added if result.ok]
+                errors = self.set_item_fields(project_id, item_ids, fields, batch_size)
+                for result in added:
+                    if result.item_id in errors:
+                        result.error = f"Setting fields failed: {errors[result.item_id]}"
+            results.extend(added)
+        return results
+
+    def get_project_fields(self, project_id: str) -> list[dict]:
+        """Return a project's field nodes: ``id``, ``name``, ``dataType`` and options or iterations."""
+        fields = []
+        cursor = None
+        while True:
+            data = self.graphql(PROJECT_FIELDS_QUERY, {"projectId": project_id, "cursor": cursor})
+            node = data["data"]["node"]
+            if not node or "fields" not in node:
+                raise GitHubAPIError(f"No Project V2 with ID '{project_id}'")
+            page = node["fields"]
+            fields.extend(field for field in page["nodes"] if field)
+
+            if not page["pageInfo"]["hasNextPage"]:
+                return fields
+            cursor = page["pageInfo"]["endCursor"]
+
+    def iter_project_item_stamps(self, project_id: str) -> Iterator[dict]:
+        """Yield ``{"id", "updatedAt"}`` for every item of a project, 100 per request.
+
+        This is the cheap half of an incremental sync: compare the stamps with
+        a local copy, then fetch only the changed items with
+        :meth:`get_project_items`.
+        """
+        cursor = None
+        while True:
+            data = self.graphql(PROJECT_ITEM_STAMPS_QUERY, {"projectId": project_id, "cursor": cursor})
+            node = data["data"]["node"]
+            if not node or "items" not in node:
+                raise GitHubAPIError(f"No Project V2 with ID '{project_id}'")
+            page = node["items"]
+            yield from (item for item in page["nodes"] if item)
+
+            if not page["pageInfo"]["hasNextPage"]:
+                return
+            cursor = page["pageInfo"]["endCursor"]
+
+    def get_project_items_page(self, project_id: str, cursor: str | None = None, page_size: int = 100) -> dict:
+        """Return one page of a project's items with content and field values.
+
+        The result is the ``items`` connection: ``nodes`` and ``pageInfo``.
+        """
+        data = self.graphql(PROJECT_ITEMS_QUERY, {"projectId": project_id, "first": page_size, "cursor": cursor})
+        node = data["data"]["node"]
+        if not node or "items" not in node:
+            raise GitHubAPIError(f"No Project V2 with ID '{project_id}'")
+        return node["items"]
+
+    def get_project_items(self, item_ids: list[str]) -> list[dict]:
+        """Fetch project items with their content and field values, :data:`MAX_NODE_IDS` per request.
+
+        Items deleted in the meantime are left out.
+        """
+        return self._nodes(PROJECT_ITEM_DETAILS_QUERY, item_ids)
+
+    def _nodes(self, query: str, node_ids: Iterable[str]) -> list[dict]:
+        """Look up nodes by ID, :data:`MAX_NODE_IDS` per request, leaving out the ones not found."""
+        nodes = []
+        for batch in _chunks(list(node_ids), MAX_NODE_IDS):
+            data = self._post(self.graphql_url, {"query": query, "variables": {"ids": batch}})
+            if any(error.get("type") != "NOT_FOUND" for error in data.get("errors", [])):
+                _raise_for_graphql_errors(data)
+            # Nodes of another type match no fragment and come back empty.
+            nodes.extend(node for node in (data.get("data") or {}).get("nodes") or [] if node)
+        return nodes
+
+    def search_issues(self, query: str) -> Iterator[dict]:
+        """Yield ``id``, ``number`` and ``repository`` of each issue matching a search query.
+
+        Pull requests matching the query are skipped. GitHub returns at most
+        1,000 results for one search.
+        """
+        cursor = None
+        while True:
+            data = self.graphql(SEARCH_ISSUES_QUERY, {"query": query, "cursor": cursor})
+            page = data["data"]["search"]
+            yield from (node for node in page["nodes"] if node)
+
+            if not page["pageInfo"]["hasNextPage"]:
+                return
+            cursor = page["pageInfo"]["endCursor"]
+
+    def get_issue_refs(self, issue_node_ids: Iterable[str]) -> list[dict]:
+        """``id``, ``number`` and ``repository`` of the given issues; unknown IDs are left out."""
+        return self._nodes(ISSUE_REFS_QUERY, issue_node_ids)
+
+    def get_user_ids(self, logins: Iterable[str]) -> dict[str, str]:
+        """Map logins to user node IDs in one request; unknown logins are left out."""
+        logins = list(dict.fromkeys(logins))
+        if not logins:
+            return {}
+        variable_defs = [f"$l{i}: String!" for i in range(len(logins))]
+        fields = [f"u{i}: user(login: $l{i}) {{ id login }}" for i in range(len(logins))]
+        query = "query Users(" + ", ".join(variable_defs) + ") {\n  " + "\n  ".join(fields) + "\n}"
+        data = self._post(self.graphql_url, {
+            "query": query, "variables": {f"l{i}": login for i, login in enumerate(logins)},
+        })
+        if any(error.get("type") != "NOT_FOUND" for error in data.get("errors", [])):
+            _raise_for_graphql_errors(data)
+        users = (data.get("data") or {}).values()
+        return {user["login"]: user["id"] for user in users if user}
+
+    def get_milestone_id(self, owner: str, repo: str, title: str) -> str | None:
+        """Node ID of the repository's milestone with exactly this title, or ``None``."""
+        data = self.graphql(MILESTONES_QUERY, {"owner": owner, "name": repo, "query": title})
+        repository = data["data"]["repository"]
+        for milestone in repository["milestones"]["nodes"] if repository else []:
+            if milestone["title"] == title:
+                return milestone["id"]
+        return None
+
+    def _set_fields_batch(self, project_id: str, updates: list[tuple[str, str, dict]]) -> dict[str, str]:
+        variable_defs = ["$projectId: ID!"]
+        fields = []
+        variables: dict = {"projectId": project_id}
+        for i, (item_id, field_id, value) in enumerate(updates):
+            variable_defs += [f"$i{i}: ID!", f"$f{i}: ID!", f"$v{i}: ProjectV2FieldValue!"]
+            fields.append(
+                f"u{i}: updateProjectV2ItemFieldValue(input: "
+                f"{{projectId: $projectId, itemId: $i{i}, fieldId: $f{i}, value: $v{i}}}) "
+                "{ projectV2Item { id } }"
+            )
+            variables.update({f"i{i}": item_id, f"f{i}": field_id, f"v{i}": value})
+
+        query = _build_aliased_mutation("SetItemFields", variable_defs, fields)
+        try:
+            data = self._post(self.graphql_url, {"query": query, "variables": variables})
+        except (GitHubAPIError, requests.RequestException) as e:
+            return {item_id: str(e) for item_id, _, _ in updates}
+
+        errors_by_alias, general_error = _errors_by_alias(data)
+        payloads = data.get("data") or {}
+        errors: dict[str, list[str]] = {}
+        for i, (item_id, _, _) in enumerate(updates):
+            if not payloads.get(f"u{i}"):
+                error = errors_by_alias.get(f"u{i}") or general_error or "No item returned"
+                errors.setdefault(item_id, []).append(error)
+        return {item_id: "; ".join(messages) for item_id, messages in errors.items()}
+
+    def set_item_fields(
+        self,
+        project_id: str,
+        item_ids: Iterable[str],
+        fields: list[tuple[str, dict]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> dict[str, str]:
+        """Set ``fields`` on every item with aliased ``updateProjectV2ItemFieldValue`` mutations.
+
+        ``fields`` are ``(field ID, ProjectV2FieldValue)`` pairs; each request
+        carries up to ``batch_size`` updates. Returns item ID -> error for the
+        items where any update failed.
+        """
+        updates = [(item_id, field_id, value) for item_id in item_ids for field_id, value in fields]
+        errors: dict[str, str] = {}
+        for batch in _chunks(updates, batch_size):
+            for item_id, error in self._set_fields_batch(project_id, batch).items():
+                errors[item_id] = f"{errors[item_id]}; {error}" if item_id in errors else error
+        return errors
+
+
+_clients: dict[tuple[str, str, str, Path | None, Path | None], GitHubClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(token: str) -> GitHubClient:
+    """Return the process-wide shared client for ``token``, creating it on first use.
+
+    The API endpoints come from ``GITHUB_API_URL`` / ``GITHUB_GRAPHQL_URL``,
+    and ``GH_UTILS_RECORD`` / ``GH_UTILS_REPLAY`` pick a recording or
+    replaying transport.
+    """
+    key = (
+        token, config.get_api_url(), config.get_graphql_url(), config.get_record_path(), config.get_replay_path()
+    )
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            transport = transport_from_env(DEFAULT_POOL_SIZE)
+            # Recordings must not depend on the local cache, or replays elsewhere diverge.
+            client = _clients[key] = GitHubClient(
+                token, http_cache=None if transport else shared_http_cache(), api_url=key[1], graphql_url=key[2],
+                transport=transport,
+            )
+        return client
+
+
 def create_issue(
     token: str,
     owner: str,
@@ -32,78 +914,98 @@ def create_issue(
     body: str,
     labels: list[str] | None = None,
 ) -> dict:
-    url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues"
-    payload: dict = {"title": title, "body": body}
-    if labels:
-        payload["labels"] = labels
+    return get_client(token).create_issue(owner, repo, title, body, labels)
 
-    response = requests.post(url, json=payload, headers=_auth_headers(token))
-    return _handle_response(response)
 
+def list_issues(token: str, owner: str, repo: str, since: str | None = None) -> Iterator[dict]:
+    return get_client(token).list_issues(owner, repo, since)
 
-def find_project_id_by_title(token: str, owner: str, title: str) -> str:
-    query = """
-    query($owner: String!, $cursor: String) {
-      organization(login: $owner) {
-        projectsV2(first: 100, after: $cursor) {
-          nodes { id title }
-          pageInfo { hasNextPage endCursor }
-        }
-      }
-    }
-    """
-    cursor = None
-    while True:
-        payload = {
-            "query": query,
-            "variables": {"owner": owner, "cursor": cursor},
-        }
-        response = requests.post(
-            GITHUB_GRAPHQL_URL, json=payload, headers=_auth_headers(token)
-        )
-        data = _handle_response(response)
 
-        if "errors" in data:
-            error_messages = "; ".join(e["message"] for e in data["errors"])
-            raise GitHubAPIError(f"GraphQL error: {error_messages}")
+def list_labels(token: str, owner: str, repo: str) -> Iterator[dict]:
+    return get_client(token).list_labels(owner, repo)
+
+
+def create_label(
+    token: str,
+    owner: str,
+    repo: str,
+    name: str,
+    color: str = DEFAULT_LABEL_COLOR,
+    description: str | None = None,
+) -> dict:
+    return get_client(token).create_label(owner, repo, name, color, description)
 
-        projects = data["data"]["organization"]["projectsV2"]
-        for node in projects["nodes"]:
-            if node["title"] == title:
-                return node["id"]
 
-        if not projects["pageInfo"]["hasNextPage"]:
-            break
-        cursor = projects["pageInfo"]["endCursor"]
+def find_project_id_by_title(token: str, owner: str, title: str) -> str:
+    return get_client(token).find_project_id_by_title(owner, title)
+
 
-    raise GitHubAPIError(f"Project with title '{title}' not found in org '{owner}'")
+def list_projects(token: str, owner: str) -> dict[str, str]:
+    return get_client(token).list_projects(owner)
 
 
 def add_to_project(token: str, project_id: str, issue_node_id: str) -> dict:
-    query = """
-    mutation($projectId: ID!, $contentId: ID!) {
-      addProjectV2ItemById(input: {projectId: $projectId, contentId: $contentId}) {
-        item {
-          id
-        }
-      }
-    }
-    """
-    payload = {
-        "query": query,
-        "variables": {
-            "projectId": project_id,
-            "contentId": issue_node_id,
-        },
-    }
+    return get_client(token).add_to_project(project_id, issue_node_id)
 
-    response = requests.post(
-        GITHUB_GRAPHQL_URL, json=payload, headers=_auth_headers(token)
-    )
-    data = _handle_response(response)
 
-    if "errors" in data:
-        error_messages = "; ".join(e["message"] for e in data["errors"])
-        raise GitHubAPIError(f"GraphQL error: {error_messages}")
+def get_repository(token: str, owner: str, repo: str) -> dict:
+    return get_client(token).get_repository(owner, repo)
+
 
-    return data
+def create_issue_in_project(
+    token: str,
+    repository_id: str,
+    project_id: str,
+    title: str,
+    body: str,
+    label_ids: list[str] | None = None,
+) -> dict:
+    return get_client(token).create_issue_in_project(repository_id, project_id, title, body, label_ids)
+
+
+def add_many_to_project(
+    token: str,
+    project_id: str,
+    issue_node_ids: Iterable[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    fields: list[tuple[str, dict]] | None = None,
+) -> list[ItemResult]:
+    return get_client(token).add_many_to_project(project_id, issue_node_ids, batch_size, fields)
+
+
+def get_project_fields(token: str, project_id: str) -> list[dict]:
+    return get_client(token).get_project_fields(project_id)
+
+
+def set_item_fields(
+    token: str,
+    project_id: str,
+    item_ids: Iterable[str],
+    fields: list[tuple[str, dict]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[str, str]:
+    return get_client(token).set_item_fields(project_id, item_ids, fields, batch_size)
+
+
+def iter_project_item_stamps(token: str, project_id: str) -> Iterator[dict]:
+    return get_client(token).iter_project_item_stamps(project_id)
+
+
+def get_project_items_page(token: str, project_id: str, cursor: str | None = None, page_size: int = 100) -> dict:
+    return get_client(token).get_project_items_page(project_id, cursor, page_size)
+
+
+def get_project_items(token: str, item_ids: list[str]) -> list[dict]:
+    return get_client(token).get_project_items(item_ids)
+
+
+def search_issues(token: str, query: str) -> Iterator[dict]:
+    return get_client(token).search_issues(query)
+
+
+def edit_issues(
+    token: str,
+    edits: list[tuple[str, list[tuple[str, dict]]]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[ItemResult]:
+    return get_client(token).edit_issues(edits, batch_size)
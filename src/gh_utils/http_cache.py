@@ -0,0 +1,142 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+
+from gh_utils import config
+from gh_utils.ratelimit import token_id
+
+CACHE_FILE_NAME = "http-cache.sqlite"
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+# Response headers kept with the body; everything else is taken from the 304.
+STORED_HEADERS = ("Content-Type", "Link", "ETag", "Last-Modified")
+
+
+def cache_key(token: str, url: str, params: dict | None = None) -> str:
+    """Key a GET by token, URL and query, so private data never crosses tokens."""
+    query = json.dumps(sorted((params or {}).items()))
+    return hashlib.sha256(f"{token_id(token)} {url} {query}".encode()).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    etag: str | None
+    last_modified: str | None
+    headers: dict[str, str]
+    body: bytes
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, not_modified: requests.Response) -> requests.Response:
+        """Rebuild a 200 response from the cache, keeping the 304's fresh headers."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.headers.update(self.headers)
+        response.headers.update(not_modified.headers)
+        response._content = self.body
+        response.encoding = "utf-8"
+        return response
+
+
+class HTTPCache:
+    """On-disk LRU cache of GET responses for conditional requests.
+
+    Stores the ``ETag``/``Last-Modified`` validators and body of each response
+    in SQLite. Entries are evicted least-recently-used first once the stored
+    bodies exceed ``max_bytes``. The database is opened on first use.
+    """
+
+    def __init__(self, path: str | Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path) if path else config.get_cache_dir() / CACHE_FILE_NAME
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, headers TEXT,"
+                " body BLOB, size INTEGER, accessed_at REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+            self._conn.commit()
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, headers, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+        etag, last_modified, headers, body = row
+        return CachedResponse(etag, last_modified, json.loads(headers), body)
+
+    def put(self, key: str, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        body = response.content
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, etag, last_modified, json.dumps(headers), body, len(body), time.time()),
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return total
+
+
+_shared_cache: HTTPCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def shared_http_cache() -> HTTPCache:
+    """Process-wide cache in the user cache dir, opened on first use."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = HTTPCache()
+        return _shared_cache
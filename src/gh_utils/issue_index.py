@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from gh_utils import config
+from gh_utils.github_client import GitHubClient
+
+INDEX_DIR_NAME = "issue-index"
+
+
+class IssueIndex:
+    """Local index of a repository's issue titles.
+
+    The index is filled with paginated issue listings and kept on disk, so
+    later runs only fetch issues updated since the last refresh. Lookups are
+    dictionary hits; nothing is fetched per candidate issue.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.synced_at: str | None = None
+        self._issues: dict[str, dict] = {}
+        self._by_title: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    @classmethod
+    def for_repo(cls, owner: str, repo: str) -> "IssueIndex":
+        return cls(config.get_cache_dir() / INDEX_DIR_NAME / f"{owner}__{repo}.json")
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return
+        self.synced_at = data.get("synced_at")
+        self._issues = data.get("issues", {})
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._by_title = {entry["title"]: number for number, entry in self._issues.items()}
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, tempfile.NamedTemporaryFile(
+            "w", dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(json.dumps({"synced_at": self.synced_at, "issues": self._issues}))
+        try:
+            os.replace(tmp.name, self.path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+
+    def add(self, issue: dict, title: str) -> None:
+        number = str(issue["number"])
+        with self._lock:
+            entry = {
+                "title": title,
+                "node_id": issue["node_id"],
+                "html_url": issue["html_url"],
+            }
+            self._issues[number] = entry
+            self._by_title[entry["title"]] = number
+
+    def refresh(self, client: GitHubClient, owner: str, repo: str) -> int:
+        """Fetch issues updated since the last refresh and save; returns how many were fetched."""
+        fetched = 0
+        for issue in client.list_issues(owner, repo, since=self.synced_at):
+            with self._lock:
+                self._issues[str(issue["number"])] = {
+                    "title": issue["title"],
+                    "node_id": issue["node_id"],
+                    "html_url": issue["html_url"],
+                }
+                # Issues come oldest-update first, so this ends on the newest one.
+                self.synced_at = issue["updated_at"]
+            fetched += 1
+        with self._lock:
+            self._reindex()
+        self.save()
+        return fetched
+
+    def find(self, title: str) -> dict | None:
+        """Return the existing issue with the same title.
+
+        Bodies are not compared: distinct issues often share boilerplate text.
+        The result has ``number``, ``node_id`` and ``html_url``; ``None`` means no match.
+        """
+        with self._lock:
+            number = self._by_title.get(title)
+            if number is None:
+                return None
+            entry = self._issues[number]
+            return {"number": int(number), "node_id": entry["node_id"], "html_url": entry["html_url"]}
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+def content_hash(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class Journal:
+    """Append-only JSONL log of completed bulk-run steps.
+
+    Each line records one finished step (``created``, ``added``, ...) for an
+    input identified by its content hash. Reopening a journal replays it, so a
+    resumed run can look up what an input already went through and skip it.
+    Lines are flushed to disk as they are written; a line cut short by a crash
+    is ignored on the next load.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a")
+
+    def _load(self) -> None:
+        try:
+            text = self.path.read_text()
+        except FileNotFoundError:
+            return
+        if text and not text.endswith("\n"):
+            # Terminate a line cut short by a crash so the next record starts clean.
+            with self.path.open("a") as f:
+                f.write("\n")
+        for line in text.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            key = record.pop("key")
+            step = record.pop("step")
+            record.pop("at", None)
+            self._apply(key, step, record)
+
+    def _apply(self, key: str, step: str, fields: dict) -> None:
+        entry = self._entries.setdefault(key, {"steps": []})
+        entry.update(fields)
+        entry["steps"].append(step)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> dict:
+        """Everything recorded for ``key`` so far, merged, plus the list of ``steps``."""
+        with self._lock:
+            entry = self._entries.get(key, {"steps": []})
+            return {**entry, "steps": list(entry["steps"])}
+
+    def done(self, key: str, step: str) -> bool:
+        return step in self.get(key)["steps"]
+
+    def record(self, key: str, step: str, **fields) -> None:
+        line = json.dumps({"key": key, "step": step, **fields, "at": time.time()})
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._apply(key, step, fields)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
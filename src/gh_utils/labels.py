@@ -0,0 +1,129 @@
+import threading
+from collections.abc import Iterable
+
+import requests
+
+from gh_utils import bulk, cache
+from gh_utils.exceptions import GhUtilsError, GitHubAPIError
+from gh_utils.github_client import GitHubClient
+
+LABEL_SETS_KIND = "label-sets"
+
+
+class LabelSet:
+    """A repository's labels (name -> node ID), fetched once and cached on disk.
+
+    Names match case-insensitively, as on GitHub. :meth:`ensure` creates any
+    missing labels up front, in parallel, so a bulk run either starts with
+    every label it needs or fails before filing a single issue.
+    """
+
+    def __init__(
+        self,
+        owner: str,
+        repo: str,
+        labels: dict[str, str],
+        node_cache: cache.NodeIdCache | None = None,
+    ):
+        self.owner = owner
+        self.repo = repo
+        self.node_cache = node_cache
+        self._labels = {name.casefold(): (name, node_id) for name, node_id in labels.items()}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        client: GitHubClient,
+        owner: str,
+        repo: str,
+        refresh: bool = False,
+        node_cache: cache.NodeIdCache | None = None,
+    ) -> "LabelSet":
+        """Return the cached label set, listing the repository's labels if needed."""
+        node_cache = node_cache or cache.NodeIdCache()
+        labels = None if refresh else node_cache.get(LABEL_SETS_KIND, cache.repo_key(owner, repo))
+        label_set = cls(owner, repo, labels or {}, node_cache)
+        if labels is None:
+            label_set._labels = {
+                label["name"].casefold(): (label["name"], label["node_id"])
+                for label in client.list_labels(owner, repo)
+            }
+            label_set.save()
+        return label_set
+
+    def __contains__(self, name: str) -> bool:
+        return name.casefold() in self._labels
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def as_dict(self) -> dict[str, str]:
+        with self._lock:
+            return dict(self._labels.values())
+
+    def save(self) -> None:
+        if self.node_cache is None:
+            return
+        labels = self.as_dict()
+        self.node_cache.put(LABEL_SETS_KIND, cache.repo_key(self.owner, self.repo), labels)
+        self.node_cache.put_many(
+            "labels",
+            {cache.label_key(self.owner, self.repo, name): node_id for name, node_id in labels.items()},
+        )
+
+    def missing(self, names: Iterable[str]) -> list[str]:
+        """Names not in the set, once each, in first-seen order."""
+        missing: dict[str, str] = {}
+        for name in names:
+            if name.casefold() not in self._labels:
+                missing.setdefault(name.casefold(), name)
+        return list(missing.values())
+
+    def node_ids(self, names: Iterable[str]) -> list[str]:
+        return [self._labels[name.casefold()][1] for name in names]
+
+    def _create(self, client: GitHubClient, name: str) -> tuple[str, dict | None, Exception | None]:
+        try:
+            return name, client.create_label(self.owner, self.repo, name), None
+        except GitHubAPIError as e:
+            if e.status_code != 422:
+                return name, None, e
+            # Someone else created it since the set was listed.
+            try:
+                return name, client.get_label(self.owner, self.repo, name), None
+            except (GhUtilsError, requests.RequestException) as lookup_error:
+                return name, None, lookup_error
+        except (GhUtilsError, requests.RequestException) as e:
+            return name, None, e
+
+    def ensure(
+        self,
+        client: GitHubClient,
+        names: Iterable[str],
+        concurrency: int = bulk.DEFAULT_CONCURRENCY,
+    ) -> list[str]:
+        """Create the labels of ``names`` that are missing; returns the names created.
+
+        Safe to call from many threads: once a label exists this is a dictionary
+        check. Raises :class:`GitHubAPIError` listing every label that failed.
+        """
+        names = list(names)
+        if not self.missing(names):
+            return []
+        with self._lock:
+            missing = self.missing(names)
+            created, errors = [], []
+            for name, label, error in bulk.imap_unordered(
+                lambda label_name: self._create(client, label_name), missing, concurrency
+            ):
+                if error is None:
+                    self._labels[label["name"].casefold()] = (label["name"], label["node_id"])
+                    created.append(name)
+                else:
+                    errors.append(f"{name}: {error}")
+        if created:
+            self.save()
+        if errors:
+            raise GitHubAPIError(f"Could not create labels in {self.owner}/{self.repo}: {'; '.join(errors)}")
+        return created
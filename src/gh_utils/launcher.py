@@ -0,0 +1,79 @@
+"""``gh-utils`` entry point that forwards to a running daemon when it can.
+
+Only the standard library and :mod:`gh_utils.config` are imported here, so a
+forwarded call skips importing ``requests``, ``click`` and the CLI entirely.
+"""
+
+import json
+import os
+import socket
+import sys
+
+from gh_utils import config
+
+# Commands that must run in this process: they manage the daemon, read stdin or run until interrupted.
+LOCAL_ONLY_COMMANDS = frozenset({"daemon", "batch", "watch"})
+FORWARDED_ENV_PREFIXES = ("GITHUB_", "GH_UTILS_", "XDG_CACHE_HOME")
+# Options of the top-level group that consume the following argument.
+GROUP_OPTIONS_WITH_VALUES = frozenset({"--metrics-file", "--metrics-format"})
+
+
+def forwarded_env() -> dict[str, str]:
+    return {key: value for key, value in os.environ.items() if key.startswith(FORWARDED_ENV_PREFIXES)}
+
+
+def command_name(argv: list[str]) -> str | None:
+    """Return the subcommand of ``argv``, skipping options given to the group."""
+    args = iter(argv)
+    for arg in args:
+        if arg in GROUP_OPTIONS_WITH_VALUES:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _connect() -> socket.socket | None:
+    if not hasattr(socket, "AF_UNIX") or os.environ.get("GH_UTILS_NO_DAEMON"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(config.get_daemon_socket()))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run ``argv`` in the daemon; returns its exit code, or ``None`` if no daemon is up."""
+    if command_name(argv) in LOCAL_ONLY_COMMANDS or "-" in argv:
+        return None
+    sock = _connect()
+    if sock is None:
+        return None
+
+    # From here on the command may already be running, so never fall back to a
+    # local run: that could execute it twice.
+    with sock, sock.makefile("rwb") as stream:
+        request = {"argv": argv, "env": forwarded_env(), "cwd": os.getcwd()}
+        stream.write(json.dumps(request).encode() + b"\n")
+        stream.flush()
+        line = stream.readline()
+    if not line:
+        sys.stderr.write("Error: gh-utils daemon closed the connection\n")
+        return 1
+    reply = json.loads(line)
+    sys.stdout.write(reply["stdout"])
+    sys.stderr.write(reply["stderr"])
+    return reply["exit_code"]
+
+
+def main():
+    exit_code = forward(sys.argv[1:])
+    if exit_code is None:
+        from gh_utils.cli import main as cli_main
+
+        cli_main()
+    else:
+        sys.exit(exit_code)
@@ -0,0 +1,275 @@
+import json
+import math
+import re
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+_REPO_PATH = re.compile(r"/repos/[^/]+/[^/]+")
+_NUMBER_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_OPERATION = re.compile(r"^\s*(?:query|mutation)\s+(\w+)")
+
+
+def rest_endpoint(method: str, url: str) -> str:
+    """``POST https://api.github.com/repos/o/r/issues`` -> ``POST /repos/{owner}/{repo}/issues``."""
+    path = re.sub(r"^https?://[^/]+", "", url.split("?", 1)[0])
+    path = _REPO_PATH.sub("/repos/{owner}/{repo}", path)
+    return f"{method} {_NUMBER_SEGMENT.sub('/{number}', path)}"
+
+
+def graphql_endpoint(query: str) -> str:
+    match = _OPERATION.match(query)
+    return f"graphql {match.group(1)}" if match else "graphql"
+
+
+@dataclass
+class RequestRecord:
+    """Timings and sizes of one HTTP attempt (retries are separate records).
+
+    ``headers_seconds`` is the client's ``response.elapsed``: the time from
+    sending the request until the response headers arrived (with httpx, until
+    the body was read). It includes network time, so it is not the server's
+    processing time.
+    """
+
+    endpoint: str
+    status: int | None
+    seconds: float
+    headers_seconds: float | None = None
+    connect_seconds: float | None = None
+    attempt: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    rate_limit_resource: str | None = None
+    rate_limit_remaining: int | None = None
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (which need not be sorted)."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class EndpointStats:
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)
+    seconds: list[float] = field(default_factory=list)
+    headers_seconds: list[float] = field(default_factory=list)
+    connect_seconds: list[float] = field(default_factory=list)
+
+
+class Metrics:
+    """Collects per-request records and summarises them per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records: list[RequestRecord] = []
+        self.rate_limits: dict[str, int] = {}
+
+    def record(self, record: RequestRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+            if record.rate_limit_resource and record.rate_limit_remaining is not None:
+                self.rate_limits[record.rate_limit_resource] = record.rate_limit_remaining
+
+    def endpoints(self) -> dict[str, EndpointStats]:
+        with self._lock:
+            records = list(self.records)
+        stats: dict[str, EndpointStats] = {}
+        for record in records:
+            entry = stats.setdefault(record.endpoint, EndpointStats())
+            entry.calls += 1
+            entry.errors += record.status is None or record.status >= 400
+            entry.retries += record.attempt > 0
+            entry.bytes_sent += record.bytes_sent
+            entry.bytes_received += record.bytes_received
+            status = str(record.status) if record.status is not None else "error"
+            entry.statuses[status] = entry.statuses.get(status, 0) + 1
+            entry.seconds.append(record.seconds)
+            if record.headers_seconds is not None:
+                entry.headers_seconds.append(record.headers_seconds)
+            if record.connect_seconds is not None:
+                entry.connect_seconds.append(record.connect_seconds)
+        return stats
+
+    def summary(self) -> dict:
+        """JSON-friendly summary: per-endpoint counts and p50/p95/p99 latencies in seconds."""
+        endpoints = {}
+        for endpoint, stats in self.endpoints().items():
+            endpoints[endpoint] = {
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "retries": stats.retries,
+                "statuses": stats.statuses,
+                "bytes_sent": stats.bytes_sent,
+                "bytes_received": stats.bytes_received,
+                "connections_opened": len(stats.connect_seconds),
+                "latency": {f"p{p}": percentile(stats.seconds, p) for p in (50, 95, 99)},
+            }
+            if stats.headers_seconds:
+                endpoints[endpoint]["time_to_headers"] = {
+                    f"p{p}": percentile(stats.headers_seconds, p) for p in (50, 95, 99)
+                }
+            if stats.connect_seconds:
+                endpoints[endpoint]["connect_latency"] = {
+                    f"p{p}": percentile(stats.connect_seconds, p) for p in (50, 95, 99)
+                }
+        return {"endpoints": endpoints, "rate_limit_remaining": dict(self.rate_limits)}
+
+    def to_json(self) -> str:
+        with self._lock:
+            records = [asdict(record) for record in self.records]
+        return json.dumps({**self.summary(), "requests": records}, indent=2)
+
+    def to_prometheus(self) -> str:
+        lines = [
+            "# HELP gh_utils_requests_total HTTP requests sent to GitHub, including retries.",
+            "# TYPE gh_utils_requests_total counter",
+        ]
+        endpoints = self.endpoints()
+        for endpoint, stats in endpoints.items():
+            for status, count in stats.statuses.items():
+                lines.append(f"gh_utils_requests_total{_labels(endpoint=endpoint, status=status)} {count}")
+        lines += [
+            "# HELP gh_utils_request_retries_total Requests that were retries of an earlier attempt.",
+            "# TYPE gh_utils_request_retries_total counter",
+        ]
+        for endpoint, stats in endpoints.items():
+            lines.append(f"gh_utils_request_retries_total{_labels(endpoint=endpoint)} {stats.retries}")
+        lines += [
+            "# HELP gh_utils_request_bytes_total Request and response body bytes.",
+            "# TYPE gh_utils_request_bytes_total counter",
+        ]
+        for endpoint, stats in endpoints.items():
+            for direction, total in (("sent", stats.bytes_sent), ("received", stats.bytes_received)):
+                lines.append(f"gh_utils_request_bytes_total{_labels(endpoint=endpoint, direction=direction)} {total}")
+        lines += [
+            "# HELP gh_utils_request_duration_seconds Wall-clock time per request.",
+            "# TYPE gh_utils_request_duration_seconds summary",
+        ]
+        for endpoint, stats in endpoints.items():
+            for p in (50, 95, 99):
+                quantile = _labels(endpoint=endpoint, quantile=str(p / 100))
+                lines.append(f"gh_utils_request_duration_seconds{quantile} {percentile(stats.seconds, p):.6f}")
+            lines.append(f"gh_utils_request_duration_seconds_sum{_labels(endpoint=endpoint)} {sum(stats.seconds):.6f}")
+            lines.append(f"gh_utils_request_duration_seconds_count{_labels(endpoint=endpoint)} {stats.calls}")
+        lines += [
+            "# HELP gh_utils_rate_limit_remaining Remaining rate-limit budget last reported by GitHub.",
+            "# TYPE gh_utils_rate_limit_remaining gauge",
+        ]
+        for resource, remaining in sorted(self.rate_limits.items()):
+            lines.append(f"gh_utils_rate_limit_remaining{_labels(resource=resource)} {remaining}")
+        return "\n".join(lines) + "\n"
+
+    def format_summary(self) -> str:
+        """Human-readable per-endpoint table, latencies in milliseconds."""
+        header = (
+            f"{'endpoint':<44} {'calls':>6} {'errors':>6} {'retries':>7} "
+            f"{'p50':>8} {'p95':>8} {'p99':>8} {'conns':>5} {'connect p50':>11}"
+        )
+        lines = [header]
+        for endpoint, stats in sorted(self.endpoints().items()):
+            connect = f"{percentile(stats.connect_seconds, 50) * 1000:.1f}" if stats.connect_seconds else "-"
+            lines.append(
+                f"{endpoint:<44} {stats.calls:>6} {stats.errors:>6} {stats.retries:>7} "
+                f"{percentile(stats.seconds, 50) * 1000:>8.1f} {percentile(stats.seconds, 95) * 1000:>8.1f} "
+                f"{percentile(stats.seconds, 99) * 1000:>8.1f} {len(stats.connect_seconds):>5} {connect:>11}"
+            )
+        if self.rate_limits:
+            remaining = ", ".join(f"{resource}={value}" for resource, value in sorted(self.rate_limits.items()))
+            lines.append(f"rate limit remaining: {remaining}")
+        return "\n".join(lines)
+
+
+def _labels(**labels: str) -> str:
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+_connect_times = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _connect_times.seconds = time.perf_counter() - start
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        # DNS, TCP and the TLS handshake all happen inside urllib3's connect().
+        start = time.perf_counter()
+        super().connect()
+        _connect_times.seconds = time.perf_counter() - start
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` whose connections note how long opening them took.
+
+    requests does not expose connection timings, so new connections record
+    their DNS+connect+TLS time in a thread-local read by
+    :func:`take_connect_seconds`. Reused keep-alive connections record nothing.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def take_connect_seconds() -> float | None:
+    """Return and clear the connect time of the last connection opened by this thread."""
+    seconds = getattr(_connect_times, "seconds", None)
+    _connect_times.seconds = None
+    return seconds
+
+
+def rate_limit_fields(headers: Mapping[str, str]) -> tuple[str | None, int | None]:
+    remaining = headers.get("X-RateLimit-Remaining")
+    try:
+        return headers.get("X-RateLimit-Resource"), int(remaining) if remaining is not None else None
+    except (TypeError, ValueError):
+        return None, None
+
+
+_active: Metrics | None = None
+
+
+def enable() -> Metrics:
+    """Start collecting for every client in this process; returns the fresh collector."""
+    global _active
+    _active = Metrics()
+    return _active
+
+
+def disable() -> None:
+    global _active
+    _active = None
+
+
+def active() -> Metrics | None:
+    return _active
@@ -0,0 +1,256 @@
+import datetime
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from gh_utils import config
+from gh_utils.github_client import MAX_NODE_IDS, GitHubClient
+
+MIRROR_FILE_NAME = "project-mirror.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+  project_id TEXT NOT NULL,
+  item_id TEXT NOT NULL,
+  updated_at TEXT,
+  type TEXT,
+  content_id TEXT,
+  repository TEXT COLLATE NOCASE,
+  number INTEGER,
+  title TEXT,
+  state TEXT COLLATE NOCASE,
+  url TEXT,
+  archived INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (project_id, item_id)
+);
+CREATE INDEX IF NOT EXISTS items_content ON items (project_id, content_id);
+CREATE INDEX IF NOT EXISTS items_issue ON items (project_id, repository, number);
+CREATE TABLE IF NOT EXISTS field_values (
+  project_id TEXT NOT NULL,
+  item_id TEXT NOT NULL,
+  field TEXT NOT NULL COLLATE NOCASE,
+  value TEXT COLLATE NOCASE,
+  PRIMARY KEY (project_id, item_id, field)
+);
+CREATE INDEX IF NOT EXISTS field_values_lookup ON field_values (project_id, field, value);
+CREATE TABLE IF NOT EXISTS syncs (
+  project_id TEXT PRIMARY KEY,
+  synced_at TEXT NOT NULL,
+  items INTEGER NOT NULL
+);
+"""
+
+ITEM_COLUMNS = ("item_id", "type", "content_id", "repository", "number", "title", "state", "url", "archived")
+
+
+def field_value(node: dict) -> tuple[str, str] | None:
+    """Turn a ``fieldValues`` node into ``(field name, value as text)``; ``None`` for unsupported kinds."""
+    name = (node.get("field") or {}).get("name")
+    if not name:
+        return None
+    for key in ("text", "date", "name", "title"):
+        if node.get(key) is not None:
+            return name, str(node[key])
+    if node.get("number") is not None:
+        return name, format(node["number"], "g")
+    return None
+
+
+def item_row(item: dict) -> dict:
+    """Flatten a project item node into the columns of the ``items`` table."""
+    content = item.get("content") or {}
+    return {
+        "item_id": item["id"],
+        "updated_at": item.get("updatedAt"),
+        "type": item.get("type"),
+        "content_id": content.get("id"),
+        "repository": (content.get("repository") or {}).get("nameWithOwner"),
+        "number": content.get("number"),
+        "title": content.get("title"),
+        "state": content.get("state"),
+        "url": content.get("url"),
+        "archived": int(bool(item.get("isArchived"))),
+    }
+
+
+@dataclass
+class SyncStats:
+    fetched: int
+    removed: int
+    total: int
+
+
+class ProjectMirror:
+    """Local SQLite copy of Project V2 items and their field values.
+
+    :meth:`sync` lists every item's ``updatedAt`` (100 per request, no
+    content), then fetches full details only for items that are new or
+    changed since the last sync and drops the ones no longer on the board.
+    Queries are then answered from the indexed local tables. The database is
+    opened on first use.
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else config.get_cache_dir() / MIRROR_FILE_NAME
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "ProjectMirror":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _store(self, project_id: str, items: list[dict]) -> None:
+        for item in items:
+            row = item_row(item)
+            self._db.execute(
+                "INSERT OR REPLACE INTO items VALUES"
+                " (:project_id, :item_id, :updated_at, :type, :content_id, :repository,"
+                " :number, :title, :state, :url, :archived)",
+                {"project_id": project_id, **row},
+            )
+            self._db.execute(
+                "DELETE FROM field_values WHERE project_id = ? AND item_id = ?", (project_id, item["id"])
+            )
+            values = filter(None, map(field_value, (item.get("fieldValues") or {}).get("nodes") or []))
+            self._db.executemany(
+                "INSERT OR REPLACE INTO field_values VALUES (?, ?, ?, ?)",
+                [(project_id, item["id"], name, value) for name, value in values],
+            )
+
+    def _delete(self, project_id: str, item_ids: list[str]) -> None:
+        for table in ("items", "field_values"):
+            self._db.executemany(
+                f"DELETE FROM {table} WHERE project_id = ? AND item_id = ?",
+                [(project_id, item_id) for item_id in item_ids],
+            )
+
+    def sync(self, client: GitHubClient, project_id: str) -> SyncStats:
+        """Bring the copy of ``project_id`` up to date; returns what changed.
+
+        Changed items are committed in batches as they arrive, so an
+        interrupted sync keeps its progress and the next one fetches the rest.
+        """
+        stamps = {item["id"]: item["updatedAt"] for item in client.iter_project_item_stamps(project_id)}
+        with self._lock:
+            local = dict(
+                self._db.execute("SELECT item_id, updated_at FROM items WHERE project_id = ?", (project_id,))
+            )
+        changed = [item_id for item_id, updated_at in stamps.items() if local.get(item_id) != updated_at]
+        removed = [item_id for item_id in local if item_id not in stamps]
+
+        fetched = 0
+        for start in range(0, len(changed), MAX_NODE_IDS):
+            items = client.get_project_items(changed[start:start + MAX_NODE_IDS])
+            with self._lock, self._db:
+                self._store(project_id, items)
+            fetched += len(items)
+        synced_at = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+        with self._lock, self._db:
+            self._delete(project_id, removed)
+            self._db.execute(
+                "INSERT OR REPLACE INTO syncs VALUES (?, ?, ?)", (project_id, synced_at, len(stamps))
+            )
+        return SyncStats(fetched=fetched, removed=len(removed), total=len(stamps))
+
+    def synced_at(self, project_id: str) -> str | None:
+        with self._lock:
+            row = self._db.execute("SELECT synced_at FROM syncs WHERE project_id = ?", (project_id,)).fetchone()
+        return row["synced_at"] if row else None
+
+    def item_ids(self, project_id: str, content_ids: Iterable[str]) -> dict[str, str]:
+        """Map those of ``content_ids`` already on the project to their item IDs."""
+        found = {}
+        with self._lock:
+            for content_id in content_ids:
+                row = self._db.execute(
+                    "SELECT item_id FROM items WHERE project_id = ? AND content_id = ?", (project_id, content_id)
+                ).fetchone()
+                if row is not None:
+                    found[content_id] = row["item_id"]
+        return found
+
+    def record_added(self, project_id: str, items: dict[str, str]) -> None:
+        """Remember items just added (content ID -> item ID) until the next sync fills them in.
+
+        They are stored without ``updated_at``, so the next sync always fetches them.
+        """
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO items (project_id, item_id, content_id) VALUES (?, ?, ?)",
+                [(project_id, item_id, content_id) for content_id, item_id in items.items()],
+            )
+
+    def _where(
+        self, project_id: str, fields: dict[str, str], repository: str | None, state: str | None
+    ) -> tuple[str, list]:
+        clauses, params = ["i.project_id = ?"], [project_id]
+        for name, value in fields.items():
+            clauses.append(
+                "EXISTS (SELECT 1 FROM field_values v WHERE v.project_id = i.project_id"
+                " AND v.item_id = i.item_id AND v.field = ? AND v.value = ?)"
+            )
+            params += [name, value]
+        if repository:
+            clauses.append("i.repository = ?")
+            params.append(repository)
+        if state:
+            clauses.append("i.state = ?")
+            params.append(state)
+        return " AND ".join(clauses), params
+
+    def query(
+        self,
+        project_id: str,
+        fields: dict[str, str] | None = None,
+        repository: str | None = None,
+        state: str | None = None,
+    ) -> list[dict]:
+        """Items matching every filter, each with its ``fields`` as name -> value.
+
+        Field names and values, repositories and states match case-insensitively.
+        """
+        where, params = self._where(project_id, fields or {}, repository, state)
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {', '.join('i.' + column for column in ITEM_COLUMNS)} FROM items i"
+                f" WHERE {where} ORDER BY i.repository, i.number, i.item_id",
+                params,
+            ).fetchall()
+            values: dict[str, dict[str, str]] = {}
+            for value in self._db.execute(
+                "SELECT v.item_id, v.field, v.value FROM field_values v JOIN items i"
+                f" ON i.project_id = v.project_id AND i.item_id = v.item_id WHERE {where}",
+                params,
+            ):
+                values.setdefault(value["item_id"], {})[value["field"]] = value["value"]
+        return [{**dict(row), "fields": values.get(row["item_id"], {})} for row in rows]
+
+    def count(
+        self,
+        project_id: str,
+        fields: dict[str, str] | None = None,
+        repository: str | None = None,
+        state: str | None = None,
+    ) -> int:
+        where, params = self._where(project_id, fields or {}, repository, state)
+        with self._lock:
+            (count,) = self._db.execute(f"SELECT COUNT(*) FROM items i WHERE {where}", params).fetchone()
+        return count
@@ -0,0 +1,104 @@
+import datetime
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+
+from gh_utils import cache
+from gh_utils.exceptions import ConfigError
+from gh_utils.github_client import GitHubClient
+
+PROJECT_FIELDS_KIND = "project-fields"
+
+
+def parse_assignments(pairs: Iterable[str]) -> dict[str, str]:
+    """Parse ``name=value`` options into a dict, keeping the order given."""
+    assignments = {}
+    for pair in pairs:
+        name, sep, value = pair.partition("=")
+        if not sep or not name.strip():
+            raise ConfigError(f"Field must be given as name=value, got '{pair}'")
+        assignments[name.strip()] = value.strip()
+    return assignments
+
+
+@dataclass
+class ProjectField:
+    id: str
+    name: str
+    data_type: str
+    options: dict[str, str] = field(default_factory=dict)
+    iterations: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_node(cls, node: dict) -> "ProjectField":
+        configuration = node.get("configuration") or {}
+        iterations = configuration.get("iterations", []) + configuration.get("completedIterations", [])
+        return cls(
+            id=node["id"],
+            name=node["name"],
+            data_type=node["dataType"],
+            options={option["name"]: option["id"] for option in node.get("options") or []},
+            iterations={iteration["title"]: iteration["id"] for iteration in iterations},
+        )
+
+    def value(self, raw: str) -> dict:
+        """Convert a command-line value into a ``ProjectV2FieldValue`` input."""
+        if self.data_type == "TEXT":
+            return {"text": raw}
+        if self.data_type == "NUMBER":
+            try:
+                return {"number": float(raw)}
+            except ValueError:
+                raise ConfigError(f"Field '{self.name}' needs a number, got '{raw}'") from None
+        if self.data_type == "DATE":
+            try:
+                return {"date": datetime.date.fromisoformat(raw).isoformat()}
+            except ValueError:
+                raise ConfigError(f"Field '{self.name}' needs a YYYY-MM-DD date, got '{raw}'") from None
+        if self.data_type == "SINGLE_SELECT":
+            return {"singleSelectOptionId": self._choose(raw, self.options, "option")}
+        if self.data_type == "ITERATION":
+            return {"iterationId": self._choose(raw, self.iterations, "iteration")}
+        raise ConfigError(f"Field '{self.name}' ({self.data_type}) cannot be set from the command line")
+
+    def _choose(self, raw: str, choices: dict[str, str], kind: str) -> str:
+        by_name = {name.casefold(): node_id for name, node_id in choices.items()}
+        node_id = by_name.get(raw.casefold())
+        if node_id is None:
+            raise ConfigError(
+                f"Field '{self.name}' has no {kind} '{raw}'; choose from: {', '.join(choices) or 'none'}"
+            )
+        return node_id
+
+
+class ProjectFields:
+    """A project's custom fields by name, resolved once per project and cached on disk."""
+
+    def __init__(self, fields: list[ProjectField]):
+        self._fields = {project_field.name.casefold(): project_field for project_field in fields}
+
+    @classmethod
+    def load(
+        cls,
+        client: GitHubClient,
+        project_id: str,
+        refresh: bool = False,
+        node_cache: cache.NodeIdCache | None = None,
+    ) -> "ProjectFields":
+        node_cache = node_cache or cache.NodeIdCache()
+        cached = None if refresh else node_cache.get(PROJECT_FIELDS_KIND, project_id)
+        if cached is not None:
+            return cls([ProjectField(**entry) for entry in cached])
+        fields = [ProjectField.from_node(node) for node in client.get_project_fields(project_id)]
+        node_cache.put(PROJECT_FIELDS_KIND, project_id, [asdict(project_field) for project_field in fields])
+        return cls(fields)
+
+    def resolve(self, assignments: dict[str, str]) -> list[tuple[str, dict]]:
+        """Turn ``{field name: value}`` into ``(field ID, ProjectV2FieldValue)`` pairs."""
+        resolved = []
+        for name, raw in assignments.items():
+            project_field = self._fields.get(name.casefold())
+            if project_field is None:
+                known = ", ".join(f.name for f in self._fields.values())
+                raise ConfigError(f"Project has no field '{name}'; fields: {known}")
+            resolved.append((project_field.id, project_field.value(raw)))
+        return resolved
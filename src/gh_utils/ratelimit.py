@@ -0,0 +1,258 @@
+import hashlib
+import math
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+
+from gh_utils.exceptions import GitHubAPIError
+
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_BASE = 1.0
+DEFAULT_BACKOFF_MAX = 60.0
+# Start spreading requests evenly over the rest of the window once less than
+# this share of the budget is left.
+DEFAULT_PACE_BELOW = 0.1
+# GitHub asks clients to wait at least a minute after a secondary rate limit
+# response that carries no Retry-After header.
+SECONDARY_LIMIT_WAIT = 60.0
+
+RETRYABLE_SERVER_ERRORS = frozenset({500, 502, 503, 504})
+
+
+@dataclass
+class RateLimitState:
+    limit: int | None = None
+    remaining: int | None = None
+    used: int | None = None
+    reset_at: float | None = None
+    blocked_until: float | None = None
+
+
+def token_id(token: str) -> str:
+    """Short, non-reversible label for a token, safe to print or log."""
+    return hashlib.sha256(token.encode()).hexdigest()[:8]
+
+
+def resource_for_url(url: str) -> str:
+    if url.endswith("/graphql"):
+        return "graphql"
+    if "/search/" in url:
+        return "search"
+    return "core"
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Tracks GitHub rate-limit budgets per token and resource and paces requests.
+
+    Budgets come from the ``X-RateLimit-*`` headers of every response (REST and
+    GraphQL alike). Before a request, :meth:`delay_before` says how long to wait:
+    until the reset when the budget is spent, evenly spaced slots when it runs
+    low, and until a secondary-limit block lifts. :meth:`retry_delay` decides
+    whether a failed response is worth retrying and after how long.
+
+    The delay methods never sleep themselves, so the same limiter serves the
+    threaded and the asyncio client.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        pace_below: float = DEFAULT_PACE_BELOW,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pace_below = pace_below
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._states: dict[tuple[str, str], RateLimitState] = {}
+        self._next_slot: dict[tuple[str, str], float] = {}
+        self._blocked_until: dict[str, float] = {}
+
+    def delay_before(self, token: str, resource: str) -> float:
+        """Reserve one request against the budget and return how long to wait first."""
+        now = self.clock()
+        key = (token_id(token), resource)
+        with self._lock:
+            delay = max(0.0, self._blocked_until.get(key[0], 0.0) - now)
+            state = self._states.get(key)
+            if state is None or state.remaining is None or not state.reset_at or state.reset_at <= now:
+                return delay
+
+            if state.remaining <= 0:
+                delay = max(delay, state.reset_at - now)
+            elif state.limit and state.remaining < state.limit * self.pace_below:
+                interval = (state.reset_at - now) / state.remaining
+                slot = max(now, self._next_slot.get(key, now))
+                self._next_slot[key] = slot + interval
+                delay = max(delay, slot - now)
+            # Count the request now so concurrent callers see the shrinking budget.
+            state.remaining -= 1
+            return delay
+
+    def headroom(self, token: str, resource: str) -> tuple[float, float]:
+        """Return ``(seconds before a request could go out, requests left)`` without reserving one.
+
+        A budget not seen yet, or whose window has passed, counts as unlimited.
+        """
+        now = self.clock()
+        key = (token_id(token), resource)
+        with self._lock:
+            delay = max(0.0, self._blocked_until.get(key[0], 0.0) - now)
+            state = self._states.get(key)
+            if state is None or state.remaining is None or not state.reset_at or state.reset_at <= now:
+                return delay, math.inf
+            if state.remaining <= 0:
+                delay = max(delay, state.reset_at - now)
+            elif state.limit and state.remaining < state.limit * self.pace_below:
+                delay = max(delay, self._next_slot.get(key, now) - now)
+            return delay, float(state.remaining)
+
+    def wait(self, token: str, resource: str) -> None:
+        delay = self.delay_before(token, resource)
+        if delay > 0:
+            self.sleep(delay)
+
+    def record(self, token: str, resource: str, headers: Mapping[str, str]) -> None:
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        resource = headers.get("X-RateLimit-Resource") or resource
+        key = (token_id(token), resource)
+        with self._lock:
+            state = self._states.setdefault(key, RateLimitState())
+            state.remaining = remaining
+            state.limit = _int_header(headers, "X-RateLimit-Limit") or state.limit
+            state.used = _int_header(headers, "X-RateLimit-Used")
+            reset = _int_header(headers, "X-RateLimit-Reset")
+            if reset is not None:
+                if state.reset_at != reset:
+                    self._next_slot.pop(key, None)
+                state.reset_at = float(reset)
+
+    def _backoff(self, attempt: int) -> float:
+        ceiling = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(ceiling / 2, ceiling)
+
+    def retry_delay(
+        self,
+        token: str,
+        attempt: int,
+        status_code: int | None,
+        headers: Mapping[str, str] | None = None,
+        body: str = "",
+    ) -> float | None:
+        """Return the wait before retrying attempt ``attempt``, or ``None`` to give up.
+
+        ``status_code`` is ``None`` for connection errors and timeouts.
+        """
+        if attempt >= self.max_retries:
+            return None
+        headers = headers or {}
+        retry_after = _int_header(headers, "Retry-After")
+
+        if status_code in (403, 429):
+            reset = _int_header(headers, "X-RateLimit-Reset")
+            if retry_after is not None:
+                delay = retry_after + random.uniform(0, 1)
+            elif headers.get("X-RateLimit-Remaining") == "0" and reset is not None:
+                delay = max(0.0, reset - self.clock()) + random.uniform(0, 1)
+            elif status_code == 429 or "secondary rate limit" in body.lower():
+                delay = max(SECONDARY_LIMIT_WAIT, self._backoff(attempt))
+            else:
+                return None
+            # Secondary limits apply to the whole token: hold back every caller.
+            with self._lock:
+                until = self.clock() + delay
+                tid = token_id(token)
+                self._blocked_until[tid] = max(self._blocked_until.get(tid, 0.0), until)
+            return delay
+
+        if status_code is None or status_code in RETRYABLE_SERVER_ERRORS:
+            if retry_after is not None:
+                return retry_after + random.uniform(0, 1)
+            return self._backoff(attempt)
+        return None
+
+    def state(self) -> dict[str, RateLimitState]:
+        """Snapshot of known budgets, keyed ``"<token id>/<resource>"``."""
+        now = self.clock()
+        with self._lock:
+            snapshot = {}
+            for (tid, resource), state in self._states.items():
+                blocked = self._blocked_until.get(tid)
+                snapshot[f"{tid}/{resource}"] = replace(
+                    state, blocked_until=blocked if blocked and blocked > now else None
+                )
+            return snapshot
+
+
+shared_rate_limiter = RateLimiter()
+
+
+class TokenPool:
+    """Several tokens (PATs or App installation tokens) spent as one budget.
+
+    :meth:`choose` hands each request the token that can send soonest and has
+    the most budget left for the resource, as tracked by ``rate_limiter``, so
+    work spreads over every token and moves off one once it is exhausted or
+    blocked. A token GitHub rejects (401) is dropped for the rest of the
+    process. The tokens should all see the same repositories and projects.
+    """
+
+    def __init__(self, tokens: list[str], rate_limiter: RateLimiter | None = None):
+        self.tokens = list(dict.fromkeys(tokens))
+        if not self.tokens:
+            raise ValueError("A token pool needs at least one token")
+        self.rate_limiter = rate_limiter or shared_rate_limiter
+        self._revoked: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.active())
+
+    def active(self) -> list[str]:
+        with self._lock:
+            return [token for token in self.tokens if token not in self._revoked]
+
+    def _ranked(self, resource: str) -> list[tuple[float, float, str]]:
+        ranked = []
+        for token in self.active():
+            delay, remaining = self.rate_limiter.headroom(token, resource)
+            ranked.append((delay, -remaining, token))
+        if not ranked:
+            raise GitHubAPIError("Every token in the pool was rejected as bad credentials", status_code=401)
+        return sorted(ranked, key=lambda entry: entry[:2])
+
+    def choose(self, resource: str) -> str:
+        return self._ranked(resource)[0][2]
+
+    def delay(self, resource: str) -> float:
+        """Seconds until the best token can send again."""
+        return self._ranked(resource)[0][0]
+
+    def revoke(self, token: str) -> bool:
+        """Stop using ``token``; returns whether any token is left to fail over to."""
+        with self._lock:
+            self._revoked.add(token)
+            return len(self._revoked) < len(self.tokens)
+
+    def state(self) -> dict[str, str]:
+        """Each token's label and whether it is still in use."""
+        with self._lock:
+            return {token_id(token): "revoked" if token in self._revoked else "active" for token in self.tokens}
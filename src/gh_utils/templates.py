@@ -0,0 +1,90 @@
+import csv
+import string
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pq = None
+
+from gh_utils.bulk import IssueSpec, spec_from_markdown
+from gh_utils.exceptions import ConfigError, GhUtilsError
+
+PARQUET_BATCH_ROWS = 1024
+LABELS_COLUMN = "labels"
+
+
+def _compile(text: str, what: str) -> string.Template:
+    template = string.Template(text)
+    if not template.is_valid():
+        raise ConfigError(f"Invalid placeholder in {what}; write a literal $ as $$")
+    return template
+
+
+class IssueTemplate:
+    """Markdown issue template compiled once and rendered for each data row.
+
+    Placeholders use :class:`string.Template` syntax (``$service`` or
+    ``${service}``) and name columns of the data file. As with markdown issue
+    files, a leading ``# Heading`` line is the title. ``labels`` are
+    templates too, and a ``labels`` column adds comma-separated labels per row.
+    """
+
+    def __init__(self, title: str, body: str, labels: list[str] | None = None, source: str = ""):
+        self.source = source
+        self.title = _compile(title, "the title")
+        self.body = _compile(body, "the body")
+        self.labels = [_compile(label, f"label '{label}'") for label in labels or []]
+        self.columns = {
+            name
+            for template in (self.title, self.body, *self.labels)
+            for name in template.get_identifiers()
+        }
+
+    @classmethod
+    def from_file(cls, path: str | Path, labels: list[str] | None = None) -> "IssueTemplate":
+        spec = spec_from_markdown(path)
+        return cls(spec.title, spec.body, labels, source=spec.source)
+
+    def check_columns(self, columns: Iterable[str]) -> None:
+        missing = self.columns.difference(columns)
+        if missing:
+            raise ConfigError(f"Template uses columns missing from the data: {', '.join(sorted(missing))}")
+
+    def render(self, row: Mapping[str, object], source: str = "") -> IssueSpec:
+        values = {name: "" if value is None else str(value) for name, value in row.items()}
+        labels = [template.substitute(values).strip() for template in self.labels]
+        labels += [label.strip() for label in values.get(LABELS_COLUMN, "").split(",")]
+        return IssueSpec(
+            title=self.title.substitute(values).strip(),
+            body=self.body.substitute(values),
+            labels=[label for label in dict.fromkeys(labels) if label],
+            source=source,
+        )
+
+
+def _iter_parquet(path: Path) -> Iterator[dict]:
+    if pq is None:
+        raise GhUtilsError("Reading Parquet files requires pyarrow: pip install 'gh-utils[parquet]'")
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=PARQUET_BATCH_ROWS):
+        yield from batch.to_pylist()
+
+
+def iter_rows(path: str | Path) -> Iterator[dict]:
+    """Yield the rows of a CSV or Parquet (``.parquet``) file as dicts, reading lazily."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        yield from _iter_parquet(path)
+        return
+    with open(path, newline="") as f:
+        yield from csv.DictReader(f)
+
+
+def iter_specs(template: IssueTemplate, data: str | Path) -> Iterator[IssueSpec]:
+    """Render ``template`` for every row of ``data`` as it is read; sources are ``file:row``."""
+    name = Path(data).name
+    for number, row in enumerate(iter_rows(data), start=1):
+        if number == 1:
+            template.check_columns(row)
+        yield template.render(row, source=f"{name}:{number}")
@@ -0,0 +1,218 @@
+"""Record and replay HTTP traffic through the client's session transport.
+
+:class:`GitHubClient` sends every request through a ``requests`` transport
+adapter mounted on its session. Any :class:`requests.adapters.BaseAdapter`
+can be passed as ``transport``. :class:`RecordingAdapter` saves each
+request/response pair to a cassette file. :class:`ReplayAdapter` answers
+from a cassette instead of the network.
+"""
+
+import atexit
+import base64
+import datetime
+import gzip
+import hashlib
+import http
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from gh_utils import config
+from gh_utils.exceptions import ConfigError, GhUtilsError
+from gh_utils.metrics import TimedHTTPAdapter
+
+# Response headers worth keeping: the client reads these; the rest only bloats the cassette.
+RECORDED_HEADERS = frozenset({"content-type", "etag", "last-modified", "link", "retry-after"})
+RECORDED_HEADER_PREFIXES = ("x-ratelimit-",)
+
+
+def request_key(method: str, url: str, body: bytes | str | None) -> str:
+    """Identifies a request in a cassette; headers (and so tokens) are left out."""
+    if isinstance(body, str):
+        body = body.encode()
+    digest = hashlib.sha256(f"{method.upper()} {url}\0".encode())
+    digest.update(body or b"")
+    return digest.hexdigest()[:32]
+
+
+def _open(path: Path, mode: str):
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+class Cassette:
+    """A JSON Lines file of recorded responses, one per line, optionally gzipped (``.gz``).
+
+    Each line holds the request's method, URL and :func:`request_key`, and the
+    response's status and reason, the headers in :data:`RECORDED_HEADERS`, the body and
+    the seconds the round trip took. Request headers and bodies are not kept.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = None
+        self._queues: dict[str, deque] | None = None
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response, seconds: float) -> None:
+        content = response.content or b""
+        interaction = {
+            "method": request.method,
+            "url": request.url,
+            "key": request_key(request.method, request.url, request.body),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value for name, value in response.headers.items()
+                if name.lower() in RECORDED_HEADERS or name.lower().startswith(RECORDED_HEADER_PREFIXES)
+            },
+            "seconds": round(seconds, 4),
+        }
+        try:
+            interaction["body"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction["body_base64"] = base64.b64encode(content).decode()
+        line = json.dumps(interaction, separators=(",", ":"))
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = _open(self.path, "a")
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def _load(self) -> dict[str, deque]:
+        queues: dict[str, deque] = {}
+        try:
+            with _open(self.path, "r") as f:
+                for line in f:
+                    try:
+                        interaction = json.loads(line)
+                    except ValueError:
+                        continue
+                    queues.setdefault(interaction["key"], deque()).append(interaction)
+        except FileNotFoundError:
+            raise ConfigError(f"Cassette {self.path} does not exist") from None
+        except EOFError:
+            # A gzipped cassette whose recording process died; keep what was read.
+            pass
+        return queues
+
+    def next_response(self, method: str, url: str, body: bytes | str | None) -> dict:
+        """The recorded response to a request, in recording order.
+
+        Identical requests get their recorded responses one after another, and
+        the last one again once they run out, so extra retries or polls still
+        get an answer.
+        """
+        key = request_key(method, url, body)
+        with self._lock:
+            if self._queues is None:
+                self._queues = self._load()
+            queue = self._queues.get(key)
+            if not queue:
+                raise GhUtilsError(f"No recorded response for {method} {url} in {self.path}")
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RecordingAdapter(TimedHTTPAdapter):
+    """Sends requests to the network as usual and records each exchange to ``cassette``."""
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        start = time.perf_counter()
+        response = super().send(request, **kwargs)
+        if not kwargs.get("stream"):
+            # Read the body here so the recorded time covers the whole download.
+            response.content
+        self.cassette.record(request, response, time.perf_counter() - start)
+        return response
+
+
+def _status_phrase(status: int) -> str | None:
+    """The standard reason for ``status``, for cassettes recorded without one."""
+    try:
+        return http.HTTPStatus(status).phrase
+    except ValueError:
+        return None
+
+
+class ReplayAdapter(BaseAdapter):
+    """Answers every request from ``cassette`` without touching the network.
+
+    Each response is delayed by its recorded time multiplied by
+    ``latency_scale``: ``0`` replies at once, ``1`` at recorded speed.
+    A request the cassette has no answer for raises :class:`GhUtilsError`.
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 0.0):
+        super().__init__()
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+
+    def send(self, request, **kwargs):
+        interaction = self.cassette.next_response(request.method, request.url, request.body)
+        seconds = interaction["seconds"]
+        if self.latency_scale:
+            time.sleep(seconds * self.latency_scale)
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.reason = interaction.get("reason") or _status_phrase(response.status_code)
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        if "body_base64" in interaction:
+            response._content = base64.b64decode(interaction["body_base64"])
+        else:
+            response._content = interaction["body"].encode("utf-8")
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = datetime.timedelta(seconds=seconds)
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+_cassettes: dict[Path, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def shared_cassette(path: str | Path) -> Cassette:
+    """The process-wide :class:`Cassette` for ``path``, so every client records to (or replays) one sequence."""
+    path = Path(path).absolute()
+    with _cassettes_lock:
+        if path not in _cassettes:
+            _cassettes[path] = Cassette(path)
+            # A gzipped cassette is only readable once its stream is closed.
+            atexit.register(_cassettes[path].close)
+        return _cassettes[path]
+
+
+def transport_from_env(pool_size: int) -> HTTPAdapter | BaseAdapter | None:
+    """A recording or replaying transport as set by ``GH_UTILS_RECORD`` / ``GH_UTILS_REPLAY``, else ``None``."""
+    record_path = config.get_record_path()
+    replay_path = config.get_replay_path()
+    if record_path and replay_path:
+        raise ConfigError("Set GH_UTILS_RECORD or GH_UTILS_REPLAY, not both")
+    if record_path:
+        return RecordingAdapter(shared_cassette(record_path), pool_connections=1, pool_maxsize=pool_size)
+    if replay_path:
+        return ReplayAdapter(shared_cassette(replay_path), config.get_replay_latency())
+    return None
@@ -0,0 +1,175 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+DEFAULT_SETTLE = 1.0
+DEFAULT_WINDOW = 2.0
+DEFAULT_POLL_INTERVAL = 1.0
+# Longest the loop blocks in one wait, so a stop request is noticed promptly.
+MAX_WAIT = 1.0
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+# struct inotify_event: int wd; uint32_t mask, cookie, len; char name[len]
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_report(name: str) -> bool:
+    """Markdown files count; hidden files such as editor swap files do not."""
+    return name.endswith(".md") and not name.startswith(".")
+
+
+def list_reports(directory: Path) -> list[Path]:
+    return sorted(path for path in directory.iterdir() if is_report(path.name) and path.is_file())
+
+
+def _libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+class InotifyWatcher:
+    """Reports changed markdown files in one directory through Linux inotify."""
+
+    def __init__(self, directory: str | Path, libc=None):
+        self.directory = Path(directory)
+        libc = libc or _libc()
+        if libc is None:
+            raise OSError("inotify is not available")
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        if libc.inotify_add_watch(self._fd, os.fsencode(self.directory), WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, os.strerror(errno), str(self.directory))
+
+    def changes(self, timeout: float) -> set[Path]:
+        """Wait up to ``timeout`` seconds and return the files that changed meanwhile."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, mask, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b"\0").decode(errors="surrogateescape")
+            offset += name_length
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped; treat every report as possibly changed.
+                changed.update(list_reports(self.directory))
+            elif is_report(name):
+                changed.add(self.directory / name)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Reports changed markdown files by comparing directory scans; works everywhere."""
+
+    def __init__(self, directory: str | Path, interval: float = DEFAULT_POLL_INTERVAL):
+        self.directory = Path(directory)
+        self.interval = interval
+        self._seen = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        stats = {}
+        for path in list_reports(self.directory):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def changes(self, timeout: float) -> set[Path]:
+        time.sleep(min(timeout, self.interval))
+        current = self._scan()
+        changed = {path for path, stamp in current.items() if self._seen.get(path) != stamp}
+        self._seen = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def create_watcher(directory: str | Path, poll: bool = False, interval: float = DEFAULT_POLL_INTERVAL):
+    """An inotify watcher where available (Linux), else a polling one."""
+    if not poll:
+        try:
+            return InotifyWatcher(directory)
+        except OSError:
+            pass
+    return PollingWatcher(directory, interval)
+
+
+def run(
+    watcher,
+    handle_batch: Callable[[list[Path]], None],
+    settle: float = DEFAULT_SETTLE,
+    window: float = DEFAULT_WINDOW,
+    initial: Iterable[Path] = (),
+    stop: threading.Event | None = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> None:
+    """Feed settled files from ``watcher`` to ``handle_batch`` in batches until ``stop`` is set.
+
+    A file is settled once it has had no events for ``settle`` seconds, so a
+    report still being written is not picked up half done. The first settled
+    file opens a batching window of ``window`` seconds, and every file that
+    settles within it goes into the same batch. ``initial`` files are treated
+    as if they had just changed.
+    """
+    stop = stop or threading.Event()
+    pending = {path: clock() for path in initial}
+    batch: list[Path] = []
+    batch_started = None
+    while not stop.is_set():
+        now = clock()
+        deadlines = [last + settle - now for last in pending.values()]
+        if batch:
+            deadlines.append(batch_started + window - now)
+        timeout = min([MAX_WAIT, *deadlines])
+        for path in watcher.changes(max(0.0, timeout)):
+            pending[path] = clock()
+            if path in batch:
+                batch.remove(path)
+        if not batch:
+            batch_started = None
+
+        now = clock()
+        for path, last in list(pending.items()):
+            if now - last >= settle:
+                del pending[path]
+                if path.is_file():
+                    batch.append(path)
+                    batch_started = batch_started if batch_started is not None else now
+        if batch and now - batch_started >= window:
+            handle_batch(batch)
+            batch, batch_started = [], None
@@ -0,0 +1,134 @@
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from gh_utils.async_client import AsyncGitHubClient  # noqa: E402
+from gh_utils.exceptions import GitHubAPIError  # noqa: E402
+from gh_utils.ratelimit import RateLimiter  # noqa: E402
+
+
+def _client(handler, **kwargs):
+    return AsyncGitHubClient("ghp_test", transport=httpx.MockTransport(handler), **kwargs)
+
+
+########## Test Create Issue
+
+
+def test_create_issue_successfully():
+    def handler(request):
+        payload = json.loads(request.content)
+        assert request.url.path == "/repos/owner/repo/issues"
+        assert request.headers["Authorization"] == "Bearer ghp_test"
+        assert payload == {"title": "T", "body": "B", "labels": ["bug"]}
+        return httpx.Response(201, json={"number": 7, "node_id": "I_7"})
+
+    async def run():
+        async with _client(handler) as client:
+            return await client.create_issue("owner", "repo", "T", "B", ["bug"])
+
+    assert asyncio.run(run())["number"] == 7
+
+
+def test_create_issue_raises_on_api_error():
+    def handler(request):
+        return httpx.Response(422, text='{"message": "Validation Failed"}')
+
+    async def run():
+        async with _client(handler) as client:
+            await client.create_issue("o", "r", "T", "B")
+
+    with pytest.raises(GitHubAPIError, match="422") as exc_info:
+        asyncio.run(run())
+
+    assert exc_info.value.status_code == 422
+    assert "Validation Failed" in exc_info.value.response_body
+
+
+########## Test Find Project ID by Title
+
+
+def test_find_project_id_by_title_pages_through():
+    pages = {
+        None: {"nodes": [{"id": "PVT_a", "title": "Other"}], "pageInfo": {"hasNextPage": True, "endCursor": "c1"}},
+        "c1": {"nodes": [{"id": "PVT_b", "title": "Board"}], "pageInfo": {"hasNextPage": False, "endCursor": None}},
+    }
+
+    def handler(request):
+        variables = json.loads(request.content)["variables"]
+        assert variables["query"] == "Board"
+        cursor = variables["cursor"]
+        return httpx.Response(200, json={"data": {"organization": {"projectsV2": pages[cursor]}}})
+
+    async def run():
+        async with _client(handler) as client:
+            return await client.find_project_id_by_title("org", "Board")
+
+    assert asyncio.run(run()) == "PVT_b"
+
+
+########## Test Add to project
+
+
+def test_add_to_project_raises_on_graphql_error():
+    def handler(request):
+        return httpx.Response(200, json={"errors": [{"message": "Could not resolve"}]})
+
+    async def run():
+        async with _client(handler) as client:
+            await client.add_to_project("bad", "I_x")
+
+    with pytest.raises(GitHubAPIError, match="GraphQL error"):
+        asyncio.run(run())
+
+
+def test_concurrency_limit_bounds_in_flight_requests():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"data": {"addProjectV2ItemById": {"item": {"id": "PVTI"}}}})
+
+    async def run():
+        async with _client(handler, concurrency=3) as client:
+            await asyncio.gather(*(client.add_to_project("p", f"I_{i}") for i in range(20)))
+
+    asyncio.run(run())
+    assert peak == 3
+
+
+def test_retries_server_errors():
+    statuses = iter([503, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={"data": {"addProjectV2ItemById": {"item": {"id": "PVTI"}}}})
+
+    async def run():
+        limiter = RateLimiter(backoff_base=0.001)
+        async with _client(handler, rate_limiter=limiter) as client:
+            return await client.add_to_project("p", "I_1")
+
+    assert asyncio.run(run())["data"]["addProjectV2ItemById"]["item"]["id"] == "PVTI"
+
+
+def test_create_is_not_retried_after_server_error():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(502, text="Bad Gateway")
+
+    async def run():
+        async with _client(handler, rate_limiter=RateLimiter(backoff_base=0.001)) as client:
+            await client.create_issue("o", "r", "T", "B")
+
+    with pytest.raises(GitHubAPIError, match="502"):
+        asyncio.run(run())
+    assert len(calls) == 1
@@ -0,0 +1,277 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from gh_utils.bulk import (
+    IssueResult,
+    IssueSpec,
+    add_to_project,
+    collect_markdown_files,
+    create_issues,
+    create_one,
+    fan_out,
+    imap_unordered,
+    load_specs,
+    parse_repos,
+    spec_from_markdown,
+    spec_from_record,
+)
+from gh_utils.exceptions import ConfigError, GitHubAPIError
+from gh_utils.github_client import ItemResult
+from gh_utils.issue_index import IssueIndex
+from gh_utils.journal import Journal
+
+
+@pytest.fixture
+def issues_dir(tmp_path):
+    (tmp_path / "b.md").write_text("# Second\n\nBody B")
+    (tmp_path / "a.md").write_text("# First\nBody A")
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+########## Test Loading Specs
+
+
+def test_spec_from_markdown_uses_heading_as_title(issues_dir):
+    spec = spec_from_markdown(issues_dir / "b.md", ["bug"])
+
+    assert spec.title == "Second"
+    assert spec.body == "Body B"
+    assert spec.labels == ["bug"]
+
+
+def test_spec_from_markdown_falls_back_to_file_name(tmp_path):
+    path = tmp_path / "no-heading.md"
+    path.write_text("Just a body")
+
+    spec = spec_from_markdown(path)
+
+    assert spec.title == "no-heading"
+    assert spec.body == "Just a body"
+
+
+def test_collect_markdown_files_from_directory(issues_dir):
+    assert [p.name for p in collect_markdown_files(str(issues_dir))] == ["a.md", "b.md"]
+
+
+def test_collect_markdown_files_from_glob(issues_dir):
+    assert [p.name for p in collect_markdown_files(str(issues_dir / "b*.md"))] == ["b.md"]
+
+
+def test_collect_markdown_files_from_manifest(issues_dir):
+    manifest = issues_dir / "manifest.txt"
+    manifest.write_text("# comment\nb.md\n\na.md\n")
+
+    assert [p.name for p in collect_markdown_files(str(manifest))] == ["b.md", "a.md"]
+
+
+def test_collect_markdown_files_missing_source(tmp_path):
+    with pytest.raises(ConfigError, match="No such file"):
+        collect_markdown_files(str(tmp_path / "missing"))
+
+
+def test_load_specs_keeps_source_order(issues_dir):
+    specs = load_specs([str(issues_dir / "b.md"), str(issues_dir / "a.md")])
+
+    assert [s.title for s in specs] == ["Second", "First"]
+
+
+def test_spec_from_record(tmp_path):
+    body_file = tmp_path / "body.md"
+    body_file.write_text("From file")
+
+    assert spec_from_record({"title": "T", "body": "B", "labels": "bug"}) == IssueSpec("T", "B", ["bug"])
+    assert spec_from_record({"title": "T", "body_file": str(body_file), "id": "x"}).body == "From file"
+    with pytest.raises(ConfigError, match="title"):
+        spec_from_record({"body": "no title"})
+    with pytest.raises(ConfigError, match="'labels' must be a list of strings"):
+        spec_from_record({"title": "T", "labels": 3})
+    with pytest.raises(ConfigError, match="'labels' must be a list of strings"):
+        spec_from_record({"title": "T", "labels": [1]})
+    with pytest.raises(ConfigError, match="'body' must be a string"):
+        spec_from_record({"title": "T", "body": {"text": "B"}})
+    with pytest.raises(ConfigError, match="'title' must be a string"):
+        spec_from_record({"title": ["T"]})
+
+
+########## Test Streaming
+
+
+def test_imap_unordered_bounds_read_ahead():
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    results = imap_unordered(lambda x: x * 2, items(), concurrency=2, max_in_flight=4)
+    first = next(results)
+
+    assert first % 2 == 0
+    assert len(consumed) <= 5
+    assert sorted([first, *results]) == [i * 2 for i in range(100)]
+
+
+########## Test Create Issues
+
+
+def test_create_issues_keeps_input_order_and_isolates_errors():
+    client = MagicMock()
+
+    def _create(owner, repo, title, body, labels):
+        if title == "bad":
+            raise GitHubAPIError("GitHub API error: 422", status_code=422)
+        return {"number": int(title), "html_url": f"url/{title}"}
+
+    client.create_issue.side_effect = _create
+    specs = [IssueSpec(title=t, body="") for t in ("1", "bad", "3")]
+
+    results = create_issues(client, "o", "r", specs, concurrency=3)
+
+    assert [r.spec.title for r in results] == ["1", "bad", "3"]
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[2].issue["number"] == 3
+    assert results[1].error.status_code == 422
+
+
+########## Test Fan-out
+
+
+def test_parse_repos():
+    names = ["acme/api", " web ", "# comment", "", "acme/api", "other/api"]
+
+    assert parse_repos(names, default_owner="acme") == [("acme", "api"), ("acme", "web"), ("other", "api")]
+    with pytest.raises(ConfigError, match="owner/name"):
+        parse_repos(["web"])
+    with pytest.raises(ConfigError, match="owner/name"):
+        parse_repos(["a/b/c"])
+
+
+def test_fan_out_creates_in_every_repo_and_batches_adds():
+    client = MagicMock()
+
+    def _create(owner, repo, title, body, labels):
+        if repo == "gone":
+            raise GitHubAPIError("GitHub API error: 404", status_code=404)
+        return {"number": len(repo), "html_url": f"url/{repo}", "node_id": f"I_{repo}"}
+
+    client.create_issue.side_effect = _create
+    client.add_many_to_project.return_value = [ItemResult("I_api", item_id="PVTI_api"), ItemResult("I_web", error="no")]
+    spec = IssueSpec(title="Bump", body="x", labels=["deps"])
+
+    results = fan_out(
+        client, [("o", "api"), ("o", "gone"), ("o", "web")], spec, concurrency=3, project_id="PVT_p", batch_size=5
+    )
+
+    assert [r.spec.source for r in results] == ["o/api", "o/gone", "o/web"]
+    assert [r.ok for r in results] == [True, False, False]
+    assert results[0].item_id == "PVTI_api"
+    assert "Adding to project failed: no" in str(results[2].error)
+    assert results[2].issue["number"] == 3
+    client.create_issue.assert_any_call("o", "web", "Bump", "x", ["deps"])
+    client.add_many_to_project.assert_called_once_with("PVT_p", ["I_api", "I_web"], batch_size=5, fields=None)
+    assert spec.source == ""
+
+
+########## Test Journal and Resume
+
+
+def test_create_issues_skips_journaled_issues(tmp_path):
+    journal = Journal(tmp_path / "run.jsonl")
+    specs = [IssueSpec(title="done", body="x"), IssueSpec(title="new", body="y")]
+    journal.record(specs[0].key("o", "r"), "created", number=1, html_url="url/1", node_id="I_1")
+    client = MagicMock()
+    client.create_issue.return_value = {"number": 2, "html_url": "url/2", "node_id": "I_2"}
+
+    results = create_issues(client, "o", "r", specs, journal=journal)
+
+    client.create_issue.assert_called_once_with("o", "r", "new", "y", None)
+    assert results[0].resumed
+    assert results[0].issue["number"] == 1
+    assert journal.get(specs[1].key("o", "r"))["node_id"] == "I_2"
+
+
+def test_add_to_project_batches_and_skips_journaled_adds(tmp_path):
+    journal = Journal(tmp_path / "run.jsonl")
+    specs = [IssueSpec(title=t, body="") for t in ("a", "b", "c")]
+    journal.record(specs[0].key("o", "r"), "added", project_id="PVT_p", item_id="PVTI_a")
+    results = [
+        IssueResult(specs[0], issue={"node_id": "I_a"}),
+        IssueResult(specs[1], issue={"node_id": "I_b"}),
+        IssueResult(specs[2], issue={"node_id": "I_c"}),
+    ]
+    client = MagicMock()
+    client.add_many_to_project.return_value = [
+        ItemResult("I_b", item_id="PVTI_b"),
+        ItemResult("I_c", error="boom"),
+    ]
+
+    add_to_project(client, "o", "r", "PVT_p", results, batch_size=10, journal=journal)
+
+    client.add_many_to_project.assert_called_once_with("PVT_p", ["I_b", "I_c"], batch_size=10, fields=None)
+    assert [r.item_id for r in results] == ["PVTI_a", "PVTI_b", None]
+    assert "boom" in str(results[2].error)
+    assert journal.done(specs[1].key("o", "r"), "added")
+    assert not journal.done(specs[2].key("o", "r"), "added")
+
+
+def test_create_issues_skips_indexed_issues(tmp_path):
+    index = IssueIndex(tmp_path / "index.json")
+    index.add({"number": 1, "node_id": "I_1", "html_url": "url/1"}, "exists")
+    client = MagicMock()
+    client.create_issue.return_value = {"number": 2, "html_url": "url/2", "node_id": "I_2"}
+    specs = [IssueSpec(title="exists", body="x"), IssueSpec(title="new", body="y"), IssueSpec(title="new", body="y")]
+
+    results = create_issues(client, "o", "r", specs, concurrency=1, index=index)
+
+    client.create_issue.assert_called_once_with("o", "r", "new", "y", None)
+    assert [r.skipped for r in results] == [True, False, True]
+    assert results[2].issue["number"] == 2
+
+
+def test_create_issues_does_not_match_indexed_issues_by_body(tmp_path):
+    index = IssueIndex(tmp_path / "index.json")
+    client = MagicMock()
+    client.list_issues.return_value = iter([{
+        "number": 1, "title": "Upgrade lodash in api", "body": "Bump lodash", "node_id": "I_1",
+        "html_url": "url/1", "updated_at": "2026-01-01T00:00:00Z",
+    }])
+    index.refresh(client, "o", "r")
+    client.create_issue.side_effect = [
+        {"number": 2, "html_url": "url/2", "node_id": "I_2"},
+        {"number": 3, "html_url": "url/3", "node_id": "I_3"},
+    ]
+    specs = [
+        IssueSpec(title="Upgrade lodash in web", body="Bump lodash"),
+        IssueSpec(title="Upgrade lodash in cli", body="Bump lodash"),
+    ]
+
+    results = create_issues(client, "o", "r", specs, concurrency=1, index=index)
+
+    assert client.create_issue.call_count == 2
+    assert not any(r.skipped for r in results)
+    assert [r.issue["number"] for r in results] == [2, 3]
+
+
+def test_create_one_adds_to_project():
+    client = MagicMock()
+    client.create_issue.return_value = {"number": 1, "node_id": "I_1"}
+    client.add_to_project.return_value = {"data": {"addProjectV2ItemById": {"item": {"id": "PVTI_1"}}}}
+
+    result = create_one(client, "o", "r", IssueSpec("T", "B"), "PVT_p")
+
+    client.add_to_project.assert_called_once_with("PVT_p", "I_1")
+    assert result.item_id == "PVTI_1"
+
+
+def test_create_one_keeps_issue_when_add_fails():
+    client = MagicMock()
+    client.create_issue.return_value = {"number": 1, "node_id": "I_1"}
+    client.add_to_project.side_effect = GitHubAPIError("GraphQL error: nope")
+
+    result = create_one(client, "o", "r", IssueSpec("T", "B"), "PVT_p")
+
+    assert result.issue["number"] == 1
+    assert not result.ok
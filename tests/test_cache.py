@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from gh_utils.cache import NodeIdCache, project_key
+
+
+@pytest.fixture
+def node_cache(tmp_path):
+    return NodeIdCache(path=tmp_path / "cache" / "node-ids.json", ttl=60)
+
+
+def test_put_and_get(node_cache):
+    node_cache.put_many("projects", {project_key("org", "A"): "PVT_a", project_key("org", "B"): "PVT_b"})
+
+    assert node_cache.get("projects", project_key("org", "B")) == "PVT_b"
+    assert node_cache.get("projects", project_key("org", "C")) is None
+    assert node_cache.get("repositories", project_key("org", "A")) is None
+
+
+def test_entries_persist_across_instances(node_cache):
+    node_cache.put("projects", "org/A", "PVT_a")
+
+    assert NodeIdCache(path=node_cache.path, ttl=60).get("projects", "org/A") == "PVT_a"
+
+
+def test_expired_entries_are_ignored(node_cache, monkeypatch):
+    node_cache.put("projects", "org/A", "PVT_a")
+    monkeypatch.setattr("gh_utils.cache.time.time", lambda: 10**12)
+
+    assert node_cache.get("projects", "org/A") is None
+
+
+def test_corrupt_file_is_treated_as_empty(node_cache):
+    node_cache.path.parent.mkdir(parents=True)
+    node_cache.path.write_text("{not json")
+
+    assert node_cache.get("projects", "org/A") is None
+
+
+def test_clear(node_cache):
+    node_cache.put("projects", "org/A", "PVT_a")
+    node_cache.put("repositories", "org/repo", "R_1")
+
+    node_cache.clear("projects")
+
+    assert node_cache.get("projects", "org/A") is None
+    assert node_cache.get("repositories", "org/repo") == "R_1"
+
+
+def test_concurrent_instances_keep_every_entry(tmp_path):
+    path = tmp_path / "cache" / "node-ids.json"
+
+    def _fill(worker):
+        node_cache = NodeIdCache(path=path, ttl=60)
+        for i in range(25):
+            node_cache.put("projects", f"org/{worker}-{i}", f"PVT_{worker}_{i}")
+
+    threads = [threading.Thread(target=_fill, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    node_cache = NodeIdCache(path=path, ttl=60)
+    assert all(node_cache.get("projects", f"org/{w}-{i}") == f"PVT_{w}_{i}" for w in range(8) for i in range(25))
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_default_location_and_ttl(monkeypatch, tmp_path):
+    monkeypatch.setenv("GH_UTILS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("GH_UTILS_CACHE_TTL", "5")
+
+    node_cache = NodeIdCache()
+
+    assert node_cache.path == tmp_path / "node-ids.json"
+    assert node_cache.ttl == 5
@@ -1,9 +1,15 @@
-from unittest.mock import patch
+import json
+from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 from click.testing import CliRunner
 
+from gh_utils import config, metrics
 from gh_utils.cli import cli
+from gh_utils.exceptions import GitHubAPIError
+from gh_utils.github_client import ItemResult
+from gh_utils.mirror import ProjectMirror
 
 
 @pytest.fixture
@@ -12,7 +18,8 @@ def runner():
 
 
 @pytest.fixture
-def env_vars(monkeypatch):
+def env_vars(monkeypatch, tmp_path):
+    monkeypatch.setenv("GH_UTILS_CACHE_DIR", str(tmp_path / "cache"))
     monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
     monkeypatch.setenv("GITHUB_REPO_OWNER", "owner")
     monkeypatch.setenv("GITHUB_REPO_NAME", "repo")
@@ -83,6 +90,21 @@ def test_create_issue(runner, body_file, env_vars):
     )
 
 
+def test_create_issue_skip_existing(runner, body_file, env_vars):
+    existing = {
+        "number": 3, "title": "My Issue", "body": "old", "node_id": "I_3",
+        "html_url": "url/3", "updated_at": "2026-01-01T00:00:00Z",
+    }
+
+    with patch("gh_utils.cli.github_client.GitHubClient.list_issues", return_value=iter([existing])), \
+         patch("gh_utils.cli.github_client.create_issue") as mock_create:
+        result = runner.invoke(cli, ["create-issue", "-t", "My Issue", "-f", str(body_file), "--skip-existing"])
+
+    assert result.exit_code == 0
+    assert "Skipped: issue #3 already exists" in result.output
+    mock_create.assert_not_called()
+
+
 def test_create_issue_missing_required_option(runner):
     result = runner.invoke(cli, ["create-issue", "-t", "Title"])
     assert result.exit_code != 0
@@ -102,6 +124,33 @@ def test_add_to_project(runner, env_vars):
     assert "PVTI_999" in result.output
 
 
+def test_add_to_project_with_fields(runner, env_vars):
+    added = {"data": {"addProjectV2ItemById": {"item": {"id": "PVTI_999"}}}}
+    field_nodes = [{"id": "F_s", "name": "Status", "dataType": "SINGLE_SELECT", "options": [{"id": "O_1", "name": "Todo"}]}]
+
+    with patch("gh_utils.cli.github_client.GitHubClient.get_project_fields", return_value=field_nodes), \
+         patch("gh_utils.cli.github_client.add_to_project", return_value=added), \
+         patch("gh_utils.cli.github_client.set_item_fields", return_value={}) as mock_set:
+        result = runner.invoke(cli, ["add-to-project", "-i", "I_abc123", "--field", "Status=Todo"])
+
+    assert result.exit_code == 0
+    assert "Set 1 project field(s)." in result.output
+    mock_set.assert_called_once_with("ghp_test", "PVT_123", ["PVTI_999"], [("F_s", {"singleSelectOptionId": "O_1"})])
+
+
+def test_add_to_project_unknown_field_option(runner, env_vars):
+    field_nodes = [{"id": "F_s", "name": "Status", "dataType": "SINGLE_SELECT", "options": []}]
+
+    with patch("gh_utils.cli.github_client.GitHubClient.get_project_fields", return_value=field_nodes) as mock_fields, \
+         patch("gh_utils.cli.github_client.add_to_project") as mock_add:
+        result = runner.invoke(cli, ["add-to-project", "-i", "I_abc123", "--field", "Status=Todo"])
+
+    assert result.exit_code != 0
+    assert "no option 'Todo'" in str(result.exception)
+    assert mock_fields.call_count == 2  # the cached fields were looked up again once
+    mock_add.assert_not_called()
+
+
 def test_add_to_project_explicit_project_id(runner, env_vars):
     mock_result = {
         "data": {"addProjectV2ItemById": {"item": {"id": "PVTI_1"}}}
@@ -132,12 +181,120 @@ def test_add_to_project_by_title(runner, env_vars):
     )
 
 
+def test_add_to_project_by_title_uses_cache(runner, env_vars):
+    mock_result = {
+        "data": {"addProjectV2ItemById": {"item": {"id": "PVTI_3"}}}
+    }
+    projects = {"My Board": "PVT_mine", "Other Board": "PVT_other"}
+
+    with patch(
+        "gh_utils.cli.github_client.find_project_id_by_title",
+        side_effect=lambda token, owner, title: projects[title],
+    ) as mock_find, patch("gh_utils.cli.github_client.add_to_project", return_value=mock_result) as mock_add:
+        runner.invoke(cli, ["add-to-project", "-i", "I_1", "-T", "My Board"])
+        runner.invoke(cli, ["add-to-project", "-i", "I_2", "-T", "My Board"])
+        runner.invoke(cli, ["add-to-project", "-i", "I_3", "-T", "Other Board"])
+        runner.invoke(cli, ["add-to-project", "-i", "I_4", "-T", "Other Board", "--refresh-cache"])
+
+    assert mock_find.call_count == 3
+    assert [c.kwargs["project_id"] for c in mock_add.call_args_list] == [
+        "PVT_mine", "PVT_mine", "PVT_other", "PVT_other",
+    ]
+
+
+def test_add_to_project_by_unknown_title(runner, env_vars):
+    with patch(
+        "gh_utils.cli.github_client.find_project_id_by_title",
+        side_effect=GitHubAPIError("Project with title 'Nope' not found for owner 'owner'"),
+    ):
+        result = runner.invoke(cli, ["add-to-project", "-i", "I_1", "-T", "Nope"])
+
+    assert result.exit_code != 0
+    assert isinstance(result.exception, GitHubAPIError)
+
+
 def test_add_to_project_rejects_both_id_and_title(runner, env_vars):
     result = runner.invoke(cli, ["add-to-project", "-i", "I_node", "-p", "PVT_x", "-T", "Board"])
     assert result.exit_code != 0
     assert "not both" in result.output
 
 
+def test_create_issues_resume_skips_finished_steps(runner, tmp_path, env_vars):
+    (tmp_path / "a.md").write_text("# First\nBody A")
+    journal = tmp_path / "run.jsonl"
+    issue = {"number": 1, "html_url": "url/1", "node_id": "I_1"}
+    added = [ItemResult("I_1", item_id="PVTI_1")]
+
+    with patch("gh_utils.cli.github_client.GitHubClient.create_issue", return_value=issue) as mock_create, \
+         patch("gh_utils.cli.github_client.GitHubClient.add_many_to_project", return_value=added) as mock_add:
+        first = runner.invoke(cli, ["create-issues", str(tmp_path / "a.md"), "-p", "PVT_x", "--journal", str(journal)])
+        second = runner.invoke(cli, ["create-issues", str(tmp_path / "a.md"), "-p", "PVT_x", "--resume", str(journal)])
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert "Already created issue #1" in second.output
+    assert "PVTI_1" in second.output
+    mock_create.assert_called_once()
+    mock_add.assert_called_once()
+
+
+def test_create_issues_refuses_to_overwrite_journal(runner, body_file, tmp_path, env_vars):
+    journal = tmp_path / "run.jsonl"
+    journal.write_text("")
+
+    result = runner.invoke(cli, ["create-issues", str(body_file), "--journal", str(journal)])
+
+    assert result.exit_code != 0
+    assert "--resume" in result.output
+
+
+########## Test Add Many to Project
+
+
+def test_add_many_to_project(runner, tmp_path, env_vars):
+    ids_file = tmp_path / "ids.txt"
+    ids_file.write_text("I_2\n\nI_3\n")
+    results = [ItemResult("I_1", item_id="PVTI_1"), ItemResult("I_2", item_id="PVTI_2"), ItemResult("I_3", item_id="PVTI_3")]
+
+    with patch("gh_utils.cli.github_client.add_many_to_project", return_value=results) as mock_add:
+        result = runner.invoke(cli, ["add-many-to-project", "-i", "I_1", "-F", str(ids_file), "-b", "10"])
+
+    assert result.exit_code == 0
+    assert "I_3: Item ID: PVTI_3" in result.output
+    mock_add.assert_called_once_with("ghp_test", "PVT_123", ["I_1", "I_2", "I_3"], batch_size=10, fields=None)
+
+
+def test_add_many_to_project_skips_items_on_board(runner, env_vars, tmp_path):
+    with ProjectMirror(tmp_path / "cache" / "project-mirror.sqlite") as mirror:
+        mirror.record_added("PVT_123", {"I_1": "PVTI_1"})
+
+    with patch(
+        "gh_utils.cli.github_client.add_many_to_project", return_value=[ItemResult("I_2", item_id="PVTI_2")]
+    ) as mock_add:
+        result = runner.invoke(cli, ["add-many-to-project", "-i", "I_1", "-i", "I_2", "--skip-on-board"])
+
+    assert result.exit_code == 0
+    assert "I_1: Skipped: already on project. Item ID: PVTI_1" in result.output
+    mock_add.assert_called_once_with("ghp_test", "PVT_123", ["I_2"], batch_size=50, fields=None)
+    with ProjectMirror(tmp_path / "cache" / "project-mirror.sqlite") as mirror:
+        assert mirror.item_ids("PVT_123", ["I_2"]) == {"I_2": "PVTI_2"}
+
+
+def test_add_many_to_project_reports_failures(runner, env_vars):
+    results = [ItemResult("I_1", item_id="PVTI_1"), ItemResult("I_2", error="Could not resolve")]
+
+    with patch("gh_utils.cli.github_client.add_many_to_project", return_value=results):
+        result = runner.invoke(cli, ["add-many-to-project", "-i", "I_1", "-i", "I_2"])
+
+    assert result.exit_code != 0
+    assert "1 of 2 items failed" in result.output
+
+
+def test_add_many_to_project_requires_ids(runner, env_vars):
+    result = runner.invoke(cli, ["add-many-to-project"])
+    assert result.exit_code != 0
+
+
 ########## Test Create and Add
 
 def test_create_and_add(runner, body_file, env_vars):
@@ -186,3 +343,378 @@ def test_create_and_add_by_title(runner, body_file, env_vars):
     mock_add.assert_called_once_with(
         token="ghp_test", project_id="PVT_resolved", issue_node_id="I_node6"
     )
+
+
+########## Test Create Issues
+
+
+def test_create_issues(runner, tmp_path, env_vars):
+    (tmp_path / "a.md").write_text("# First\nBody A")
+    (tmp_path / "b.md").write_text("# Second\nBody B")
+
+    def _create(owner, repo, title, body, labels):
+        number = 1 if title == "First" else 2
+        return {"number": number, "html_url": f"url/{number}", "node_id": f"I_{number}"}
+
+    with patch("gh_utils.cli.github_client.GitHubClient.create_issue", side_effect=_create):
+        result = runner.invoke(cli, ["create-issues", str(tmp_path), "-c", "4"])
+
+    assert result.exit_code == 0
+    assert result.output.index("#1") < result.output.index("#2")
+
+
+def test_create_issues_reports_failures(runner, body_file, env_vars):
+    with patch(
+        "gh_utils.cli.github_client.GitHubClient.create_issue",
+        side_effect=GitHubAPIError("GitHub API error: 500"),
+    ):
+        result = runner.invoke(cli, ["create-issues", str(body_file)])
+
+    assert result.exit_code != 0
+    assert "1 of 1 issues failed" in result.output
+
+
+def test_create_and_add_single_request(runner, body_file, env_vars):
+    mock_issue = {"number": 7, "html_url": "url/7", "node_id": "I_7", "item_id": "PVTI_7"}
+    repository = {"id": "R_1", "labels": {"bug": "LA_bug"}}
+
+    with patch("gh_utils.cli.github_client.get_repository", return_value=repository) as mock_repo, \
+         patch("gh_utils.cli.github_client.create_issue_in_project", return_value=mock_issue) as mock_create, \
+         patch("gh_utils.cli.github_client.add_to_project") as mock_add:
+        first = runner.invoke(cli, ["create-and-add", "-t", "T", "-f", str(body_file), "-l", "bug", "--single-request"])
+        second = runner.invoke(cli, ["create-and-add", "-t", "T", "-f", str(body_file), "-l", "bug", "--single-request"])
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert "#7" in first.output
+    assert "PVTI_7" in first.output
+    mock_repo.assert_called_once_with("ghp_test", "owner", "repo")
+    mock_create.assert_called_with("ghp_test", "R_1", "PVT_123", "T", "# Issue\nSome content", ["LA_bug"])
+    mock_add.assert_not_called()
+
+
+def test_create_and_add_single_request_unknown_label(runner, body_file, env_vars):
+    repository = {"id": "R_1", "labels": {}}
+
+    with patch("gh_utils.cli.github_client.get_repository", return_value=repository):
+        result = runner.invoke(cli, ["create-and-add", "-t", "T", "-f", str(body_file), "-l", "nope", "--single-request"])
+
+    assert result.exit_code != 0
+    assert "nope" in str(result.exception)
+
+
+def test_create_issues_create_labels(runner, tmp_path, env_vars):
+    (tmp_path / "a.md").write_text("# First\nBody A")
+    created = {"number": 1, "html_url": "url/1", "node_id": "I_1"}
+
+    with patch("gh_utils.cli.github_client.GitHubClient.list_labels", return_value=iter([{"name": "bug", "node_id": "LA_1"}])), \
+         patch("gh_utils.cli.github_client.GitHubClient.create_label", return_value={"name": "p1", "node_id": "LA_2"}) as mock_label, \
+         patch("gh_utils.cli.github_client.GitHubClient.create_issue", return_value=created):
+        result = runner.invoke(cli, ["create-issues", str(tmp_path / "a.md"), "-l", "bug", "-l", "p1", "--create-labels"])
+
+    assert result.exit_code == 0
+    assert "Created labels: p1" in result.output
+    mock_label.assert_called_once_with("owner", "repo", "p1")
+
+
+########## Test Batch
+
+
+def test_batch_streams_jsonl_results(runner, env_vars):
+    specs = "\n".join([
+        json.dumps({"id": "a", "title": "First", "body": "A", "project_id": "PVT_x"}),
+        "",
+        json.dumps({"title": "Second", "body": "B"}),
+        "not json",
+    ])
+
+    def _create(owner, repo, title, body, labels):
+        number = 1 if title == "First" else 2
+        return {"number": number, "html_url": f"url/{number}", "node_id": f"I_{number}"}
+
+    added = {"data": {"addProjectV2ItemById": {"item": {"id": "PVTI_1"}}}}
+    with patch("gh_utils.cli.github_client.GitHubClient.create_issue", side_effect=_create), \
+         patch("gh_utils.cli.github_client.GitHubClient.add_to_project", return_value=added) as mock_add:
+        result = runner.invoke(cli, ["batch", "-c", "2"], input=specs)
+
+    assert result.exit_code != 0
+    assert "1 issues failed" in result.output
+    outputs = {o["line"]: o for o in map(json.loads, result.stdout.splitlines())}
+    assert outputs[1] == {"line": 1, "id": "a", "number": 1, "html_url": "url/1", "node_id": "I_1", "item_id": "PVTI_1"}
+    assert outputs[3]["number"] == 2
+    assert "item_id" not in outputs[3]
+    assert "error" in outputs[4]
+    mock_add.assert_called_once_with("PVT_x", "I_1")
+
+
+
+def test_batch_reports_malformed_records_and_keeps_streaming(runner, env_vars):
+    specs = "\n".join([
+        json.dumps({"id": "a", "title": "First"}),
+        json.dumps({"id": "b", "title": "c", "labels": 3}),
+        json.dumps({"id": "c", "title": "c", "labels": [1]}),
+        json.dumps({"id": "d", "title": "Second", "project_title": 7}),
+        json.dumps({"id": "e", "title": "Third"}),
+    ])
+
+    def _create(owner, repo, title, body, labels):
+        number = {"First": 1, "Third": 3}[title]
+        return {"number": number, "html_url": f"url/{number}", "node_id": f"I_{number}"}
+
+    with patch("gh_utils.cli.github_client.GitHubClient.create_issue", side_effect=_create), \
+            patch("gh_utils.cli._lookup_project_id", side_effect=AttributeError("'int' object has no attribute")):
+        result = runner.invoke(cli, ["batch", "-c", "2"], input=specs)
+
+    assert result.exit_code == 1
+    assert "3 issues failed" in result.output
+    outputs = {o["id"]: o for o in map(json.loads, result.stdout.splitlines())}
+    assert set(outputs) == {"a", "b", "c", "d", "e"}
+    assert outputs["a"]["number"] == 1 and outputs["e"]["number"] == 3
+    assert "labels" in outputs["b"]["error"] and "labels" in outputs["c"]["error"]
+    assert "attribute" in outputs["d"]["error"]
+
+
+########## Test Trace
+
+
+def test_trace_and_metrics_file(runner, body_file, env_vars, tmp_path):
+    response = requests.Response()
+    response.status_code = 201
+    response._content = json.dumps({"number": 10, "html_url": "url/10", "node_id": "I_abc"}).encode()
+    metrics_file = tmp_path / "metrics.json"
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response):
+        result = runner.invoke(cli, [
+            "--trace", "--metrics-file", str(metrics_file), "--metrics-format", "json",
+            "create-issue", "-t", "My Issue", "-f", str(body_file),
+        ])
+
+    assert result.exit_code == 0
+    assert "POST /repos/{owner}/{repo}/issues" in result.stderr
+    written = json.loads(metrics_file.read_text())
+    assert written["endpoints"]["POST /repos/{owner}/{repo}/issues"]["calls"] == 1
+    assert metrics.active() is None
+
+
+########## Test Create From Template
+
+
+def test_create_from_template(runner, tmp_path, env_vars):
+    template = tmp_path / "t.md"
+    template.write_text("# Upgrade $service\n\nOwner: $owner\n")
+    data = tmp_path / "rows.csv"
+    data.write_text("service,owner\napi,alice\nweb,bob\n")
+
+    def _create(owner, repo, title, body, labels):
+        number = 1 if "api" in title else 2
+        return {"number": number, "html_url": f"url/{number}", "node_id": f"I_{number}"}
+
+    with patch("gh_utils.cli.github_client.GitHubClient.create_issue", side_effect=_create) as mock_create:
+        result = runner.invoke(cli, ["create-from-template", str(template), str(data), "-l", "svc:$service"])
+
+    assert result.exit_code == 0
+    assert "rows.csv:1: Created issue #1: url/1" in result.output
+    assert "rows.csv:2: Created issue #2: url/2" in result.output
+    mock_create.assert_any_call("owner", "repo", "Upgrade web", "Owner: bob\n", ["svc:web"])
+
+
+def test_create_from_template_missing_column(runner, tmp_path, env_vars):
+    template = tmp_path / "t.md"
+    template.write_text("# Upgrade $service\n")
+    data = tmp_path / "rows.csv"
+    data.write_text("name\napi\n")
+
+    result = runner.invoke(cli, ["create-from-template", str(template), str(data)])
+
+    assert result.exit_code != 0
+    assert "service" in str(result.exception)
+
+
+
+########## Test Fan-out
+
+
+def test_fan_out(runner, body_file, tmp_path, env_vars):
+    repos_file = tmp_path / "repos.txt"
+    repos_file.write_text("# services\nacme/web\n")
+
+    def _create(owner, repo, title, body, labels):
+        if repo == "gone":
+            raise GitHubAPIError("GitHub API error: 404 - Not Found", status_code=404)
+        return {"number": 7, "html_url": f"url/{repo}", "node_id": f"I_{repo}"}
+
+    with patch("gh_utils.cli.github_client.GitHubClient.create_issue", side_effect=_create), \
+            patch(
+                "gh_utils.cli.github_client.GitHubClient.add_many_to_project",
+                return_value=[ItemResult("I_api", item_id="PVTI_api"), ItemResult("I_web", item_id="PVTI_web")],
+            ) as mock_add:
+        result = runner.invoke(cli, [
+            "fan-out", "api", "acme/gone", "-R", str(repos_file), "-t", "Bump", "-f", str(body_file), "-p", "PVT_p",
+        ])
+
+    assert result.exit_code == 1
+    lines = result.output.splitlines()
+    assert lines[0].split() == ["REPOSITORY", "ISSUE", "PROJECT", "ITEM", "RESULT"]
+    assert lines[1].split() == ["owner/api", "#7", "PVTI_api", "created"]
+    assert lines[2].split()[:4] == ["acme/gone", "-", "-", "error:"]
+    assert lines[3].split() == ["acme/web", "#7", "PVTI_web", "created"]
+    assert "1 of 3 repositories failed" in result.output
+    mock_add.assert_called_once_with("PVT_p", ["I_api", "I_web"], batch_size=50, fields=None)
+
+
+def test_fan_out_json(runner, body_file, env_vars):
+    issue = {"number": 1, "html_url": "url/1", "node_id": "I_1"}
+    with patch("gh_utils.cli.github_client.GitHubClient.create_issue", return_value=issue):
+        result = runner.invoke(cli, ["fan-out", "a/b", "-t", "T", "-f", str(body_file), "--json"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == [
+        {"repository": "a/b", "number": 1, "html_url": "url/1", "item_id": None, "error": None}
+    ]
+
+
+def test_fan_out_requires_repos(runner, body_file, env_vars):
+    result = runner.invoke(cli, ["fan-out", "-t", "T", "-f", str(body_file)])
+
+    assert result.exit_code != 0
+    assert "No repositories given" in result.output
+
+
+########## Test Sync and Query
+
+
+def test_sync_and_query(runner, env_vars):
+    item = {
+        "id": "PVTI_1",
+        "updatedAt": "2026-01-01T00:00:00Z",
+        "content": {"id": "I_1", "number": 4, "title": "Fix it", "state": "OPEN", "repository": {"nameWithOwner": "o/r"}},
+        "fieldValues": {"nodes": [{"name": "Todo", "field": {"name": "Status"}}]},
+    }
+
+    result = runner.invoke(cli, ["query"])
+    assert result.exit_code != 0
+    assert "has not been synced" in result.output
+
+    with patch(
+        "gh_utils.cli.github_client.GitHubClient.iter_project_item_stamps",
+        return_value=iter([{"id": "PVTI_1", "updatedAt": "2026-01-01T00:00:00Z"}]),
+    ), patch("gh_utils.cli.github_client.GitHubClient.get_project_items", return_value=[item]):
+        result = runner.invoke(cli, ["sync"])
+
+    assert result.exit_code == 0
+    assert "Synced 1 items: 1 fetched, 0 removed." in result.output
+
+    result = runner.invoke(cli, ["query", "--field", "Status=todo"])
+    assert result.exit_code == 0
+    assert result.output.splitlines()[1].split() == ["o/r#4", "OPEN", "Fix", "it", "Status=Todo"]
+
+    assert runner.invoke(cli, ["query", "--count", "--field", "Status=Done"]).output == "0\n"
+    assert json.loads(runner.invoke(cli, ["query", "--json"]).output)[0]["item_id"] == "PVTI_1"
+
+
+
+def test_query_needs_no_token(runner, env_vars, monkeypatch):
+    monkeypatch.delenv("GITHUB_TOKEN")
+    monkeypatch.delenv("GITHUB_REPO_OWNER")
+    with ProjectMirror(config.get_cache_dir() / "project-mirror.sqlite") as mirror:
+        mirror.sync(MagicMock(iter_project_item_stamps=lambda project_id: iter([])), "PVT_x")
+
+    result = runner.invoke(cli, ["query", "-p", "PVT_x", "--count"])
+
+    assert result.exit_code == 0
+    assert result.output == "0\n"
+
+
+########## Test Export Project
+
+
+def test_export_project(runner, tmp_path, env_vars):
+    page = {
+        "nodes": [{"id": "PVTI_1", "content": {"id": "I_1", "number": 1, "title": "T"}, "fieldValues": {"nodes": []}}],
+        "pageInfo": {"hasNextPage": False, "endCursor": "c1"},
+    }
+    output = tmp_path / "items.jsonl"
+
+    with patch("gh_utils.cli.github_client.GitHubClient.get_project_fields", return_value=[]), \
+            patch("gh_utils.cli.github_client.GitHubClient.get_project_items_page", return_value=page) as mock_page:
+        result = runner.invoke(cli, ["export-project", str(output), "--page-size", "50"])
+
+    assert result.exit_code == 0
+    assert f"Exported 1 items to {output}." in result.output
+    assert json.loads(output.read_text())["number"] == 1
+    mock_page.assert_called_once_with("PVT_123", None, 50)
+
+
+########## Test Bulk Edit
+
+
+def test_bulk_edit(runner, env_vars):
+    issues = [
+        {"id": "I_1", "number": 1, "repository": {"nameWithOwner": "o/r"}},
+        {"id": "I_2", "number": 2, "repository": {"nameWithOwner": "o/r"}},
+    ]
+
+    with patch("gh_utils.cli.github_client.GitHubClient.search_issues", return_value=iter(issues)), \
+            patch("gh_utils.cli.github_client.GitHubClient.get_issue_refs", return_value=issues[:1]) as mock_refs, \
+            patch(
+                "gh_utils.cli.github_client.GitHubClient.edit_issues",
+                return_value=[ItemResult("I_1"), ItemResult("I_2", error="locked")],
+            ) as mock_edit:
+        result = runner.invoke(cli, ["bulk-edit", "-q", "label:stale", "-i", "I_1", "--close", "--reason", "completed"])
+
+    assert result.exit_code == 1
+    assert "o/r#1: Updated" in result.output
+    assert "o/r#2: Error: locked" in result.output
+    assert "1 of 2 issues failed" in result.output
+    mock_refs.assert_called_once_with(["I_1"])
+    mock_edit.assert_called_once_with([
+        ("I_1", [("closeIssue", {"issueId": "I_1", "stateReason": "COMPLETED"})]),
+        ("I_2", [("closeIssue", {"issueId": "I_2", "stateReason": "COMPLETED"})]),
+    ], batch_size=50)
+
+
+def test_bulk_edit_dry_run(runner, env_vars):
+    issues = [{"id": "I_1", "number": 1, "repository": {"nameWithOwner": "o/r"}}]
+
+    with patch("gh_utils.cli.github_client.GitHubClient.search_issues", return_value=iter(issues)), \
+            patch("gh_utils.cli.github_client.GitHubClient.edit_issues") as mock_edit:
+        result = runner.invoke(cli, ["bulk-edit", "-q", "label:stale", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert result.output == "o/r#1\n1 issues selected.\n"
+    mock_edit.assert_not_called()
+
+
+def test_bulk_edit_usage_errors(runner, env_vars):
+    assert "Nothing to change" in runner.invoke(cli, ["bulk-edit", "-q", "x"]).output
+    assert "not both" in runner.invoke(cli, ["bulk-edit", "-q", "x", "--close", "--reopen"]).output
+    assert "Provide --query" in runner.invoke(cli, ["bulk-edit", "--close"]).output
+
+
+########## Test Watch
+
+
+def test_watch_files_batches_once(runner, tmp_path, env_vars):
+    reports = tmp_path / "reports"
+    reports.mkdir()
+    (reports / "a.md").write_text("# Disk full\nOn db-1")
+    (reports / "empty.md").write_text("")
+    issue = {"number": 1, "html_url": "url/1", "node_id": "I_1"}
+    added = [ItemResult("I_1", item_id="PVTI_1")]
+
+    def _run(watcher, handle_batch, settle, window, initial):
+        handle_batch(initial)
+        handle_batch(initial)
+        raise KeyboardInterrupt
+
+    with patch("gh_utils.cli.watch.run", side_effect=_run), \
+            patch("gh_utils.cli.github_client.GitHubClient.create_issue", return_value=issue) as mock_create, \
+            patch("gh_utils.cli.github_client.GitHubClient.add_many_to_project", return_value=added) as mock_add:
+        result = runner.invoke(cli, ["watch", str(reports), "-p", "PVT_x", "--poll"])
+
+    assert result.exit_code == 0
+    assert result.output.count("Created issue #1") == 1
+    assert "Added to project. Item ID: PVTI_1" in result.output
+    assert "Stopped watching." in result.output
+    mock_create.assert_called_once_with("owner", "repo", "Disk full", "On db-1", None)
+    mock_add.assert_called_once()
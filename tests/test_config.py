@@ -1,9 +1,15 @@
 import pytest
 
 from gh_utils.config import (
+    get_api_url,
+    get_cache_dir,
+    get_cache_ttl,
     get_github_token,
+    get_github_tokens,
+    get_graphql_url,
     get_project_id,
     get_repo_name,
+    get_replay_latency,
     get_repo_owner,
 )
 from gh_utils.exceptions import ConfigError
@@ -12,7 +18,7 @@ from gh_utils.exceptions import ConfigError
 @pytest.fixture
 def clear_env(monkeypatch):
     """Remove all GH config env vars so tests start clean."""
-    for var in ("GITHUB_TOKEN", "GITHUB_REPO_OWNER", "GITHUB_REPO_NAME", "GITHUB_PROJECT_ID"):
+    for var in ("GITHUB_TOKEN", "GITHUB_TOKENS", "GITHUB_REPO_OWNER", "GITHUB_REPO_NAME", "GITHUB_PROJECT_ID"):
         monkeypatch.delenv(var, raising=False)
 
 
@@ -26,6 +32,15 @@ def test_get_github_token_missing(clear_env):
         get_github_token()
 
 
+def test_get_github_tokens(clear_env, monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKENS", "ghp_b, ghp_c\nghp_a")
+    assert get_github_token() == "ghp_b"
+    assert get_github_tokens() == ["ghp_b", "ghp_c", "ghp_a"]
+
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_a")
+    assert get_github_tokens() == ["ghp_a", "ghp_b", "ghp_c"]
+
+
 def test_get_repo_owner(monkeypatch):
     monkeypatch.setenv("GITHUB_REPO_OWNER", "myorg")
     assert get_repo_owner() == "myorg"
@@ -54,3 +69,49 @@ def test_get_project_id(monkeypatch):
 def test_get_project_id_missing(clear_env):
     with pytest.raises(ConfigError, match="GITHUB_PROJECT_ID"):
         get_project_id()
+
+
+def test_get_cache_dir_override(monkeypatch, tmp_path):
+    monkeypatch.setenv("GH_UTILS_CACHE_DIR", str(tmp_path))
+    assert get_cache_dir() == tmp_path
+
+
+def test_get_cache_dir_from_xdg(monkeypatch, tmp_path):
+    monkeypatch.delenv("GH_UTILS_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert get_cache_dir() == tmp_path / "gh-utils"
+
+
+def test_get_cache_ttl_default(monkeypatch):
+    monkeypatch.delenv("GH_UTILS_CACHE_TTL", raising=False)
+    assert get_cache_ttl() == 24 * 60 * 60
+
+
+def test_get_cache_ttl_invalid(monkeypatch):
+    monkeypatch.setenv("GH_UTILS_CACHE_TTL", "soon")
+    with pytest.raises(ConfigError, match="GH_UTILS_CACHE_TTL"):
+        get_cache_ttl()
+
+
+def test_get_replay_latency(monkeypatch):
+    monkeypatch.delenv("GH_UTILS_REPLAY_LATENCY", raising=False)
+    assert get_replay_latency() == 0.0
+    monkeypatch.setenv("GH_UTILS_REPLAY_LATENCY", "0.5")
+    assert get_replay_latency() == 0.5
+    monkeypatch.setenv("GH_UTILS_REPLAY_LATENCY", "fast")
+    with pytest.raises(ConfigError, match="GH_UTILS_REPLAY_LATENCY"):
+        get_replay_latency()
+
+
+def test_api_urls_default_to_github_com(monkeypatch):
+    monkeypatch.delenv("GITHUB_API_URL", raising=False)
+    monkeypatch.delenv("GITHUB_GRAPHQL_URL", raising=False)
+    assert get_api_url() == "https://api.github.com"
+    assert get_graphql_url() == "https://api.github.com/graphql"
+
+
+def test_api_urls_for_enterprise_server(monkeypatch):
+    monkeypatch.setenv("GITHUB_API_URL", "https://ghe.example.com/api/v3/")
+    monkeypatch.delenv("GITHUB_GRAPHQL_URL", raising=False)
+    assert get_api_url() == "https://ghe.example.com/api/v3"
+    assert get_graphql_url() == "https://ghe.example.com/api/graphql"
@@ -0,0 +1,106 @@
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gh_utils import daemon, launcher
+from gh_utils.exceptions import GhUtilsError
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    # Unix socket paths are limited to ~100 bytes, so stay out of deep tmp dirs.
+    path = Path(tempfile.mkdtemp(prefix="ghu")) / "d.sock"
+    monkeypatch.setenv("GH_UTILS_DAEMON_SOCKET", str(path))
+    monkeypatch.delenv("GH_UTILS_NO_DAEMON", raising=False)
+    return path
+
+
+@pytest.fixture
+def server(socket_path):
+    server = daemon.DaemonServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def env_vars(monkeypatch, tmp_path):
+    monkeypatch.setenv("GH_UTILS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
+    monkeypatch.setenv("GITHUB_REPO_OWNER", "owner")
+    monkeypatch.setenv("GITHUB_REPO_NAME", "repo")
+
+
+def test_forward_without_daemon_returns_none(socket_path):
+    assert launcher.forward(["--help"]) is None
+
+
+def test_forward_skips_local_only_commands(server):
+    assert launcher.forward(["daemon", "--stop"]) is None
+    assert launcher.forward(["add-many-to-project", "-F", "-"]) is None
+    assert launcher.forward(["--help", "batch"]) is None
+    assert launcher.forward(["--metrics-file", "m.prom", "--trace", "batch"]) is None
+
+
+def test_command_name_skips_group_options():
+    assert launcher.command_name(["--trace", "--metrics-format", "json", "create-issue", "-t", "x"]) == "create-issue"
+    assert launcher.command_name(["--help"]) is None
+
+
+def test_daemon_ignores_empty_probe(server, socket_path):
+    with patch.object(server, "handle_error") as mock_handle_error:
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        probe.connect(str(socket_path))
+        probe.close()
+        # The daemon still answers, and handled the probe without an error.
+        assert launcher.forward(["--help"]) == 0
+
+    mock_handle_error.assert_not_called()
+
+
+def test_forward_runs_command_in_daemon(server, env_vars, tmp_path, monkeypatch, capsys):
+    (tmp_path / "body.md").write_text("Body")
+    issue = {"number": 4, "html_url": "url/4", "node_id": "I_4"}
+    monkeypatch.chdir(tmp_path)
+
+    with patch("gh_utils.cli.github_client.create_issue", return_value=issue) as mock_create:
+        exit_code = launcher.forward(["create-issue", "-t", "T", "-f", "body.md"])
+
+    assert exit_code == 0
+    assert "Created issue #4" in capsys.readouterr().out
+    mock_create.assert_called_once_with(token="ghp_test", owner="owner", repo="repo", title="T", body="Body", labels=None)
+
+
+def test_forward_reports_errors_and_exit_codes(server, env_vars, monkeypatch, capsys):
+    monkeypatch.delenv("GITHUB_TOKEN")
+
+    exit_code = launcher.forward(["add-to-project", "-i", "I_1"])
+
+    assert exit_code == 1
+    assert "GITHUB_TOKEN environment variable is not set" in capsys.readouterr().err
+    assert launcher.forward(["create-issue"]) == 2
+
+
+def test_daemon_restores_its_own_environment(server, env_vars, monkeypatch):
+    monkeypatch.setenv("GITHUB_REPO_NAME", "client-repo")
+
+    daemon.run_command(["--help"], {"GITHUB_REPO_NAME": "other"}, os.getcwd())
+
+    assert os.environ["GITHUB_REPO_NAME"] == "client-repo"
+
+
+def test_second_daemon_on_same_socket_is_refused(server, socket_path):
+    with pytest.raises(GhUtilsError, match="already listening"):
+        daemon.DaemonServer(socket_path)
+
+
+def test_stop(server, socket_path):
+    assert daemon.stop(socket_path)
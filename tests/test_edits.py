@@ -0,0 +1,87 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from gh_utils.cache import NodeIdCache
+from gh_utils.edits import EditPlanner, IssueChanges
+from gh_utils.exceptions import ConfigError
+
+ISSUES = [
+    {"id": "I_1", "number": 1, "repository": {"nameWithOwner": "o/api"}},
+    {"id": "I_2", "number": 2, "repository": {"nameWithOwner": "o/web"}},
+]
+
+
+@pytest.fixture
+def node_cache(tmp_path):
+    return NodeIdCache(tmp_path / "node-ids.json", ttl=60)
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.list_labels.side_effect = lambda owner, repo: iter([
+        {"name": "stale", "node_id": f"LA_stale_{repo}"},
+        {"name": "triage", "node_id": f"LA_triage_{repo}"},
+    ])
+    client.get_user_ids.return_value = {"Octocat": "U_octo"}
+    client.get_milestone_id.side_effect = lambda owner, repo, title: f"MI_{repo}"
+    return client
+
+
+def test_plan_resolves_ids_once_per_repo(client, node_cache):
+    changes = IssueChanges(
+        add_labels=["Triage"], remove_labels=["stale", "wontfix"], state="closed", state_reason="not_planned",
+        add_assignees=["octocat"], milestone="v2",
+    )
+
+    edits = EditPlanner(client, changes, node_cache).plan(ISSUES + [ISSUES[0]])
+
+    assert edits[1] == ("I_2", [
+        ("addLabelsToLabelable", {"labelableId": "I_2", "labelIds": ["LA_triage_web"]}),
+        ("removeLabelsFromLabelable", {"labelableId": "I_2", "labelIds": ["LA_stale_web"]}),
+        ("addAssigneesToAssignable", {"assignableId": "I_2", "assigneeIds": ["U_octo"]}),
+        ("updateIssue", {"id": "I_2", "milestoneId": "MI_web"}),
+        ("closeIssue", {"issueId": "I_2", "stateReason": "NOT_PLANNED"}),
+    ])
+    assert client.list_labels.call_count == 2
+    client.get_user_ids.assert_called_once_with(["octocat"])
+    assert client.get_milestone_id.call_count == 2
+
+
+def test_plan_skips_issues_without_changes(client, node_cache):
+    edits = EditPlanner(client, IssueChanges(remove_labels=["wontfix"]), node_cache).plan(ISSUES)
+
+    assert edits == []
+
+
+def test_plan_reopen_and_clear_milestone(client, node_cache):
+    edits = EditPlanner(client, IssueChanges(state="open", milestone=""), node_cache).plan(ISSUES[:1])
+
+    assert edits == [("I_1", [("updateIssue", {"id": "I_1", "milestoneId": None}), ("reopenIssue", {"issueId": "I_1"})])]
+    client.get_milestone_id.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "changes, message",
+    [
+        (IssueChanges(add_labels=["nope"]), "Labels not found in o/api: nope"),
+        (IssueChanges(add_assignees=["ghost"]), "Unknown users: ghost"),
+    ],
+)
+def test_plan_fails_before_any_change(client, node_cache, changes, message):
+    with pytest.raises(ConfigError, match=message):
+        EditPlanner(client, changes, node_cache).plan(ISSUES)
+
+
+def test_plan_unknown_milestone(client, node_cache):
+    client.get_milestone_id.side_effect = None
+    client.get_milestone_id.return_value = None
+
+    with pytest.raises(ConfigError, match="No milestone 'v9' in o/api"):
+        EditPlanner(client, IssueChanges(milestone="v9"), node_cache).plan(ISSUES)
+
+
+def test_changes_truthiness():
+    assert not IssueChanges()
+    assert IssueChanges(milestone="")
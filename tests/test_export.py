@@ -0,0 +1,125 @@
+import csv
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from gh_utils.exceptions import ConfigError
+from gh_utils.export import checkpoint_path, columns_for, export_project, format_for, iter_pages
+
+FIELD_NODES = [
+    {"id": "F_title", "name": "Title", "dataType": "TITLE"},
+    {"id": "F_status", "name": "Status", "dataType": "SINGLE_SELECT"},
+    {"id": "F_assignees", "name": "Assignees", "dataType": "ASSIGNEES"},
+    {"id": "F_points", "name": "Points", "dataType": "NUMBER"},
+]
+
+
+def _item(n):
+    return {
+        "id": f"PVTI_{n}",
+        "type": "ISSUE",
+        "updatedAt": "2026-01-01T00:00:00Z",
+        "content": {"id": f"I_{n}", "number": n, "title": f"Issue {n}", "repository": {"nameWithOwner": "o/r"}},
+        "fieldValues": {"nodes": [
+            {"text": f"Issue {n}", "field": {"name": "Title"}},
+            {"name": "Todo", "field": {"name": "Status"}},
+        ]},
+    }
+
+
+def _client(pages, fail_at=None):
+    """A client serving ``pages`` lists of item numbers, raising on page ``fail_at``."""
+    client = MagicMock()
+    client.get_project_fields.return_value = FIELD_NODES
+
+    def _page(project_id, cursor, page_size):
+        index = int(cursor or 0)
+        if index == fail_at:
+            raise RuntimeError("connection lost")
+        has_next = index + 1 < len(pages)
+        return {
+            "nodes": [_item(n) for n in pages[index]],
+            "pageInfo": {"hasNextPage": has_next, "endCursor": str(index + 1)},
+        }
+
+    client.get_project_items_page.side_effect = _page
+    return client
+
+
+########## Test Pages
+
+
+def test_iter_pages_follows_cursors():
+    client = _client([[1, 2], [3]])
+
+    pages = list(iter_pages(client, "PVT_p", page_size=2))
+
+    assert [[item["id"] for item in items] for items, _ in pages] == [["PVTI_1", "PVTI_2"], ["PVTI_3"]]
+    assert [cursor for _, cursor in pages] == ["1", "2"]
+    assert [c.args[1] for c in client.get_project_items_page.call_args_list] == [None, "1"]
+
+
+def test_columns_and_formats():
+    assert columns_for(FIELD_NODES)[-2:] == ["Status", "Points"]
+    assert format_for("out.CSV") == "csv"
+    assert format_for("out.txt", "jsonl") == "jsonl"
+    with pytest.raises(ConfigError, match="export format"):
+        format_for("out.txt")
+
+
+########## Test Export
+
+
+def test_export_jsonl(tmp_path):
+    path = tmp_path / "items.jsonl"
+
+    stats = export_project(_client([[1, 2], [3]]), "PVT_p", path)
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert stats.rows == 3
+    assert rows[0]["item_id"] == "PVTI_1"
+    assert rows[0]["Status"] == "Todo"
+    assert "Title" not in rows[0]
+    assert not checkpoint_path(path).exists()
+
+
+def test_export_csv_resumes_after_interruption(tmp_path):
+    path = tmp_path / "items.csv"
+
+    with pytest.raises(RuntimeError):
+        export_project(_client([[1, 2], [3], [4]], fail_at=2), "PVT_p", path)
+    assert json.loads(checkpoint_path(path).read_text())["cursor"] == "2"
+    with open(path, "a") as f:
+        f.write("half a ro")  # written after the last checkpoint
+    with pytest.raises(ConfigError, match="unfinished export"):
+        export_project(_client([[1]]), "PVT_p", path)
+
+    client = _client([[1, 2], [3], [4]])
+    stats = export_project(client, "PVT_p", path, resume=True)
+
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["number"] for row in rows] == ["1", "2", "3", "4"]
+    assert rows[3]["Status"] == "Todo"
+    assert stats.rows == 4 and stats.resumed
+    assert [c.args[1] for c in client.get_project_items_page.call_args_list] == ["2"]
+    client.get_project_fields.assert_not_called()
+    assert not checkpoint_path(path).exists()
+
+
+def test_resume_without_checkpoint(tmp_path):
+    with pytest.raises(ConfigError, match="No unfinished export"):
+        export_project(_client([[1]]), "PVT_p", tmp_path / "items.jsonl", resume=True)
+
+
+def test_export_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "items.parquet"
+    export_project(_client([[1], [2]]), "PVT_p", path)
+
+    table = pq.read_table(path)
+    assert table.column("number").to_pylist() == [1, 2]
+    assert table.column("Status").to_pylist() == ["Todo", "Todo"]
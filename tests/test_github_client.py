@@ -1,9 +1,22 @@
 from unittest.mock import patch, MagicMock
 
 import pytest
+import requests
 
 from gh_utils.exceptions import GitHubAPIError
-from gh_utils.github_client import create_issue, add_to_project, find_project_id_by_title
+from gh_utils.http_cache import HTTPCache
+from gh_utils.ratelimit import RateLimiter, TokenPool
+from gh_utils.github_client import (
+    GitHubClient,
+    add_many_to_project,
+    add_to_project,
+    create_issue,
+    create_issue_in_project,
+    find_project_id_by_title,
+    get_client,
+    get_repository,
+    list_projects,
+)
 
 
 @pytest.fixture
@@ -12,6 +25,8 @@ def ok_response():
     def _make(json_data):
         resp = MagicMock()
         resp.ok = True
+        resp.status_code = 200
+        resp.headers = {}
         resp.json.return_value = json_data
         return resp
     return _make
@@ -20,12 +35,13 @@ def ok_response():
 @pytest.fixture
 def error_response():
     """Factory for a failed API response."""
-    def _make(status_code, reason="Error", text=""):
+    def _make(status_code, reason="Error", text="", headers=None):
         resp = MagicMock()
         resp.ok = False
         resp.status_code = status_code
         resp.reason = reason
         resp.text = text
+        resp.headers = headers or {}
         return resp
     return _make
 
@@ -40,7 +56,7 @@ def test_create_issue_successfully(ok_response):
         "node_id": "I_abc123",
     })
 
-    with patch("gh_utils.github_client.requests.post", return_value=response) as mock_post:
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response) as mock_post:
         result = create_issue(
             token="ghp_test", owner="owner", repo="repo",
             title="Test issue", body="Issue body", labels=["bug"],
@@ -57,7 +73,7 @@ def test_create_issue_successfully(ok_response):
 def test_create_issue_without_labels(ok_response):
     response = ok_response({"number": 1, "html_url": "url", "node_id": "id"})
 
-    with patch("gh_utils.github_client.requests.post", return_value=response) as mock_post:
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response) as mock_post:
         create_issue(token="ghp_test", owner="o", repo="r", title="T", body="B")
 
     payload = mock_post.call_args.kwargs["json"]
@@ -67,13 +83,86 @@ def test_create_issue_without_labels(ok_response):
 def test_create_issue_raises_on_api_error(error_response):
     response = error_response(422, "Unprocessable Entity", '{"message": "Validation Failed"}')
 
-    with patch("gh_utils.github_client.requests.post", return_value=response):
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response):
         with pytest.raises(GitHubAPIError, match="422") as exc_info:
             create_issue(token="t", owner="o", repo="r", title="T", body="B")
 
     assert exc_info.value.status_code == 422
 
 
+########## Test List Issues
+
+
+def test_list_issues_follows_pagination_and_skips_pull_requests(ok_response):
+    first = ok_response([{"number": 1}, {"number": 2, "pull_request": {}}])
+    first.links = {"next": {"url": "https://api.github.com/repositories/1/issues?page=2"}}
+    second = ok_response([{"number": 3}])
+    second.links = {}
+
+    with patch("gh_utils.github_client.requests.Session.get", side_effect=[first, second]) as mock_get:
+        issues = list(GitHubClient("ghp_test").list_issues("o", "r", since="2026-01-01T00:00:00Z"))
+
+    assert [i["number"] for i in issues] == [1, 3]
+    assert mock_get.call_args_list[0].kwargs["params"]["since"] == "2026-01-01T00:00:00Z"
+    assert mock_get.call_args_list[0].kwargs["params"]["state"] == "all"
+    assert mock_get.call_args_list[1].args[0].endswith("page=2")
+    assert mock_get.call_args_list[1].kwargs["params"] is None
+
+
+def _http_response(status_code, body=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+def test_list_issues_uses_conditional_requests(tmp_path):
+    client = GitHubClient("ghp_test", http_cache=HTTPCache(tmp_path / "http.sqlite"))
+    fresh = _http_response(200, b'[{"number": 1}]', {"ETag": '"abc"', "Content-Type": "application/json"})
+    not_modified = _http_response(304, headers={"ETag": '"abc"', "X-RateLimit-Remaining": "4999"})
+
+    with patch("gh_utils.github_client.requests.Session.get", side_effect=[fresh, not_modified]) as mock_get:
+        first = list(client.list_issues("o", "r"))
+        second = list(client.list_issues("o", "r"))
+
+    assert first == second == [{"number": 1}]
+    assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+    assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+
+
+########## Test Labels
+
+
+def test_list_labels_paginates(ok_response):
+    response = ok_response([{"name": "bug", "node_id": "LA_1"}])
+    response.links = {}
+
+    with patch("gh_utils.github_client.requests.Session.get", return_value=response) as mock_get:
+        labels = list(GitHubClient("ghp_test").list_labels("o", "r"))
+
+    assert labels == [{"name": "bug", "node_id": "LA_1"}]
+    assert mock_get.call_args.args[0] == "https://api.github.com/repos/o/r/labels"
+    assert mock_get.call_args.kwargs["params"] == {"per_page": 100}
+
+
+def test_create_label(ok_response):
+    response = ok_response({"name": "needs triage", "node_id": "LA_2"})
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response) as mock_post:
+        label = GitHubClient("ghp_test").create_label("o", "r", "needs triage")
+
+    assert label["node_id"] == "LA_2"
+    assert mock_post.call_args.kwargs["json"] == {"name": "needs triage", "color": "ededed"}
+
+
+def test_get_label_quotes_name(ok_response):
+    with patch("gh_utils.github_client.requests.Session.get", return_value=ok_response({})) as mock_get:
+        GitHubClient("ghp_test").get_label("o", "r", "area/api")
+
+    assert mock_get.call_args.args[0] == "https://api.github.com/repos/o/r/labels/area%2Fapi"
+
+
 ########## Test Find Project ID by Title
 
 
@@ -92,10 +181,52 @@ def test_find_project_id_by_title(ok_response):
         }
     })
 
-    with patch("gh_utils.github_client.requests.post", return_value=response):
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response) as mock_post:
         result = find_project_id_by_title(token="ghp_test", owner="myorg", title="My Board")
 
     assert result == "PVT_bbb"
+    assert mock_post.call_args.kwargs["json"]["variables"]["query"] == "My Board"
+
+
+def test_find_project_id_by_title_stops_at_first_match(ok_response):
+    response = ok_response({
+        "data": {"organization": {"projectsV2": {
+            "nodes": [{"id": "PVT_aaa", "title": "My Board"}],
+            "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+        }}}
+    })
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response) as mock_post:
+        assert find_project_id_by_title(token="ghp_test", owner="myorg", title="My Board") == "PVT_aaa"
+
+    mock_post.assert_called_once()
+
+
+def test_find_project_id_by_title_falls_back_to_user(ok_response):
+    org_missing = ok_response({
+        "data": {"organization": None},
+        "errors": [{"type": "NOT_FOUND", "path": ["organization"], "message": "Could not resolve to an Organization"}],
+    })
+    user_projects = ok_response({
+        "data": {"user": {"projectsV2": {
+            "nodes": [{"id": "PVT_user", "title": "Personal"}],
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+        }}}
+    })
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=[org_missing, user_projects]) as mock_post:
+        result = find_project_id_by_title(token="ghp_test", owner="someone", title="Personal")
+
+    assert result == "PVT_user"
+    assert "user(login: $owner)" in mock_post.call_args.kwargs["json"]["query"]
+
+
+def test_find_project_id_by_title_unknown_owner(ok_response):
+    missing = ok_response({"data": {"organization": None, "user": None}, "errors": [{"type": "NOT_FOUND", "message": "x"}]})
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=missing):
+        with pytest.raises(GitHubAPIError, match="No organization or user"):
+            find_project_id_by_title(token="ghp_test", owner="ghost", title="Any")
 
 
 def test_find_project_id_by_title_not_found(ok_response):
@@ -110,11 +241,35 @@ def test_find_project_id_by_title_not_found(ok_response):
         }
     })
 
-    with patch("gh_utils.github_client.requests.post", return_value=response):
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response):
         with pytest.raises(GitHubAPIError, match="not found"):
             find_project_id_by_title(token="ghp_test", owner="myorg", title="Nope")
 
 
+########## Test List Projects
+
+
+def test_list_projects_pages_through_all(ok_response):
+    first = ok_response({
+        "data": {"organization": {"projectsV2": {
+            "nodes": [{"id": "PVT_a", "title": "A"}],
+            "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+        }}}
+    })
+    second = ok_response({
+        "data": {"organization": {"projectsV2": {
+            "nodes": [{"id": "PVT_b", "title": "B"}],
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+        }}}
+    })
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=[first, second]) as mock_post:
+        result = list_projects(token="ghp_test", owner="myorg")
+
+    assert result == {"A": "PVT_a", "B": "PVT_b"}
+    assert mock_post.call_args.kwargs["json"]["variables"]["cursor"] == "c1"
+
+
 ########## Test Add to project
 
 
@@ -123,7 +278,7 @@ def test_add_to_project_successfully(ok_response):
         "data": {"addProjectV2ItemById": {"item": {"id": "PVTI_123"}}}
     })
 
-    with patch("gh_utils.github_client.requests.post", return_value=response) as mock_post:
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response) as mock_post:
         result = add_to_project(token="ghp_test", project_id="PVT_abc", issue_node_id="I_xyz")
 
     mock_post.assert_called_once()
@@ -138,7 +293,7 @@ def test_add_to_project_raises_on_graphql_error(ok_response):
         "errors": [{"message": "Could not resolve to a ProjectV2"}]
     })
 
-    with patch("gh_utils.github_client.requests.post", return_value=response):
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response):
         with pytest.raises(GitHubAPIError, match="GraphQL error"):
             add_to_project(token="t", project_id="bad", issue_node_id="I_x")
 
@@ -146,6 +301,445 @@ def test_add_to_project_raises_on_graphql_error(ok_response):
 def test_add_to_project_raises_on_http_error(error_response):
     response = error_response(401, "Unauthorized", "Bad credentials")
 
-    with patch("gh_utils.github_client.requests.post", return_value=response):
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response):
         with pytest.raises(GitHubAPIError, match="401"):
             add_to_project(token="bad", project_id="p", issue_node_id="i")
+
+
+########## Test Add Many to Project
+
+
+def test_add_many_to_project_packs_aliased_mutations(ok_response):
+    def _respond(url, json, timeout):
+        count = len(json["variables"]) - 1
+        return ok_response({
+            "data": {f"a{i}": {"item": {"id": f"PVTI_{json['variables'][f'c{i}']}"}} for i in range(count)}
+        })
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=_respond) as mock_post:
+        results = add_many_to_project(
+            token="ghp_test", project_id="PVT_p", issue_node_ids=[f"I_{i}" for i in range(5)], batch_size=2,
+        )
+
+    assert mock_post.call_count == 3
+    query = mock_post.call_args_list[0].kwargs["json"]["query"]
+    assert "a0: addProjectV2ItemById" in query
+    assert "a1: addProjectV2ItemById" in query
+    assert [r.item_id for r in results] == [f"PVTI_I_{i}" for i in range(5)]
+    assert all(r.ok for r in results)
+
+
+def test_add_many_to_project_reports_errors_per_item(ok_response):
+    response = ok_response({
+        "data": {"a0": {"item": {"id": "PVTI_0"}}, "a1": None},
+        "errors": [{"message": "Could not resolve to a node", "path": ["a1"]}],
+    })
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response):
+        results = add_many_to_project(token="ghp_test", project_id="PVT_p", issue_node_ids=["I_0", "I_bad"])
+
+    assert results[0].item_id == "PVTI_0"
+    assert not results[1].ok
+    assert results[1].error == "Could not resolve to a node"
+
+
+def test_add_many_to_project_failed_request_does_not_stop_other_batches(ok_response, error_response):
+    responses = [
+        error_response(502, "Bad Gateway"),
+        ok_response({"data": {"a0": {"item": {"id": "PVTI_2"}}}}),
+    ]
+
+    client = GitHubClient("ghp_test", rate_limiter=RateLimiter(max_retries=0))
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=responses):
+        results = client.add_many_to_project("PVT_p", ["I_0", "I_1", "I_2"], batch_size=2)
+
+    assert [r.ok for r in results] == [False, False, True]
+    assert "502" in results[0].error
+
+
+def test_add_many_to_project_sets_fields_in_one_request_per_batch(ok_response):
+    added = ok_response({"data": {"a0": {"item": {"id": "PVTI_0"}}, "a1": {"item": {"id": "PVTI_1"}}}})
+    updated = ok_response({
+        "data": {"u0": {"projectV2Item": {"id": "PVTI_0"}}, "u1": {"projectV2Item": {"id": "PVTI_0"}},
+                 "u2": {"projectV2Item": {"id": "PVTI_1"}}, "u3": None},
+        "errors": [{"message": "Option not found", "path": ["u3"]}],
+    })
+    fields = [("F_status", {"singleSelectOptionId": "O_todo"}), ("F_points", {"number": 3.0})]
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=[added, updated]) as mock_post:
+        results = GitHubClient("ghp_test").add_many_to_project("PVT_p", ["I_0", "I_1"], fields=fields)
+
+    assert mock_post.call_count == 2
+    update = mock_post.call_args_list[1].kwargs["json"]
+    assert "u3: updateProjectV2ItemFieldValue" in update["query"]
+    assert "$v0: ProjectV2FieldValue!" in update["query"]
+    assert update["variables"]["i2"] == "PVTI_1"
+    assert update["variables"]["f3"] == "F_points"
+    assert update["variables"]["v3"] == {"number": 3.0}
+    assert results[0].ok
+    assert results[1].item_id == "PVTI_1"
+    assert results[1].error == "Setting fields failed: Option not found"
+
+
+def test_get_project_fields_pages(ok_response):
+    def _page(nodes, has_next):
+        return ok_response({"data": {"node": {"fields": {
+            "nodes": nodes, "pageInfo": {"hasNextPage": has_next, "endCursor": "c1" if has_next else None},
+        }}}})
+
+    responses = [_page([{"id": "F_1", "name": "Status"}, {}], True), _page([{"id": "F_2", "name": "Points"}], False)]
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=responses) as mock_post:
+        fields = GitHubClient("ghp_test").get_project_fields("PVT_p")
+
+    assert [f["id"] for f in fields] == ["F_1", "F_2"]
+    assert mock_post.call_args_list[1].kwargs["json"]["variables"] == {"projectId": "PVT_p", "cursor": "c1"}
+
+
+def test_iter_project_item_stamps_pages(ok_response):
+    def _page(nodes, has_next):
+        return ok_response({"data": {"node": {"items": {
+            "nodes": nodes, "pageInfo": {"hasNextPage": has_next, "endCursor": "c1" if has_next else None},
+        }}}})
+
+    responses = [_page([{"id": "PVTI_1", "updatedAt": "t1"}], True), _page([{"id": "PVTI_2", "updatedAt": "t2"}], False)]
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=responses) as mock_post:
+        stamps = list(GitHubClient("ghp_test").iter_project_item_stamps("PVT_p"))
+
+    assert [s["id"] for s in stamps] == ["PVTI_1", "PVTI_2"]
+    assert "ProjectItemStamps" in mock_post.call_args_list[0].kwargs["json"]["query"]
+
+
+def test_get_project_items_batches_node_lookups_and_skips_deleted(ok_response):
+    def _nodes(ids):
+        return ok_response({
+            "data": {"nodes": [None if i == "PVTI_gone" else {"id": i} for i in ids]},
+            "errors": [{"type": "NOT_FOUND", "message": "gone"}] if "PVTI_gone" in ids else [],
+        })
+
+    ids = ["PVTI_gone"] + [f"PVTI_{n}" for n in range(120)]
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=lambda url, **kw: _nodes(
+        kw["json"]["variables"]["ids"]
+    )) as mock_post:
+        items = GitHubClient("ghp_test").get_project_items(ids)
+
+    assert len(items) == 120
+    assert [len(c.kwargs["json"]["variables"]["ids"]) for c in mock_post.call_args_list] == [100, 21]
+
+
+########## Test Bulk Edit
+
+
+def test_edit_issues_packs_aliased_mutations(ok_response):
+    response = ok_response({
+        "data": {"e0_0": {"clientMutationId": None}, "e0_1": {"clientMutationId": None}, "e1_0": None},
+        "errors": [{"path": ["e1_0"], "message": "Could not resolve to a node"}],
+    })
+    edits = [
+        ("I_1", [("addLabelsToLabelable", {"labelableId": "I_1", "labelIds": ["LA_1"]}), ("closeIssue", {"issueId": "I_1"})]),
+        ("I_2", [("reopenIssue", {"issueId": "I_2"})]),
+        ("I_3", [("reopenIssue", {"issueId": "I_3"})]),
+    ]
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response) as mock_post:
+        results = GitHubClient("ghp_test").edit_issues(edits, batch_size=2)
+
+    assert mock_post.call_count == 2
+    payload = mock_post.call_args_list[0].kwargs["json"]
+    assert "mutation EditIssues($e0_0: AddLabelsToLabelableInput!, $e0_1: CloseIssueInput!" in payload["query"]
+    assert "e1_0: reopenIssue(input: $e1_0) { clientMutationId }" in payload["query"]
+    assert payload["variables"]["e0_1"] == {"issueId": "I_1"}
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].error == "Could not resolve to a node"
+
+
+def test_get_user_ids_skips_unknown_logins(ok_response):
+    response = ok_response({
+        "data": {"u0": {"id": "U_1", "login": "octocat"}, "u1": None},
+        "errors": [{"type": "NOT_FOUND", "path": ["u1"], "message": "Could not resolve"}],
+    })
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response) as mock_post:
+        assert GitHubClient("ghp_test").get_user_ids(["octocat", "ghost", "octocat"]) == {"octocat": "U_1"}
+
+    assert mock_post.call_args.kwargs["json"]["variables"] == {"l0": "octocat", "l1": "ghost"}
+
+
+def test_search_issues_skips_pull_requests(ok_response):
+    response = ok_response({"data": {"search": {
+        "nodes": [{"id": "I_1", "number": 1, "repository": {"nameWithOwner": "o/r"}}, {}],
+        "pageInfo": {"hasNextPage": False, "endCursor": None},
+    }}})
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response):
+        assert [i["id"] for i in GitHubClient("ghp_test").search_issues("repo:o/r label:stale")] == ["I_1"]
+
+
+########## Test Create Issue in Project
+
+
+def test_get_repository_collects_labels(ok_response):
+    response = ok_response({
+        "data": {"repository": {
+            "id": "R_1",
+            "labels": {
+                "nodes": [{"id": "LA_bug", "name": "bug"}],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            },
+        }}
+    })
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response):
+        result = get_repository(token="ghp_test", owner="o", repo="r")
+
+    assert result == {"id": "R_1", "labels": {"bug": "LA_bug"}}
+
+
+def test_create_issue_in_project_single_request(ok_response):
+    response = ok_response({
+        "data": {"createIssue": {"issue": {
+            "id": "I_new",
+            "number": 12,
+            "url": "https://github.com/o/r/issues/12",
+            "projectItems": {"nodes": [
+                {"id": "PVTI_other", "project": {"id": "PVT_other"}},
+                {"id": "PVTI_new", "project": {"id": "PVT_p"}},
+            ]},
+        }}}
+    })
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response) as mock_post:
+        result = create_issue_in_project(
+            token="ghp_test", repository_id="R_1", project_id="PVT_p", title="T", body="B", label_ids=["LA_bug"],
+        )
+
+    mock_post.assert_called_once()
+    variables = mock_post.call_args.kwargs["json"]["variables"]
+    assert variables["projectIds"] == ["PVT_p"]
+    assert variables["labelIds"] == ["LA_bug"]
+    assert result == {
+        "number": 12,
+        "html_url": "https://github.com/o/r/issues/12",
+        "node_id": "I_new",
+        "item_id": "PVTI_new",
+    }
+
+
+########## Test GitHubClient
+
+
+def test_client_sets_default_headers():
+    client = GitHubClient("ghp_test")
+
+    assert client.session.headers["Authorization"] == "Bearer ghp_test"
+    assert client.session.headers["X-GitHub-Api-Version"] == "2022-11-28"
+
+
+def test_client_pool_size():
+    client = GitHubClient("ghp_test", pool_size=32)
+
+    adapter = client.session.get_adapter("https://api.github.com")
+    assert adapter._pool_maxsize == 32
+
+
+def test_client_without_keep_alive():
+    client = GitHubClient("ghp_test", keep_alive=False)
+
+    assert client.session.headers["Connection"] == "close"
+
+
+def test_client_api_url(ok_response):
+    client = GitHubClient("ghp_test", api_url="http://127.0.0.1:8765/")
+
+    with patch.object(client.session, "post", return_value=ok_response({"data": {}})) as mock_post:
+        client.create_issue("o", "r", "A", "B")
+        client.graphql("query { viewer { login } }")
+
+    assert [c.args[0] for c in mock_post.call_args_list] == [
+        "http://127.0.0.1:8765/repos/o/r/issues",
+        "http://127.0.0.1:8765/graphql",
+    ]
+
+
+def test_get_client_follows_api_url(monkeypatch):
+    monkeypatch.setenv("GITHUB_API_URL", "http://127.0.0.1:8765")
+    local = get_client("ghp_shared")
+    monkeypatch.delenv("GITHUB_API_URL")
+
+    assert local.api_url == "http://127.0.0.1:8765"
+    assert local.graphql_url == "http://127.0.0.1:8765/graphql"
+    assert get_client("ghp_shared") is not local
+
+
+def test_get_client_is_shared_per_token():
+    assert get_client("ghp_shared") is get_client("ghp_shared")
+    assert get_client("ghp_shared") is not get_client("ghp_other")
+
+
+def test_free_functions_reuse_one_session(ok_response):
+    response = ok_response({"number": 1, "html_url": "url", "node_id": "id"})
+    session = get_client("ghp_reuse").session
+
+    with patch.object(session, "post", return_value=response) as mock_post:
+        create_issue(token="ghp_reuse", owner="o", repo="r", title="A", body="B")
+        add_to_project(token="ghp_reuse", project_id="p", issue_node_id="i")
+
+    assert mock_post.call_count == 2
+
+
+########## Test Retries
+
+
+def test_request_retries_server_errors(ok_response, error_response):
+    sleeps = []
+    client = GitHubClient("ghp_retry", rate_limiter=RateLimiter(sleep=sleeps.append))
+    responses = [error_response(502, "Bad Gateway"), error_response(503), ok_response({"data": {"viewer": {}}})]
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=responses) as mock_post:
+        result = client.graphql("query Viewer { viewer { login } }")
+
+    assert result == {"data": {"viewer": {}}}
+    assert mock_post.call_count == 3
+    assert len(sleeps) == 2
+
+
+def test_create_is_not_retried_after_server_error(error_response):
+    # GitHub may have filed the issue before answering 502; sending it again would file a duplicate.
+    client = GitHubClient("ghp_no_dup", rate_limiter=RateLimiter(sleep=lambda _: None))
+
+    with patch(
+        "gh_utils.github_client.requests.Session.post", return_value=error_response(502, "Bad Gateway")
+    ) as mock_post:
+        with pytest.raises(GitHubAPIError, match="502"):
+            client.create_issue("o", "r", "T", "B")
+
+    assert mock_post.call_count == 1
+
+
+def test_create_is_not_retried_after_lost_response():
+    client = GitHubClient("ghp_no_dup_reset", rate_limiter=RateLimiter(sleep=lambda _: None))
+
+    with patch(
+        "gh_utils.github_client.requests.Session.post", side_effect=requests.ConnectionError("reset")
+    ) as mock_post:
+        with pytest.raises(requests.ConnectionError):
+            client.create_issue("o", "r", "T", "B")
+
+    assert mock_post.call_count == 1
+
+
+def test_create_is_retried_when_it_never_reached_github(ok_response, error_response):
+    client = GitHubClient("ghp_create_retry", rate_limiter=RateLimiter(sleep=lambda _: None))
+    responses = [
+        requests.ConnectTimeout("connect timed out"),
+        error_response(429, "Too Many Requests", headers={"Retry-After": "0"}),
+        ok_response({"number": 1}),
+    ]
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=responses) as mock_post:
+        assert client.create_issue("o", "r", "T", "B")["number"] == 1
+
+    assert mock_post.call_count == 3
+
+
+def test_request_honours_retry_after(ok_response, error_response):
+    sleeps = []
+    client = GitHubClient("ghp_retry_after", rate_limiter=RateLimiter(sleep=sleeps.append))
+    responses = [
+        error_response(403, "Forbidden", "You have exceeded a secondary rate limit", {"Retry-After": "7"}),
+        ok_response({"number": 1}),
+    ]
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=responses):
+        client.create_issue("o", "r", "T", "B")
+
+    assert 7 <= sleeps[0] <= 8
+
+
+def test_request_gives_up_after_max_retries(error_response):
+    client = GitHubClient("ghp_give_up", rate_limiter=RateLimiter(max_retries=2, sleep=lambda _: None))
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=error_response(500)) as mock_post:
+        with pytest.raises(GitHubAPIError, match="500"):
+            client.graphql("query Viewer { viewer { login } }")
+
+    assert mock_post.call_count == 3
+
+
+def test_request_retries_connection_errors(ok_response):
+    client = GitHubClient("ghp_conn", rate_limiter=RateLimiter(sleep=lambda _: None))
+    responses = [requests.ConnectionError("reset"), ok_response({"data": {"viewer": {}}})]
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=responses):
+        assert client.graphql("query Viewer { viewer { login } }") == {"data": {"viewer": {}}}
+
+
+def test_request_records_rate_limit_headers(ok_response):
+    client = GitHubClient("ghp_state", rate_limiter=RateLimiter())
+    response = ok_response({"number": 1})
+    response.headers = {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": "4999",
+        "X-RateLimit-Reset": "1700000000",
+        "X-RateLimit-Resource": "core",
+    }
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=response):
+        client.create_issue("o", "r", "T", "B")
+
+    (state,) = client.rate_limit_state().values()
+    assert state.limit == 5000
+    assert state.remaining == 4999
+
+
+########## Test Token Pool
+
+
+def _sent_tokens(mock_post):
+    return [c.kwargs["headers"]["Authorization"].removeprefix("Bearer ") for c in mock_post.call_args_list]
+
+
+def test_token_pool_fails_over_when_rate_limited(ok_response, error_response):
+    sleeps = []
+    limiter = RateLimiter(sleep=sleeps.append)
+    pool = TokenPool(["ghp_a", "ghp_b"], rate_limiter=limiter)
+    client = GitHubClient("ghp_a", rate_limiter=limiter, token_pool=pool)
+    exhausted = error_response(
+        403, "Forbidden", "API rate limit exceeded",
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Limit": "5000", "X-RateLimit-Reset": "9999999999"},
+    )
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=[exhausted, ok_response({"number": 1})]) \
+            as mock_post:
+        assert client.create_issue("o", "r", "T", "B")["number"] == 1
+
+    assert _sent_tokens(mock_post) == ["ghp_a", "ghp_b"]
+    assert sleeps == [0.0]
+    assert pool.choose("core") == "ghp_b"
+
+
+def test_token_pool_drops_revoked_tokens(ok_response, error_response):
+    pool = TokenPool(["ghp_revoked", "ghp_good"], rate_limiter=RateLimiter())
+    client = GitHubClient("ghp_revoked", rate_limiter=pool.rate_limiter, token_pool=pool)
+    responses = [error_response(401, "Unauthorized"), ok_response({"number": 1}), ok_response({"number": 2})]
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=responses) as mock_post:
+        client.create_issue("o", "r", "T", "B")
+        client.create_issue("o", "r", "T", "B")
+
+    assert _sent_tokens(mock_post) == ["ghp_revoked", "ghp_good", "ghp_good"]
+    assert pool.active() == ["ghp_good"]
+
+
+def test_token_pool_gives_up_when_every_token_is_rejected(error_response):
+    pool = TokenPool(["ghp_x", "ghp_y"], rate_limiter=RateLimiter())
+    client = GitHubClient("ghp_x", rate_limiter=pool.rate_limiter, token_pool=pool)
+
+    with patch("gh_utils.github_client.requests.Session.post", return_value=error_response(401, "Unauthorized")):
+        with pytest.raises(GitHubAPIError, match="401"):
+            client.create_issue("o", "r", "T", "B")
+        with pytest.raises(GitHubAPIError, match="Every token"):
+            client.create_issue("o", "r", "T", "B")
@@ -0,0 +1,72 @@
+import pytest
+import requests
+
+from gh_utils.http_cache import HTTPCache, cache_key
+
+
+def _response(body=b"{}", headers=None, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    return HTTPCache(tmp_path / "http.sqlite", max_bytes=100)
+
+
+def test_cache_key_depends_on_token_url_and_query():
+    assert cache_key("t", "u", {"a": 1, "b": 2}) == cache_key("t", "u", {"b": 2, "a": 1})
+    assert cache_key("t", "u", {"a": 1}) != cache_key("t", "u", {"a": 2})
+    assert cache_key("t1", "u") != cache_key("t2", "u")
+
+
+def test_put_and_get(http_cache):
+    http_cache.put("k", _response(b"[1]", {"ETag": '"v1"', "Link": '<next>; rel="next"', "Server": "x"}))
+
+    cached = http_cache.get("k")
+
+    assert cached.body == b"[1]"
+    assert cached.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert cached.headers == {"ETag": '"v1"', "Link": '<next>; rel="next"'}
+
+
+def test_responses_without_validators_are_not_stored(http_cache):
+    http_cache.put("k", _response(b"[1]"))
+
+    assert http_cache.get("k") is None
+
+
+def test_to_response_rebuilds_body_with_fresh_headers(http_cache):
+    http_cache.put("k", _response(b'{"a": 1}', {"ETag": '"v1"', "Link": '<u2>; rel="next"'}))
+    not_modified = _response(b"", {"X-RateLimit-Remaining": "10"}, status_code=304)
+
+    response = http_cache.get("k").to_response(not_modified)
+
+    assert response.status_code == 200
+    assert response.json() == {"a": 1}
+    assert response.headers["X-RateLimit-Remaining"] == "10"
+    assert response.links["next"]["url"] == "u2"
+
+
+def test_lru_eviction(http_cache):
+    http_cache.put("a", _response(b"x" * 40, {"ETag": "a"}))
+    http_cache.put("b", _response(b"x" * 40, {"ETag": "b"}))
+    http_cache.get("a")
+    http_cache.put("c", _response(b"x" * 40, {"ETag": "c"}))
+
+    assert http_cache.get("a") is not None
+    assert http_cache.get("b") is None
+    assert http_cache.get("c") is not None
+    assert http_cache.total_bytes() == 80
+
+
+def test_persists_across_instances(http_cache):
+    http_cache.put("k", _response(b"[1]", {"Last-Modified": "Mon, 01 Jan 2026 00:00:00 GMT"}))
+    http_cache.close()
+
+    cached = HTTPCache(http_cache.path).get("k")
+
+    assert cached.conditional_headers() == {"If-Modified-Since": "Mon, 01 Jan 2026 00:00:00 GMT"}
@@ -0,0 +1,69 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from gh_utils.issue_index import IssueIndex
+
+
+def _issue(number, title, body="", updated_at="2026-01-01T00:00:00Z"):
+    return {
+        "number": number,
+        "title": title,
+        "body": body,
+        "node_id": f"I_{number}",
+        "html_url": f"url/{number}",
+        "updated_at": updated_at,
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    return IssueIndex(tmp_path / "index.json")
+
+
+def test_refresh_indexes_titles(index):
+    client = MagicMock()
+    client.list_issues.return_value = iter([_issue(1, "Bump deps", "Upgrade everything"), _issue(2, "Other")])
+
+    assert index.refresh(client, "o", "r") == 2
+
+    client.list_issues.assert_called_once_with("o", "r", since=None)
+    assert index.find("Bump deps")["node_id"] == "I_1"
+    assert index.find("Other")["number"] == 2
+    assert index.find("New") is None
+
+
+def test_refresh_is_incremental_and_persisted(index):
+    client = MagicMock()
+    client.list_issues.return_value = iter([_issue(1, "Old title", updated_at="2026-01-02T00:00:00Z")])
+    index.refresh(client, "o", "r")
+
+    reloaded = IssueIndex(index.path)
+    client.list_issues.return_value = iter([_issue(1, "New title", updated_at="2026-01-03T00:00:00Z")])
+    reloaded.refresh(client, "o", "r")
+
+    assert client.list_issues.call_args.kwargs["since"] == "2026-01-02T00:00:00Z"
+    assert reloaded.find("New title")["number"] == 1
+    assert reloaded.find("Old title") is None
+    assert reloaded.synced_at == "2026-01-03T00:00:00Z"
+
+
+def test_add_makes_new_issues_visible(index):
+    index.add({"number": 9, "node_id": "I_9", "html_url": "url/9"}, "Fresh")
+
+    assert index.find("Fresh")["number"] == 9
+    assert len(index) == 1
+
+
+def test_concurrent_saves_leave_no_temp_files(index):
+    for number in range(20):
+        index.add({"number": number, "node_id": f"I_{number}", "html_url": f"url/{number}"}, f"Issue {number}")
+    threads = [threading.Thread(target=index.save) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(IssueIndex(index.path)) == 20
+    assert [p.name for p in index.path.parent.iterdir()] == ["index.json"]
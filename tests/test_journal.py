@@ -0,0 +1,37 @@
+from gh_utils.journal import Journal, content_hash
+
+
+def test_content_hash_is_stable_and_separates_parts():
+    assert content_hash("a", "b") == content_hash("a", "b")
+    assert content_hash("ab", "") != content_hash("a", "b")
+
+
+def test_record_and_reload(tmp_path):
+    path = tmp_path / "run.jsonl"
+
+    with Journal(path) as journal:
+        journal.record("k1", "created", number=1, node_id="I_1")
+        journal.record("k1", "added", item_id="PVTI_1")
+        journal.record("k2", "created", number=2, node_id="I_2")
+
+    reloaded = Journal(path)
+
+    assert len(reloaded) == 2
+    assert reloaded.get("k1") == {"number": 1, "node_id": "I_1", "item_id": "PVTI_1", "steps": ["created", "added"]}
+    assert reloaded.done("k2", "created")
+    assert not reloaded.done("k2", "added")
+    assert reloaded.get("missing") == {"steps": []}
+
+
+def test_truncated_line_is_ignored(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with Journal(path) as journal:
+        journal.record("k1", "created", number=1)
+    with path.open("a") as f:
+        f.write('{"key": "k2", "step": "crea')
+
+    with Journal(path) as journal:
+        assert not journal.done("k2", "created")
+        journal.record("k3", "created", number=3)
+
+    assert Journal(path).done("k3", "created")
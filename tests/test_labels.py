@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from gh_utils.cache import NodeIdCache
+from gh_utils.exceptions import GitHubAPIError
+from gh_utils.labels import LabelSet
+
+
+@pytest.fixture
+def node_cache(tmp_path):
+    return NodeIdCache(tmp_path / "node-ids.json", ttl=60)
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.list_labels.return_value = iter([{"name": "bug", "node_id": "LA_bug"}])
+    client.create_label.side_effect = lambda owner, repo, name: {"name": name, "node_id": f"LA_{name}"}
+    return client
+
+
+########## Test Loading
+
+
+def test_load_lists_labels_once_and_caches(client, node_cache):
+    label_set = LabelSet.load(client, "o", "r", node_cache=node_cache)
+    again = LabelSet.load(client, "o", "r", node_cache=node_cache)
+
+    assert label_set.as_dict() == again.as_dict() == {"bug": "LA_bug"}
+    assert "BUG" in again
+    client.list_labels.assert_called_once_with("o", "r")
+    assert node_cache.get("labels", "o/r/bug") == "LA_bug"
+
+
+def test_load_refresh_ignores_cache(client, node_cache):
+    LabelSet.load(client, "o", "r", node_cache=node_cache)
+    client.list_labels.return_value = iter([{"name": "new", "node_id": "LA_new"}])
+
+    label_set = LabelSet.load(client, "o", "r", refresh=True, node_cache=node_cache)
+
+    assert label_set.as_dict() == {"new": "LA_new"}
+
+
+########## Test Ensure
+
+
+def test_ensure_creates_only_missing_labels(client, node_cache):
+    label_set = LabelSet("o", "r", {"bug": "LA_bug"}, node_cache)
+
+    created = label_set.ensure(client, ["Bug", "security", "docs", "security"], concurrency=2)
+
+    assert sorted(created) == ["docs", "security"]
+    assert client.create_label.call_count == 2
+    assert label_set.node_ids(["bug", "security"]) == ["LA_bug", "LA_security"]
+    assert node_cache.get("label-sets", "o/r") == {"bug": "LA_bug", "security": "LA_security", "docs": "LA_docs"}
+    assert label_set.ensure(client, ["security"]) == []
+    assert client.create_label.call_count == 2
+
+
+def test_ensure_tolerates_labels_created_concurrently(client):
+    client.create_label.side_effect = GitHubAPIError("exists", status_code=422)
+    client.get_label.return_value = {"name": "Docs", "node_id": "LA_docs"}
+    label_set = LabelSet("o", "r", {})
+
+    assert label_set.ensure(client, ["docs"]) == ["docs"]
+    assert label_set.as_dict() == {"Docs": "LA_docs"}
+
+
+def test_ensure_reports_every_failure(client):
+    client.create_label.side_effect = GitHubAPIError("forbidden", status_code=403)
+    label_set = LabelSet("o", "r", {})
+
+    with pytest.raises(GitHubAPIError, match="a: forbidden.*b: forbidden|b: forbidden.*a: forbidden"):
+        label_set.ensure(client, ["a", "b"])
@@ -0,0 +1,155 @@
+import datetime
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from gh_utils import metrics
+from gh_utils.github_client import ADD_TO_PROJECT_MUTATION, GitHubClient
+from gh_utils.metrics import Metrics, RequestRecord, TimedHTTPAdapter
+from gh_utils.ratelimit import RateLimiter
+
+
+def _response(status_code=200, body=b"{}", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    response.elapsed = datetime.timedelta(milliseconds=20)
+    response.request = requests.Request("POST", "https://api.github.com/graphql", data=b"x" * 7).prepare()
+    return response
+
+
+########## Test Endpoint names
+
+
+def test_rest_endpoint_hides_owner_repo_and_numbers():
+    assert (
+        metrics.rest_endpoint("POST", "https://api.github.com/repos/octo/cat/issues?per_page=100")
+        == "POST /repos/{owner}/{repo}/issues"
+    )
+    assert metrics.rest_endpoint("GET", "https://api.github.com/repos/o/r/issues/12") == "GET /repos/{owner}/{repo}/issues/{number}"
+
+
+def test_graphql_endpoint_uses_operation_name():
+    assert metrics.graphql_endpoint(ADD_TO_PROJECT_MUTATION) == "graphql AddToProject"
+    assert metrics.graphql_endpoint("{ viewer { login } }") == "graphql"
+
+
+########## Test Metrics
+
+
+def test_percentile():
+    samples = [float(n) for n in range(1, 101)]
+    assert metrics.percentile(samples, 50) == 50
+    assert metrics.percentile(samples, 99) == 99
+    assert metrics.percentile([3.0], 95) == 3
+
+
+def test_summary_per_endpoint():
+    collected = Metrics()
+    collected.record(RequestRecord("graphql AddToProject", 502, 0.5, headers_seconds=0.4, attempt=0, bytes_sent=10))
+    collected.record(RequestRecord("graphql AddToProject", 200, 0.1, attempt=1, bytes_received=40, connect_seconds=0.05))
+    collected.record(
+        RequestRecord("POST /repos/{owner}/{repo}/issues", 201, 0.2, rate_limit_resource="core", rate_limit_remaining=9)
+    )
+
+    summary = collected.summary()
+
+    add = summary["endpoints"]["graphql AddToProject"]
+    assert add["calls"] == 2
+    assert add["errors"] == 1
+    assert add["retries"] == 1
+    assert add["statuses"] == {"502": 1, "200": 1}
+    assert add["bytes_sent"] == 10 and add["bytes_received"] == 40
+    assert add["connections_opened"] == 1
+    assert add["latency"] == {"p50": 0.1, "p95": 0.5, "p99": 0.5}
+    assert add["time_to_headers"] == {"p50": 0.4, "p95": 0.4, "p99": 0.4}
+    assert summary["rate_limit_remaining"] == {"core": 9}
+    assert "graphql AddToProject" in collected.format_summary()
+    assert json.loads(collected.to_json())["requests"][0]["status"] == 502
+
+
+def test_prometheus_text():
+    collected = Metrics()
+    collected.record(RequestRecord('graphql "odd"', None, 0.25, rate_limit_resource="graphql", rate_limit_remaining=4))
+
+    text = collected.to_prometheus()
+
+    assert '# TYPE gh_utils_requests_total counter' in text
+    assert 'gh_utils_requests_total{endpoint="graphql \\"odd\\"",status="error"} 1' in text
+    assert 'gh_utils_request_duration_seconds{endpoint="graphql \\"odd\\"",quantile="0.5"} 0.250000' in text
+    assert 'gh_utils_request_duration_seconds_count{endpoint="graphql \\"odd\\""} 1' in text
+    assert 'gh_utils_rate_limit_remaining{resource="graphql"} 4' in text
+
+
+########## Test Client instrumentation
+
+
+def test_client_records_every_attempt():
+    collected = Metrics()
+    client = GitHubClient("t", rate_limiter=RateLimiter(backoff_base=0, sleep=lambda s: None), metrics=collected)
+    responses = [
+        _response(502),
+        _response(200, b'{"data": {}}', {"X-RateLimit-Resource": "graphql", "X-RateLimit-Remaining": "4999"}),
+    ]
+
+    with patch("gh_utils.github_client.requests.Session.post", side_effect=responses):
+        client.add_to_project("PVT_1", "I_1")
+
+    first, second = collected.records
+    assert (first.endpoint, first.status, first.attempt) == ("graphql AddToProject", 502, 0)
+    assert (second.status, second.attempt) == (200, 1)
+    assert second.headers_seconds == pytest.approx(0.02)
+    assert second.bytes_sent == 7
+    assert second.bytes_received == len(b'{"data": {}}')
+    assert collected.rate_limits == {"graphql": 4999}
+
+
+def test_client_uses_process_wide_metrics_when_enabled():
+    client = GitHubClient("t")
+    collected = metrics.enable()
+    try:
+        with patch("gh_utils.github_client.requests.Session.post", return_value=_response(201, b'{"number": 1}')):
+            client.create_issue("o", "r", "Title", "Body")
+    finally:
+        metrics.disable()
+
+    assert [r.endpoint for r in collected.records] == ["POST /repos/{owner}/{repo}/issues"]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_timed_adapter_reports_new_connections_only():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    try:
+        with requests.Session() as session:
+            session.mount("http://", TimedHTTPAdapter())
+            metrics.take_connect_seconds()
+            session.get(url)
+            first = metrics.take_connect_seconds()
+            session.get(url)
+            second = metrics.take_connect_seconds()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert first is not None and first >= 0
+    assert second is None
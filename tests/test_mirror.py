@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from gh_utils.mirror import ProjectMirror, field_value
+
+
+def _item(item_id, updated_at, number, status, state="OPEN", repository="acme/api"):
+    return {
+        "id": item_id,
+        "type": "ISSUE",
+        "updatedAt": updated_at,
+        "isArchived": False,
+        "content": {
+            "id": f"I_{number}",
+            "number": number,
+            "title": f"Issue {number}",
+            "state": state,
+            "url": f"url/{number}",
+            "repository": {"nameWithOwner": repository},
+        },
+        "fieldValues": {
+            "nodes": [
+                {"text": f"Issue {number}", "field": {"name": "Title"}},
+                {"name": status, "field": {"name": "Status"}},
+                {"number": 3.0, "field": {"name": "Points"}},
+                {},
+            ]
+        },
+    }
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    with ProjectMirror(tmp_path / "mirror.sqlite") as mirror:
+        yield mirror
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    items = {
+        "PVTI_1": _item("PVTI_1", "2026-01-01T00:00:00Z", 1, "Todo"),
+        "PVTI_2": _item("PVTI_2", "2026-01-02T00:00:00Z", 2, "Done", state="CLOSED", repository="acme/web"),
+    }
+    client.items = items
+    client.iter_project_item_stamps.side_effect = lambda project_id: iter(
+        [{"id": item["id"], "updatedAt": item["updatedAt"]} for item in items.values()]
+    )
+    client.get_project_items.side_effect = lambda ids: [items[item_id] for item_id in ids if item_id in items]
+    return client
+
+
+########## Test Sync
+
+
+def test_sync_fetches_only_changed_items(mirror, client):
+    assert mirror.synced_at("PVT_p") is None
+    first = mirror.sync(client, "PVT_p")
+    assert (first.fetched, first.removed, first.total) == (2, 0, 2)
+    assert mirror.synced_at("PVT_p")
+
+    client.items["PVTI_1"] = _item("PVTI_1", "2026-02-01T00:00:00Z", 1, "In Progress")
+    del client.items["PVTI_2"]
+    client.items["PVTI_3"] = _item("PVTI_3", "2026-02-02T00:00:00Z", 3, "Todo")
+    second = mirror.sync(client, "PVT_p")
+
+    assert (second.fetched, second.removed, second.total) == (2, 1, 2)
+    client.get_project_items.assert_called_with(["PVTI_1", "PVTI_3"])
+    assert [item["item_id"] for item in mirror.query("PVT_p")] == ["PVTI_1", "PVTI_3"]
+    assert mirror.query("PVT_p", {"status": "in progress"})[0]["number"] == 1
+
+
+def test_sync_refetches_recorded_adds(mirror, client):
+    mirror.sync(client, "PVT_p")
+    mirror.record_added("PVT_p", {"I_9": "PVTI_9"})
+    assert mirror.item_ids("PVT_p", ["I_1", "I_9", "I_x"]) == {"I_1": "PVTI_1", "I_9": "PVTI_9"}
+
+    client.items["PVTI_9"] = _item("PVTI_9", "2026-03-01T00:00:00Z", 9, "Todo")
+    stats = mirror.sync(client, "PVT_p")
+
+    assert stats.fetched == 1
+    assert mirror.query("PVT_p", {"Status": "Todo"})[-1]["title"] == "Issue 9"
+
+
+########## Test Query
+
+
+def test_query_filters(mirror, client):
+    mirror.sync(client, "PVT_p")
+
+    (item,) = mirror.query("PVT_p", {"Status": "todo"})
+    assert item["fields"] == {"Title": "Issue 1", "Status": "Todo", "Points": "3"}
+    assert item["repository"] == "acme/api"
+    assert mirror.count("PVT_p") == 2
+    assert mirror.count("PVT_p", repository="ACME/web") == 1
+    assert mirror.count("PVT_p", state="open") == 1
+    assert mirror.count("PVT_p", {"Status": "Done", "Points": "3"}, state="closed") == 1
+    assert mirror.count("PVT_other") == 0
+
+
+def test_field_value():
+    assert field_value({"date": "2026-05-01", "field": {"name": "Due"}}) == ("Due", "2026-05-01")
+    assert field_value({"number": 2.5, "field": {"name": "Points"}}) == ("Points", "2.5")
+    assert field_value({"field": {}}) is None
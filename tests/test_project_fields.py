@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from gh_utils.cache import NodeIdCache
+from gh_utils.exceptions import ConfigError
+from gh_utils.project_fields import ProjectField, ProjectFields, parse_assignments
+
+FIELD_NODES = [
+    {"id": "F_title", "name": "Title", "dataType": "TITLE"},
+    {
+        "id": "F_status",
+        "name": "Status",
+        "dataType": "SINGLE_SELECT",
+        "options": [{"id": "O_todo", "name": "Todo"}, {"id": "O_done", "name": "Done"}],
+    },
+    {"id": "F_points", "name": "Points", "dataType": "NUMBER"},
+    {"id": "F_due", "name": "Due", "dataType": "DATE"},
+    {"id": "F_notes", "name": "Notes", "dataType": "TEXT"},
+    {
+        "id": "F_sprint",
+        "name": "Sprint",
+        "dataType": "ITERATION",
+        "configuration": {
+            "iterations": [{"id": "IT_2", "title": "Sprint 2"}],
+            "completedIterations": [{"id": "IT_1", "title": "Sprint 1"}],
+        },
+    },
+]
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.get_project_fields.return_value = FIELD_NODES
+    return client
+
+
+@pytest.fixture
+def node_cache(tmp_path):
+    return NodeIdCache(tmp_path / "node-ids.json", ttl=60)
+
+
+########## Test Parsing
+
+
+def test_parse_assignments():
+    assert parse_assignments(["Status=In Progress", " Points = 3 ", "Notes=a=b"]) == {
+        "Status": "In Progress",
+        "Points": "3",
+        "Notes": "a=b",
+    }
+
+
+def test_parse_assignments_rejects_missing_value():
+    with pytest.raises(ConfigError, match="name=value"):
+        parse_assignments(["Status"])
+
+
+########## Test Field Values
+
+
+def test_field_values(client, node_cache):
+    fields = ProjectFields.load(client, "PVT_1", node_cache=node_cache)
+
+    assert fields.resolve({"status": "todo", "Points": "3", "Due": "2026-05-01", "Notes": "hi", "Sprint": "Sprint 1"}) == [
+        ("F_status", {"singleSelectOptionId": "O_todo"}),
+        ("F_points", {"number": 3.0}),
+        ("F_due", {"date": "2026-05-01"}),
+        ("F_notes", {"text": "hi"}),
+        ("F_sprint", {"iterationId": "IT_1"}),
+    ]
+
+
+@pytest.mark.parametrize(
+    "assignment, message",
+    [
+        ({"Status": "Blocked"}, "no option 'Blocked'; choose from: Todo, Done"),
+        ({"Points": "many"}, "needs a number"),
+        ({"Due": "tomorrow"}, "YYYY-MM-DD"),
+        ({"Title": "x"}, "cannot be set"),
+        ({"Owner": "me"}, "no field 'Owner'"),
+    ],
+)
+def test_field_value_errors(client, node_cache, assignment, message):
+    fields = ProjectFields.load(client, "PVT_1", node_cache=node_cache)
+
+    with pytest.raises(ConfigError, match=message):
+        fields.resolve(assignment)
+
+
+def test_fields_are_cached_per_project(client, node_cache):
+    ProjectFields.load(client, "PVT_1", node_cache=node_cache)
+    cached = ProjectFields.load(client, "PVT_1", node_cache=node_cache)
+
+    assert cached.resolve({"Status": "Done"}) == [("F_status", {"singleSelectOptionId": "O_done"})]
+    client.get_project_fields.assert_called_once_with("PVT_1")
+
+    ProjectFields.load(client, "PVT_1", refresh=True, node_cache=node_cache)
+    assert client.get_project_fields.call_count == 2
+
+
+def test_project_field_from_node_without_options():
+    assert ProjectField.from_node(FIELD_NODES[0]) == ProjectField("F_title", "Title", "TITLE")
@@ -0,0 +1,172 @@
+import pytest
+
+from gh_utils.exceptions import GitHubAPIError
+from gh_utils.ratelimit import RateLimiter, TokenPool, resource_for_url, token_id
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(clock):
+    return RateLimiter(clock=clock, sleep=lambda _: None)
+
+
+def _headers(remaining, limit=5000, reset=1100, resource="core"):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+        "X-RateLimit-Resource": resource,
+    }
+
+
+def test_resource_for_url():
+    assert resource_for_url("https://api.github.com/graphql") == "graphql"
+    assert resource_for_url("https://api.github.com/search/issues") == "search"
+    assert resource_for_url("https://api.github.com/repos/o/r/issues") == "core"
+
+
+########## Test Pacing
+
+
+def test_no_delay_with_plenty_of_budget(limiter):
+    limiter.record("t", "core", _headers(remaining=4000))
+
+    assert limiter.delay_before("t", "core") == 0
+
+
+def test_waits_for_reset_when_budget_is_spent(limiter):
+    limiter.record("t", "core", _headers(remaining=0, reset=1100))
+
+    assert limiter.delay_before("t", "core") == 100
+
+
+def test_spreads_requests_when_budget_is_low(limiter):
+    limiter.record("t", "core", _headers(remaining=10, limit=5000, reset=1100))
+
+    delays = [limiter.delay_before("t", "core") for _ in range(3)]
+
+    assert delays[0] == 0
+    assert delays[1] == pytest.approx(10)
+    assert delays[2] > delays[1]
+
+
+def test_budgets_are_tracked_per_token_and_resource(limiter):
+    limiter.record("t1", "core", _headers(remaining=0))
+
+    assert limiter.delay_before("t2", "core") == 0
+    assert limiter.delay_before("t1", "graphql") == 0
+
+
+def test_expired_window_is_ignored(limiter, clock):
+    limiter.record("t", "core", _headers(remaining=0, reset=1100))
+    clock.now = 1200
+
+    assert limiter.delay_before("t", "core") == 0
+
+
+########## Test Retry Decisions
+
+
+def test_retry_after_blocks_the_whole_token(limiter):
+    delay = limiter.retry_delay("t", 0, 429, {"Retry-After": "30"})
+
+    assert 30 <= delay <= 31
+    assert limiter.delay_before("t", "graphql") >= 30
+
+
+def test_primary_limit_403_waits_until_reset(limiter):
+    delay = limiter.retry_delay("t", 0, 403, _headers(remaining=0, reset=1050))
+
+    assert 50 <= delay <= 51
+
+
+def test_secondary_limit_without_retry_after(limiter):
+    assert limiter.retry_delay("t", 0, 403, {}, "You have exceeded a secondary rate limit") >= 60
+
+
+def test_permission_403_is_not_retried(limiter):
+    assert limiter.retry_delay("t", 0, 403, {}, "Resource not accessible by integration") is None
+
+
+def test_server_errors_back_off_exponentially(limiter):
+    assert 0.5 <= limiter.retry_delay("t", 0, 502) <= 1
+    assert 2 <= limiter.retry_delay("t", 2, 502) <= 4
+    assert limiter.retry_delay("t", 0, None) is not None
+    assert limiter.retry_delay("t", 0, 422) is None
+
+
+def test_gives_up_after_max_retries(clock):
+    limiter = RateLimiter(max_retries=1, clock=clock)
+
+    assert limiter.retry_delay("t", 1, 502) is None
+
+
+########## Test State
+
+
+def test_state_hides_tokens(limiter):
+    limiter.record("ghp_secret", "core", _headers(remaining=42))
+
+    state = limiter.state()
+
+    assert list(state) == [f"{token_id('ghp_secret')}/core"]
+    assert state[f"{token_id('ghp_secret')}/core"].remaining == 42
+    assert "ghp_secret" not in repr(state)
+
+
+########## Test Token Pool
+
+
+def test_headroom_does_not_reserve(limiter):
+    limiter.record("t", "core", _headers(remaining=0, reset=1100))
+
+    assert limiter.headroom("t", "core") == (100, 0)
+    assert limiter.headroom("t", "core") == (100, 0)
+    assert limiter.headroom("fresh", "core") == (0, float("inf"))
+
+
+def test_pool_prefers_the_token_with_most_budget(limiter):
+    pool = TokenPool(["a", "b", "a", "c"], rate_limiter=limiter)
+    limiter.record("a", "core", _headers(remaining=100))
+    limiter.record("b", "core", _headers(remaining=4000))
+    limiter.record("c", "core", _headers(remaining=0))
+
+    assert pool.tokens == ["a", "b", "c"]
+    assert pool.choose("core") == "b"
+    assert pool.delay("core") == 0
+
+    limiter.record("b", "core", _headers(remaining=0, reset=1050))
+    assert pool.choose("core") == "a"
+    limiter.record("a", "core", _headers(remaining=0, reset=1200))
+    assert pool.choose("core") == "b"
+    assert pool.delay("core") == 50
+
+
+def test_pool_skips_blocked_tokens(limiter):
+    pool = TokenPool(["a", "b"], rate_limiter=limiter)
+    limiter.retry_delay("a", 0, 403, {"Retry-After": "30"})
+
+    assert pool.choose("core") == "b"
+
+
+def test_pool_revoke(limiter):
+    pool = TokenPool(["a", "b"], rate_limiter=limiter)
+
+    assert pool.revoke("a")
+    assert pool.active() == ["b"]
+    assert pool.state() == {token_id("a"): "revoked", token_id("b"): "active"}
+    assert not pool.revoke("b")
+    with pytest.raises(GitHubAPIError, match="Every token"):
+        pool.choose("core")
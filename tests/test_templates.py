@@ -0,0 +1,86 @@
+import pytest
+
+from gh_utils.exceptions import ConfigError
+from gh_utils.templates import IssueTemplate, iter_rows, iter_specs
+
+
+@pytest.fixture
+def template_file(tmp_path):
+    path = tmp_path / "cve.md"
+    path.write_text("# Patch ${cve} in $service\n\nSeverity: $severity. Costs $$0.\n")
+    return path
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text(
+        "service,cve,severity,labels\n"
+        "api,CVE-2024-1,high,\"security, urgent\"\n"
+        "web,CVE-2024-2,low,\n"
+    )
+    return path
+
+
+########## Test IssueTemplate
+
+
+def test_render_row(template_file):
+    template = IssueTemplate.from_file(template_file, ["sev:$severity", "security"])
+
+    spec = template.render({"service": "api", "cve": "CVE-1", "severity": "high", "labels": "security, urgent"}, "r:1")
+
+    assert spec.title == "Patch CVE-1 in api"
+    assert spec.body == "Severity: high. Costs $0.\n"
+    assert spec.labels == ["sev:high", "security", "urgent"]
+    assert spec.source == "r:1"
+
+
+def test_template_columns(template_file):
+    template = IssueTemplate.from_file(template_file, ["team:$team"])
+
+    assert template.columns == {"cve", "service", "severity", "team"}
+    with pytest.raises(ConfigError, match="team"):
+        template.check_columns(["cve", "service", "severity"])
+
+
+def test_invalid_placeholder():
+    with pytest.raises(ConfigError, match="Invalid placeholder"):
+        IssueTemplate("Costs $5", "")
+
+
+########## Test Rows
+
+
+def test_iter_rows_csv(data_file):
+    rows = list(iter_rows(data_file))
+
+    assert rows[0] == {"service": "api", "cve": "CVE-2024-1", "severity": "high", "labels": "security, urgent"}
+    assert rows[1]["labels"] == ""
+
+
+def test_iter_specs_is_lazy(template_file, data_file):
+    specs = iter_specs(IssueTemplate.from_file(template_file), data_file)
+
+    first = next(specs)
+    assert first.title == "Patch CVE-2024-1 in api"
+    assert first.source == "rows.csv:1"
+    assert [spec.labels for spec in specs] == [[]]
+
+
+def test_iter_specs_checks_columns_of_first_row(tmp_path, template_file):
+    data = tmp_path / "rows.csv"
+    data.write_text("service,cve\napi,CVE-1\n")
+
+    with pytest.raises(ConfigError, match="severity"):
+        next(iter_specs(IssueTemplate.from_file(template_file), data))
+
+
+def test_iter_rows_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    path = tmp_path / "rows.parquet"
+    pq.write_table(pa.table({"service": ["api", "web"], "port": [80, 443]}), path)
+
+    assert list(iter_rows(path)) == [{"service": "api", "port": 80}, {"service": "web", "port": 443}]
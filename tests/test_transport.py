@@ -0,0 +1,199 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from gh_utils.cli import _new_client
+from gh_utils.exceptions import ConfigError, GhUtilsError
+from gh_utils.github_client import GitHubClient, get_client
+from gh_utils.ratelimit import RateLimiter
+from gh_utils.transport import Cassette, RecordingAdapter, ReplayAdapter, request_key, transport_from_env
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    issues = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if body["title"] == "Invalid":
+            self.send_response(422, "Validation Failed")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        type(self).issues += 1
+        payload = json.dumps({"number": type(self).issues, "title": body["title"], "node_id": "I_1"}).encode()
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("X-RateLimit-Remaining", "4999")
+        self.send_header("X-RateLimit-Resource", "core")
+        self.send_header("X-Request-Noise", "dropped")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.issues = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _client(api_url: str, transport) -> GitHubClient:
+    return GitHubClient("ghp_secret", api_url=api_url, rate_limiter=RateLimiter(), transport=transport)
+
+
+def _record(server: str, path) -> list[dict]:
+    cassette = Cassette(path)
+    with _client(server, RecordingAdapter(cassette)) as client:
+        issues = [client.create_issue("o", "r", title, "Body") for title in ("First", "Second", "First")]
+    cassette.close()
+    return issues
+
+
+########## Test Record and Replay
+
+
+@pytest.mark.parametrize("name", ["run.jsonl", "run.jsonl.gz"])
+def test_replay_serves_recorded_responses(server, tmp_path, name):
+    recorded = _record(server, tmp_path / name)
+
+    with _client(server, ReplayAdapter(Cassette(tmp_path / name))) as client:
+        replayed = [client.create_issue("o", "r", title, "Body") for title in ("First", "Second", "First")]
+        # Identical requests get their responses in order, then the last one again.
+        again = client.create_issue("o", "r", "First", "Body")
+
+    assert _Handler.issues == 3
+    assert replayed == recorded
+    assert [issue["number"] for issue in recorded] == [1, 2, 3]
+    assert again["number"] == 3
+    assert client.rate_limit_state()
+
+
+def test_cassette_is_compact(server, tmp_path):
+    path = tmp_path / "run.jsonl"
+    _record(server, path)
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 3
+    assert set(lines[0]["headers"]) == {"Content-Type", "X-RateLimit-Remaining", "X-RateLimit-Resource"}
+    assert lines[0]["status"] == 201 and lines[0]["seconds"] >= 0
+    assert "ghp_secret" not in path.read_text()
+
+
+def test_replay_latency_scale(server, tmp_path):
+    path = tmp_path / "run.jsonl"
+    _record(server, path)
+    seconds = json.loads(path.read_text().splitlines()[0])["seconds"]
+
+    with patch("gh_utils.transport.time.sleep") as mock_sleep, \
+            _client(server, ReplayAdapter(Cassette(path), latency_scale=2.0)) as client:
+        client.create_issue("o", "r", "First", "Body")
+
+    mock_sleep.assert_called_once_with(pytest.approx(seconds * 2.0))
+
+
+def test_replay_unknown_request(server, tmp_path):
+    path = tmp_path / "run.jsonl"
+    _record(server, path)
+
+    with _client(server, ReplayAdapter(Cassette(path))) as client, \
+            pytest.raises(GhUtilsError, match="No recorded response for POST"):
+        client.create_issue("o", "r", "Unrecorded", "Body")
+
+
+def test_replay_missing_cassette(tmp_path):
+    with _client("http://127.0.0.1:1", ReplayAdapter(Cassette(tmp_path / "none.jsonl"))) as client, \
+            pytest.raises(ConfigError, match="does not exist"):
+        client.create_issue("o", "r", "First", "Body")
+
+
+def test_replayed_errors_read_like_live_ones(server, tmp_path):
+    path = tmp_path / "run.jsonl"
+    cassette = Cassette(path)
+    with _client(server, RecordingAdapter(cassette)) as client, pytest.raises(GhUtilsError) as live:
+        client.create_issue("o", "r", "Invalid", "Body")
+    cassette.close()
+
+    with _client(server, ReplayAdapter(Cassette(path))) as client, pytest.raises(GhUtilsError) as replayed:
+        client.create_issue("o", "r", "Invalid", "Body")
+
+    assert "422 Validation Failed" in str(live.value)
+    assert str(replayed.value) == str(live.value)
+
+
+def test_replay_without_recorded_reason_uses_standard_phrase(tmp_path):
+    url = "http://127.0.0.1:1/repos/o/r/issues"
+    body = json.dumps({"title": "Invalid", "body": "Body"})
+    interaction = {
+        "method": "POST", "url": url, "key": request_key("POST", url, body),
+        "status": 422, "headers": {}, "seconds": 0.01, "body": "",
+    }
+    path = tmp_path / "old.jsonl"
+    path.write_text(json.dumps(interaction) + "\n")
+
+    with _client("http://127.0.0.1:1", ReplayAdapter(Cassette(path))) as client, \
+            pytest.raises(GhUtilsError, match="422 Unprocessable Entity"):
+        client.create_issue("o", "r", "Invalid", "Body")
+
+
+def test_replayed_304_without_cache_entry_is_an_error(tmp_path):
+    url = "http://127.0.0.1:1/repos/o/r/labels/bug"
+    interaction = {
+        "method": "GET", "url": url, "key": request_key("GET", url, None),
+        "status": 304, "headers": {}, "seconds": 0.01, "body": "",
+    }
+    path = tmp_path / "warm.jsonl"
+    path.write_text(json.dumps(interaction) + "\n")
+
+    with _client("http://127.0.0.1:1", ReplayAdapter(Cassette(path))) as client, \
+            pytest.raises(GhUtilsError, match="304 Not Modified"):
+        client.get_label("o", "r", "bug")
+
+
+########## Test Transport From Env
+
+
+def test_transport_from_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("GH_UTILS_RECORD", raising=False)
+    monkeypatch.delenv("GH_UTILS_REPLAY", raising=False)
+    assert transport_from_env(4) is None
+
+    monkeypatch.setenv("GH_UTILS_RECORD", str(tmp_path / "run.jsonl"))
+    recorder = transport_from_env(4)
+    assert isinstance(recorder, RecordingAdapter)
+    assert recorder.cassette is transport_from_env(4).cassette
+
+    monkeypatch.setenv("GH_UTILS_REPLAY", str(tmp_path / "run.jsonl"))
+    with pytest.raises(ConfigError, match="not both"):
+        transport_from_env(4)
+
+    monkeypatch.delenv("GH_UTILS_RECORD")
+    monkeypatch.setenv("GH_UTILS_REPLAY_LATENCY", "0.5")
+    replayer = transport_from_env(4)
+    assert isinstance(replayer, ReplayAdapter)
+    assert replayer.latency_scale == 0.5
+
+
+def test_shared_client_skips_http_cache_while_replaying(monkeypatch, tmp_path):
+    monkeypatch.delenv("GH_UTILS_RECORD", raising=False)
+    monkeypatch.setenv("GITHUB_TOKEN", "ghp_replay")
+    monkeypatch.setenv("GH_UTILS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("GH_UTILS_REPLAY", str(tmp_path / "run.jsonl"))
+
+    client = get_client("ghp_replay")
+
+    assert client.http_cache is None
+    assert isinstance(client.session.get_adapter("https://api.github.com"), ReplayAdapter)
+    with _new_client("ghp_replay", pool_size=2) as bulk_client:
+        assert bulk_client.http_cache is None
@@ -0,0 +1,135 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from gh_utils.watch import InotifyWatcher, PollingWatcher, _libc, create_watcher, is_report, list_reports, run
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeWatcher:
+    """Replays scripted changes: ``events`` maps a clock time to the paths changed then."""
+
+    def __init__(self, clock: FakeClock, events: dict[float, list[Path]], stop: threading.Event, until: float):
+        self.clock = clock
+        self.events = dict(events)
+        self.stop = stop
+        self.until = until
+
+    def changes(self, timeout: float) -> set[Path]:
+        due = [at for at in self.events if at <= self.clock.now + timeout]
+        if due:
+            at = min(due)
+            self.clock.now = max(self.clock.now, at)
+            return set(self.events.pop(at))
+        self.clock.now += timeout
+        if self.clock.now >= self.until:
+            self.stop.set()
+        return set()
+
+
+def _run(tmp_path, events, initial=(), settle=1.0, window=2.0, until=30.0):
+    clock = FakeClock()
+    stop = threading.Event()
+    batches = []
+    watcher = FakeWatcher(clock, events, stop, until)
+    run(watcher, lambda paths: batches.append((clock.now, sorted(p.name for p in paths))),
+        settle=settle, window=window, initial=initial, stop=stop, clock=clock)
+    return batches
+
+
+@pytest.fixture
+def reports(tmp_path):
+    paths = {}
+    for name in ("a.md", "b.md", "c.md"):
+        paths[name] = tmp_path / name
+        paths[name].write_text(f"# {name}\n")
+    return paths
+
+
+########## Test Run
+
+
+def test_run_waits_for_writes_to_settle(tmp_path, reports):
+    a = reports["a.md"]
+    batches = _run(tmp_path, {0.0: [a], 0.5: [a], 1.2: [a]})
+
+    # Last write at 1.2, settled at 2.2, window closes at 4.2.
+    assert batches == [(pytest.approx(4.2), ["a.md"])]
+
+
+def test_run_batches_files_settling_within_window(tmp_path, reports):
+    batches = _run(tmp_path, {0.0: [reports["a.md"]], 1.5: [reports["b.md"]], 5.0: [reports["c.md"]]})
+
+    assert [names for _, names in batches] == [["a.md", "b.md"], ["c.md"]]
+
+
+def test_run_drops_file_rewritten_during_window(tmp_path, reports):
+    a, b = reports["a.md"], reports["b.md"]
+    batches = _run(tmp_path, {0.0: [a, b], 2.5: [a]})
+
+    # Both settle at 1.0; a changes again before the window closes at 3.0,
+    # so b is filed alone and a waits to settle once more.
+    assert [names for _, names in batches] == [["b.md"], ["a.md"]]
+
+
+def test_run_files_initial_reports_and_skips_deleted(tmp_path, reports):
+    reports["c.md"].unlink()
+    batches = _run(tmp_path, {}, initial=list(reports.values()))
+
+    assert [names for _, names in batches] == [["a.md", "b.md"]]
+
+
+########## Test Watchers
+
+
+def test_is_report():
+    assert is_report("incident.md")
+    assert not is_report(".incident.md")
+    assert not is_report("incident.md.swp")
+
+
+def test_list_reports(tmp_path, reports):
+    (tmp_path / "notes.txt").write_text("x")
+    (tmp_path / "sub.md").mkdir()
+
+    assert [path.name for path in list_reports(tmp_path)] == ["a.md", "b.md", "c.md"]
+
+
+def test_polling_watcher(tmp_path, reports):
+    watcher = PollingWatcher(tmp_path, interval=0.01)
+    assert watcher.changes(0.01) == set()
+
+    reports["a.md"].write_text("# a.md\nmore")
+    (tmp_path / "d.md").write_text("# d")
+
+    assert watcher.changes(0.01) == {reports["a.md"], tmp_path / "d.md"}
+    assert watcher.changes(0.01) == set()
+
+
+def test_create_watcher_falls_back_to_polling(tmp_path, monkeypatch):
+    monkeypatch.setattr("gh_utils.watch._libc", lambda: None)
+
+    assert isinstance(create_watcher(tmp_path), PollingWatcher)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux") or _libc() is None, reason="needs inotify")
+def test_inotify_watcher(tmp_path):
+    watcher = InotifyWatcher(tmp_path)
+    try:
+        assert watcher.changes(0.01) == set()
+        (tmp_path / "a.md").write_text("# a")
+        (tmp_path / ".a.md.swp").write_text("x")
+
+        assert watcher.changes(1.0) == {tmp_path / "a.md"}
+        assert isinstance(create_watcher(tmp_path), InotifyWatcher)
+    finally:
+        watcher.close()